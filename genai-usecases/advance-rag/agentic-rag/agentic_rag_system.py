@@ -9,8 +9,15 @@ This module implements a state-of-the-art agentic RAG system that combines:
 """
 
 import os
+import re
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import operator
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
@@ -18,6 +25,8 @@ import uuid
 from datetime import datetime
 import asyncio
 
+import numpy as np
+
 # Core LangChain imports
 from langchain_core.documents import Document
 from langchain_core.prompts import ChatPromptTemplate
@@ -82,9 +91,10 @@ class AgentState:
     retrieved_documents: List[Document] = field(default_factory=list)
     web_results: List[Dict[str, Any]] = field(default_factory=list)
     final_answer: str = ""
-    execution_log: List[str] = field(default_factory=list)
+    # Appended to by the parallel retriever/researcher branches, merged by reducer
+    execution_log: Annotated[List[str], operator.add] = field(default_factory=list)
     confidence_score: float = 0.0
-    sources: List[Dict[str, Any]] = field(default_factory=list)
+    sources: Annotated[List[Dict[str, Any]], operator.add] = field(default_factory=list)
 
 class QueryAnalysis(BaseModel):
     """Structured query analysis output"""
@@ -145,6 +155,48 @@ class WebSearchTool(BaseTool):
             logger.error(f"Web search failed: {e}")
             return [{"error": f"Web search failed: {str(e)}"}]
 
+class LocalSearchTool(BaseTool):
+    """Offline stand-in for WebSearchTool that ranks an in-memory corpus by term overlap"""
+    name: str = "web_search"
+    description: str = "Search a local corpus of web-like results (offline stand-in for web search)"
+    _corpus: List[Dict[str, Any]] = PrivateAttr(default_factory=list)
+    
+    def __init__(self, corpus: Optional[List[Dict[str, Any]]] = None, **kwargs):
+        super().__init__(**kwargs)
+        self._corpus = []
+        self.add_results(corpus or [])
+    
+    @staticmethod
+    def _terms(text: str) -> set:
+        return set(re.findall(r"\w+", text.lower()))
+    
+    def add_results(self, results: List[Dict[str, Any]]):
+        """Add results with title/url/content keys to the searchable corpus"""
+        for result in results:
+            terms = self._terms(f"{result.get('title', '')} {result.get('content', '')}")
+            self._corpus.append((terms, result))
+    
+    def _run(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+        """Return corpus entries ranked by the fraction of query terms they contain"""
+        query_terms = self._terms(query)
+        if not query_terms:
+            return []
+        
+        scored = []
+        for terms, result in self._corpus:
+            overlap = len(query_terms & terms)
+            if overlap:
+                scored.append((overlap / len(query_terms), result))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        
+        return [{
+            "title": result.get("title", ""),
+            "url": result.get("url", ""),
+            "content": result.get("content", ""),
+            "score": score,
+            "source": "local_search"
+        } for score, result in scored[:max_results]]
+
 @dataclass
 class AgenticRAGConfig:
     """Configuration for the Agentic RAG system"""
@@ -158,6 +210,7 @@ class AgenticRAGConfig:
     chunk_size: int = 1000
     chunk_overlap: int = 200
     k_retrieval: int = 8
+    max_parallel_queries: int = 4
     
     # Agent configurations
     max_iterations: int = 10
@@ -170,6 +223,117 @@ class AgenticRAGConfig:
     # Web search configuration
     enable_web_search: bool = True
     max_web_results: int = 5
+    max_web_queries: int = 4
+    
+    # Semantic answer cache configuration
+    enable_query_cache: bool = True
+    cache_similarity_threshold: float = 0.92
+    cache_max_entries: int = 256
+    cache_ttl_seconds: int = 3600
+    cache_min_confidence: float = 0.25  # Error and weakly supported answers are never cached
+
+class SemanticQueryCache:
+    """
+    Nearest-neighbour cache of answered questions keyed by query embedding.
+    
+    A lookup first tries an exact match on the normalized question text, then
+    compares the question embedding against every cached question and returns
+    the best answer whose cosine similarity clears the threshold. Entries expire
+    after ``ttl_seconds`` and the least recently used entry is evicted once
+    ``max_entries`` is reached.
+    """
+    
+    def __init__(self, similarity_threshold: float = 0.92, max_entries: int = 256, ttl_seconds: int = 3600):
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    @staticmethod
+    def normalize(question: str) -> str:
+        return " ".join(re.findall(r"\w+", question.lower()))
+    
+    def _purge_expired(self, now: float):
+        expired = [key for key, entry in self._entries.items() if now - entry["created_at"] > self.ttl_seconds]
+        for key in expired:
+            del self._entries[key]
+        self.evictions += len(expired)
+    
+    def get_exact(self, question: str) -> Optional[Dict[str, Any]]:
+        """Return a cached entry for the same normalized question, without embedding it"""
+        key = self.normalize(question)
+        with self._lock:
+            self._purge_expired(time.time())
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry, similarity=1.0)
+    
+    def get_similar(self, vector: List[float]) -> Optional[Dict[str, Any]]:
+        """Return the nearest cached entry above the similarity threshold, counting a miss otherwise"""
+        query = np.asarray(vector, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1.0)
+        with self._lock:
+            self._purge_expired(time.time())
+            if not self._entries:
+                self.misses += 1
+                return None
+            
+            keys = list(self._entries)
+            matrix = np.stack([self._entries[key]["vector"] for key in keys])
+            similarities = matrix @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.similarity_threshold:
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(keys[best])
+            self.hits += 1
+            return dict(self._entries[keys[best]], similarity=float(similarities[best]))
+    
+    def put(self, question: str, vector: List[float], response: Dict[str, Any]):
+        vector = np.asarray(vector, dtype=np.float32)
+        vector = vector / (np.linalg.norm(vector) or 1.0)
+        key = self.normalize(question)
+        with self._lock:
+            self._entries[key] = {
+                "question": question,
+                "vector": vector,
+                "response": response,
+                "created_at": time.time()
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def invalidate(self):
+        """Drop every cached answer, e.g. after the document corpus changed"""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "similarity_threshold": self.similarity_threshold,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds
+            }
 
 class AgenticRAGSystem:
     """
@@ -189,7 +353,8 @@ class AgenticRAGSystem:
             asyncio.set_event_loop(loop)
         return loop
     
-    def __init__(self, config: AgenticRAGConfig = None, google_api_key: str = None, tavily_api_key: str = None):
+    def __init__(self, config: AgenticRAGConfig = None, google_api_key: str = None, tavily_api_key: str = None,
+                 search_tool: Optional[BaseTool] = None):
         """
         Initialize the Agentic RAG System
         
@@ -197,6 +362,7 @@ class AgenticRAGSystem:
             config: System configuration
             google_api_key: Google API key for Gemini
             tavily_api_key: Tavily API key for web search
+            search_tool: Optional search tool used instead of Tavily (e.g. LocalSearchTool for offline runs)
         """
         # Ensure event loop exists
         self._ensure_event_loop()
@@ -210,6 +376,13 @@ class AgenticRAGSystem:
         if not self.google_api_key:
             raise ValueError("Google API key is required")
         
+        self.search_tool = search_tool
+        self.query_cache = SemanticQueryCache(
+            similarity_threshold=self.config.cache_similarity_threshold,
+            max_entries=self.config.cache_max_entries,
+            ttl_seconds=self.config.cache_ttl_seconds
+        ) if self.config.enable_query_cache else None
+        
         # Initialize core components
         self._initialize_models()
         self._initialize_tools()
@@ -243,9 +416,13 @@ class AgenticRAGSystem:
     def _initialize_tools(self):
         """Initialize tools for the agents"""
         self.tools = []
+        self.web_search_tool = None
         
         # Web search tool
-        if self.config.enable_web_search and self.tavily_api_key:
+        if self.config.enable_web_search and self.search_tool is not None:
+            self.web_search_tool = self.search_tool
+            self.tools.append(self.web_search_tool)
+        elif self.config.enable_web_search and self.tavily_api_key:
             self.web_search_tool = WebSearchTool(
                 tavily_client=TavilyClient(api_key=self.tavily_api_key)
             )
@@ -293,11 +470,12 @@ class AgenticRAGSystem:
         workflow.add_node("synthesizer", self._synthesis_agent)
         workflow.add_node("validator", self._validation_agent)
         
-        # Add edges
+        # Add edges - retrieval and web research only depend on the plan,
+        # so they run as parallel branches and join at the synthesizer
         workflow.add_edge(START, "planner")
         workflow.add_edge("planner", "retriever")
-        workflow.add_edge("retriever", "researcher")
-        workflow.add_edge("researcher", "synthesizer")
+        workflow.add_edge("planner", "researcher")
+        workflow.add_edge(["retriever", "researcher"], "synthesizer")
         workflow.add_edge("synthesizer", "validator")
         workflow.add_edge("validator", END)
         
@@ -353,6 +531,10 @@ class AgenticRAGSystem:
                 search_kwargs={"k": self.config.k_retrieval}
             )
             
+            # Cached answers were grounded in the previous corpus
+            if self.query_cache:
+                self.query_cache.invalidate()
+            
             logger.info(f"Successfully loaded {len(documents)} document chunks")
             return True
             
@@ -360,7 +542,7 @@ class AgenticRAGSystem:
             logger.error(f"Error loading documents: {e}")
             return False
     
-    def _planning_agent(self, state: AgentState) -> AgentState:
+    def _planning_agent(self, state: AgentState) -> Dict[str, Any]:
         """Planning agent - analyzes query and creates execution plan"""
         
         logger.info("Planning Agent: Analyzing query and creating execution plan")
@@ -418,7 +600,7 @@ class AgenticRAGSystem:
                 "research": QueryComplexity.RESEARCH
             }
             
-            state.query_plan = QueryPlan(
+            query_plan = QueryPlan(
                 original_query=state.original_query,
                 complexity=complexity_map.get(analysis.complexity, QueryComplexity.MODERATE),
                 sub_queries=analysis.sub_questions,
@@ -427,93 +609,158 @@ class AgenticRAGSystem:
                 confidence=analysis.confidence
             )
             
-            state.execution_log.append(f"Created execution plan with {len(analysis.sub_questions)} sub-queries")
-            logger.info(f"Query plan created: {state.query_plan.complexity.value} complexity")
+            logger.info(f"Query plan created: {query_plan.complexity.value} complexity")
+            return {
+                "query_plan": query_plan,
+                "execution_log": [f"Created execution plan with {len(analysis.sub_questions)} sub-queries"]
+            }
             
         except Exception as e:
             logger.error(f"Planning agent error: {e}")
             # Fallback plan
-            state.query_plan = QueryPlan(
-                original_query=state.original_query,
-                complexity=QueryComplexity.MODERATE,
-                sub_queries=[state.original_query],
-                confidence=0.5
-            )
+            return {
+                "query_plan": QueryPlan(
+                    original_query=state.original_query,
+                    complexity=QueryComplexity.MODERATE,
+                    sub_queries=[state.original_query],
+                    confidence=0.5
+                )
+            }
+    
+    def _embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed all queries in a single batched request"""
+        try:
+            return self.embeddings.embed_documents(queries, task_type="RETRIEVAL_QUERY")
+        except TypeError:
+            # Embedding backends without task types embed queries and documents alike
+            return self.embeddings.embed_documents(queries)
+    
+    def _search_queries(self, queries: List[str]) -> List[List[Tuple[Document, Optional[float]]]]:
+        """Run the vector search for every query concurrently, returning one ranked list per query"""
+        k = self.config.k_retrieval
+        max_workers = max(1, min(self.config.max_parallel_queries, len(queries)))
+        search_by_vector = getattr(self.vector_store, "similarity_search_by_vector_with_relevance_scores", None)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if search_by_vector is not None:
+                vectors = self._embed_queries(queries)
+                return list(executor.map(lambda vector: search_by_vector(vector, k=k), vectors))
+            
+            # Custom retrievers only expose invoke(); keep their ranking, no distances
+            return list(executor.map(
+                lambda query: [(doc, None) for doc in self.retriever.invoke(query)], queries
+            ))
+    
+    @staticmethod
+    def _merge_ranked_documents(ranked_lists: List[List[Tuple[Document, Optional[float]]]],
+                                limit: int, rrf_k: int = 60) -> List[Document]:
+        """Deduplicate by content hash and merge rankings with reciprocal rank fusion
         
-        return state
+        Documents found by several sub-queries accumulate score, so the final cut to
+        ``limit`` keeps the most broadly relevant chunks rather than the first ones seen.
+        """
+        merged = {}
+        for results in ranked_lists:
+            for rank, (doc, distance) in enumerate(results):
+                key = hashlib.sha256(doc.page_content.encode("utf-8")).hexdigest()
+                entry = merged.setdefault(key, {"doc": doc, "score": 0.0, "hits": 0, "distance": distance})
+                entry["score"] += 1.0 / (rrf_k + rank + 1)
+                entry["hits"] += 1
+                if distance is not None and (entry["distance"] is None or distance < entry["distance"]):
+                    entry["distance"] = distance
+        
+        ranked = sorted(
+            merged.values(),
+            key=lambda entry: (entry["score"], -(entry["distance"] or 0.0)),
+            reverse=True
+        )
+        
+        documents = []
+        for entry in ranked[:limit]:
+            doc = entry["doc"]
+            doc.metadata["retrieval_score"] = round(entry["score"], 6)
+            doc.metadata["query_hits"] = entry["hits"]
+            if entry["distance"] is not None:
+                doc.metadata["distance"] = float(entry["distance"])
+            documents.append(doc)
+        return documents
     
-    def _retrieval_agent(self, state: AgentState) -> AgentState:
+    def _retrieval_agent(self, state: AgentState) -> Dict[str, Any]:
         """Retrieval agent - retrieves relevant documents from vector store"""
         
         logger.info("Retrieval Agent: Retrieving relevant documents")
         
         if not self.retriever:
-            state.execution_log.append("No vector store available for retrieval")
-            return state
+            return {"execution_log": ["No vector store available for retrieval"]}
         
         try:
-            # Retrieve for main query and sub-queries
+            # Retrieve for main query and sub-queries, skipping repeats
             all_queries = [state.original_query] + (state.query_plan.sub_queries if state.query_plan else [])
+            all_queries = list(dict.fromkeys(query for query in all_queries if query))
             
-            retrieved_docs = []
-            for query in all_queries:
-                docs = self.retriever.invoke(query)
-                retrieved_docs.extend(docs)
-            
-            # Remove duplicates based on content
-            unique_docs = []
-            seen_content = set()
-            
-            for doc in retrieved_docs:
-                content_hash = hash(doc.page_content)
-                if content_hash not in seen_content:
-                    unique_docs.append(doc)
-                    seen_content.add(content_hash)
-            
-            state.retrieved_documents = unique_docs[:self.config.k_retrieval]
-            state.execution_log.append(f"Retrieved {len(state.retrieved_documents)} unique documents")
+            ranked_lists = self._search_queries(all_queries)
+            retrieved_documents = self._merge_ranked_documents(ranked_lists, self.config.k_retrieval)
             
             # Add sources
-            for doc in state.retrieved_documents:
+            sources = []
+            for doc in retrieved_documents:
                 source_info = {
                     "type": "document",
                     "source": doc.metadata.get("source", "unknown"),
                     "content_preview": doc.page_content[:200] + "..." if len(doc.page_content) > 200 else doc.page_content
                 }
-                if source_info not in state.sources:
-                    state.sources.append(source_info)
+                if source_info not in sources:
+                    sources.append(source_info)
+            
+            return {
+                "retrieved_documents": retrieved_documents,
+                "sources": sources,
+                "execution_log": [
+                    f"Retrieved {len(retrieved_documents)} unique documents for {len(all_queries)} queries"
+                ]
+            }
             
         except Exception as e:
             logger.error(f"Retrieval agent error: {e}")
-            state.execution_log.append(f"Retrieval failed: {str(e)}")
-        
-        return state
+            return {"execution_log": [f"Retrieval failed: {str(e)}"]}
     
-    def _research_agent(self, state: AgentState) -> AgentState:
+    def _research_agent(self, state: AgentState) -> Dict[str, Any]:
         """Research agent - performs web search if needed"""
         
         logger.info("Research Agent: Performing additional research")
         
         # Check if web search is needed
-        if not (state.query_plan and state.query_plan.requires_web_search and self.config.enable_web_search):
-            state.execution_log.append("Web search not required or not available")
-            return state
+        if not (state.query_plan and state.query_plan.requires_web_search and self.config.enable_web_search
+                and self.web_search_tool is not None):
+            return {"execution_log": ["Web search not required or not available"]}
         
         try:
-            web_results = []
             queries_to_search = [state.original_query]
             
             if state.query_plan.sub_queries:
-                queries_to_search.extend(state.query_plan.sub_queries[:3])  # Limit web searches
-            
-            for query in queries_to_search:
-                results = self.web_search_tool._run(query, max_results=3)
-                web_results.extend(results)
-            
-            state.web_results = web_results
-            state.execution_log.append(f"Retrieved {len(web_results)} web results")
+                queries_to_search.extend(state.query_plan.sub_queries)
+            queries_to_search = list(dict.fromkeys(queries_to_search))[:self.config.max_web_queries]  # Limit web searches
+            
+            with ThreadPoolExecutor(max_workers=len(queries_to_search)) as executor:
+                result_lists = list(executor.map(
+                    lambda query: self.web_search_tool._run(query, max_results=3), queries_to_search
+                ))
+            
+            # Merge by URL (or content for URL-less results), keeping the best score
+            merged = {}
+            errors = []
+            for result in (result for results in result_lists for result in results):
+                if "error" in result:
+                    errors.append(result)
+                    continue
+                key = result.get("url") or hashlib.sha256(result.get("content", "").encode("utf-8")).hexdigest()
+                if key not in merged or result.get("score", 0.0) > merged[key].get("score", 0.0):
+                    merged[key] = result
+            web_results = sorted(merged.values(), key=lambda result: result.get("score", 0.0), reverse=True)
+            web_results.extend(errors[:1])
             
             # Add web sources
+            sources = []
             for result in web_results:
                 if "error" not in result:
                     source_info = {
@@ -522,15 +769,19 @@ class AgenticRAGSystem:
                         "title": result.get("title", ""),
                         "content_preview": result.get("content", "")[:200] + "..." if result.get("content", "") else ""
                     }
-                    state.sources.append(source_info)
+                    sources.append(source_info)
+            
+            return {
+                "web_results": web_results,
+                "sources": sources,
+                "execution_log": [f"Retrieved {len(web_results)} web results for {len(queries_to_search)} queries"]
+            }
             
         except Exception as e:
             logger.error(f"Research agent error: {e}")
-            state.execution_log.append(f"Web research failed: {str(e)}")
-        
-        return state
+            return {"execution_log": [f"Web research failed: {str(e)}"]}
     
-    def _synthesis_agent(self, state: AgentState) -> AgentState:
+    def _synthesis_agent(self, state: AgentState) -> Dict[str, Any]:
         """Synthesis agent - combines all information to generate final answer"""
         
         logger.info("Synthesis Agent: Generating comprehensive answer")
@@ -577,48 +828,68 @@ class AgenticRAGSystem:
             })
             
             response = self.llm.invoke(formatted_prompt)
-            state.final_answer = response.content
             
             # Calculate confidence based on available information
             doc_score = min(len(state.retrieved_documents) / self.config.k_retrieval, 1.0) * 0.6
             web_score = min(len([r for r in state.web_results if "error" not in r]) / 3, 1.0) * 0.4
-            state.confidence_score = doc_score + web_score
             
-            state.execution_log.append("Generated comprehensive answer")
+            return {
+                "final_answer": response.content,
+                "confidence_score": doc_score + web_score,
+                "execution_log": ["Generated comprehensive answer"]
+            }
             
         except Exception as e:
             logger.error(f"Synthesis agent error: {e}")
-            state.final_answer = f"I encountered an error while generating the response: {str(e)}"
-            state.confidence_score = 0.1
-        
-        return state
+            return {
+                "final_answer": f"I encountered an error while generating the response: {str(e)}",
+                "confidence_score": 0.1
+            }
     
-    def _validation_agent(self, state: AgentState) -> AgentState:
+    def _validation_agent(self, state: AgentState) -> Dict[str, Any]:
         """Validation agent - validates and refines the final answer"""
         
         logger.info("Validation Agent: Validating answer quality")
         
+        execution_log = []
+        confidence_score = state.confidence_score
+        
         # Simple validation based on answer length and confidence
         if len(state.final_answer) < 50:
-            state.execution_log.append("Warning: Answer seems too short")
-            state.confidence_score *= 0.8
+            execution_log.append("Warning: Answer seems too short")
+            confidence_score *= 0.8
         
         if not state.retrieved_documents and not state.web_results:
-            state.execution_log.append("Warning: No supporting evidence found")
-            state.confidence_score *= 0.5
+            execution_log.append("Warning: No supporting evidence found")
+            confidence_score *= 0.5
         
         # Validation passed
-        state.execution_log.append(f"Validation complete. Final confidence: {state.confidence_score:.2f}")
+        execution_log.append(f"Validation complete. Final confidence: {confidence_score:.2f}")
         
-        return state
+        return {"confidence_score": confidence_score, "execution_log": execution_log}
     
-    def query(self, question: str, thread_id: str = None) -> Dict[str, Any]:
+    def _lookup_cached_answer(self, question: str) -> Tuple[Optional[Dict[str, Any]], Optional[List[float]]]:
+        """Check the semantic cache, returning (entry, question embedding)"""
+        entry = self.query_cache.get_exact(question)
+        if entry:
+            return entry, None
+        
+        try:
+            vector = self.embeddings.embed_query(question)
+        except Exception as e:
+            logger.warning(f"Query cache lookup skipped, embedding failed: {e}")
+            return None, None
+        
+        return self.query_cache.get_similar(vector), vector
+    
+    def query(self, question: str, thread_id: str = None, use_cache: bool = True) -> Dict[str, Any]:
         """
         Process a query through the agentic RAG system
         
         Args:
             question: User's question
             thread_id: Optional thread ID for conversation continuity
+            use_cache: Whether to answer from / populate the semantic query cache
             
         Returns:
             Dictionary with comprehensive results
@@ -632,6 +903,22 @@ class AgenticRAGSystem:
         if not thread_id:
             thread_id = str(uuid.uuid4())
         
+        use_cache = use_cache and self.query_cache is not None
+        query_vector = None
+        if use_cache:
+            cached, query_vector = self._lookup_cached_answer(question)
+            if cached:
+                logger.info(f"Semantic cache hit (similarity {cached['similarity']:.3f}): {cached['question']}")
+                response = dict(cached["response"])
+                response.update({
+                    "cache_hit": True,
+                    "cached_question": cached["question"],
+                    "cache_similarity": cached["similarity"],
+                    "thread_id": thread_id,
+                    "timestamp": datetime.now().isoformat()
+                })
+                return response
+        
         try:
             # Ensure event loop exists before executing workflow
             self._ensure_event_loop()
@@ -653,9 +940,14 @@ class AgenticRAGSystem:
                     "estimated_steps": final_state["query_plan"].estimated_steps if final_state["query_plan"] else 1
                 } if final_state["query_plan"] else None,
                 "thread_id": thread_id,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now().isoformat(),
+                "cache_hit": False
             }
             
+            if (use_cache and query_vector is not None
+                    and response["confidence"] >= self.config.cache_min_confidence):
+                self.query_cache.put(question, query_vector, response)
+            
             logger.info(f"Query processed successfully. Confidence: {response['confidence']:.2f}")
             return response
             
@@ -679,6 +971,7 @@ class AgenticRAGSystem:
             "model": self.config.llm_model,
             "embedding_model": self.config.embedding_model,
             "tools_available": len(self.tools),
+            "query_cache": self.query_cache.get_stats() if self.query_cache else {"enabled": False},
             "configuration": {
                 "max_iterations": self.config.max_iterations,
                 "confidence_threshold": self.config.confidence_threshold,
@@ -169,6 +169,13 @@ def create_system_status_dashboard():
         </div>
         """, unsafe_allow_html=True)
     
+    cache_stats = status.get('query_cache', {})
+    if cache_stats.get('entries') is not None:
+        st.caption(
+            f"🗄️ Semantic answer cache: {cache_stats['entries']} entries · "
+            f"hit rate {cache_stats['hit_rate']:.0%} ({cache_stats['hits']} hits / {cache_stats['misses']} misses)"
+        )
+    
     # Add informational message if vector store is not ready
     if not status['vector_store_initialized']:
         st.info("📄 **Vector Store Status**: No documents loaded yet. Upload and process documents to enable document-based retrieval. The system can still answer questions using web search if enabled.")
@@ -460,6 +467,10 @@ def main():
                         # Display results
                         st.success("✅ Question processed successfully!")
                         
+                        if response.get('cache_hit'):
+                            st.info(f"⚡ Answered from cache (similar to: \"{response.get('cached_question')}\", "
+                                    f"similarity {response.get('cache_similarity', 0):.2f})")
+                        
                         # Main answer
                         st.subheader("💡 Answer")
                         st.write(response['answer'])
@@ -2,12 +2,21 @@
 Agentic Router using LangGraph for intelligent retrieval strategy selection.
 This module implements an AI based decision system that analyzes queries
 and selects the optimal retrieval strategy using LLM reasoning.
+
+Routing is tiered: decisions are cached per normalized query, a cheap keyword
+(and optional embedding-centroid) heuristic settles confident cases instantly,
+and the LLM workflow is only consulted for ambiguous queries.
 """
 
-from typing import Dict, Any, Literal
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Literal, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.retrievers import BaseRetriever
 from langgraph.graph import StateGraph, START, END
@@ -29,17 +38,59 @@ class RouterState:
     reasoning: str = ""
 
 
+# Cue phrases for the heuristic tier, matched on word boundaries. Bare question words
+# ("when", "which", "list", ...) appear in almost every query, so only phrases are used
+TRAVERSAL_CUES = [
+    "relationship", "relationships", "related", "relate", "connection", "connections", "connected",
+    "compare", "comparison", "similar", "similarities", "difference", "differences", "versus", "vs",
+    "between", "across", "share", "shared", "common", "pattern", "patterns", "associated", "vary",
+    "influence", "impact", "link", "linked", "analyze", "analyse"
+]
+STANDARD_CUES = [
+    "what is", "what are", "who is", "who was", "define", "definition", "when was", "when did",
+    "where is", "where are", "where do", "where does", "how many", "how much", "what type", "what kind"
+]
+# The heuristic only decides a query once the winning side matches at least this many cues
+MIN_HEURISTIC_CUES = 2
+
+# Exemplar queries for the optional embedding-centroid heuristic
+TRAVERSAL_EXEMPLARS = [
+    "What animals share similar habitats and how are they related?",
+    "Compare the characteristics of entities from different origins.",
+    "Find connections between different categories.",
+    "How do these concepts relate to each other across documents?"
+]
+STANDARD_EXEMPLARS = [
+    "What is a capybara?",
+    "Where do elephants live?",
+    "Define the term in the document.",
+    "When was this published?"
+]
+
+
 class AgenticRetrieverRouter:
     """
     LangGraph-based intelligent router that uses LLM analysis to select
     the optimal retrieval strategy for each query.
     """
     
-    def __init__(self, llm, traversal_retriever: BaseRetriever, standard_retriever: BaseRetriever):
+    ROUTING_TIERS = ("cache", "heuristic", "llm")
+    
+    def __init__(self, llm, traversal_retriever: BaseRetriever, standard_retriever: BaseRetriever,
+                 embeddings=None, heuristic_confidence_threshold: float = 0.75, cache_size: int = 512):
         self.llm = llm
         self.traversal_retriever = traversal_retriever
         self.standard_retriever = standard_retriever
+        self.embeddings = embeddings
+        self.heuristic_confidence_threshold = heuristic_confidence_threshold
+        self.cache_size = cache_size
         self.workflow = self._build_workflow()
+        
+        self._traversal_patterns = [re.compile(rf"\b{re.escape(cue)}\b") for cue in TRAVERSAL_CUES]
+        self._standard_patterns = [re.compile(rf"\b{re.escape(cue)}\b") for cue in STANDARD_CUES]
+        self._centroids = None
+        self._decision_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._metrics = {tier: {"count": 0, "total_ms": 0.0, "max_ms": 0.0} for tier in self.ROUTING_TIERS}
     
     def _build_workflow(self) -> CompiledStateGraph:
         """Build the LangGraph workflow for routing decisions"""
@@ -185,13 +236,136 @@ class AgenticRetrieverRouter:
         
         return strategy, confidence, reasoning
     
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        return " ".join(re.findall(r"\w+", query.lower()))
+    
+    def _centroid_scores(self, query: str) -> Optional[Dict[str, float]]:
+        """Cosine similarity of the query to each strategy's exemplar centroid, if embeddings are available"""
+        if self.embeddings is None:
+            return None
+        try:
+            if self._centroids is None:
+                centroids = {}
+                for strategy, exemplars in ((RetrievalStrategy.TRAVERSAL, TRAVERSAL_EXEMPLARS),
+                                            (RetrievalStrategy.STANDARD, STANDARD_EXEMPLARS)):
+                    vectors = np.asarray(self.embeddings.embed_documents(exemplars), dtype=np.float32)
+                    centroid = vectors.mean(axis=0)
+                    centroids[strategy] = centroid / (np.linalg.norm(centroid) or 1.0)
+                self._centroids = centroids
+            vector = np.asarray(self.embeddings.embed_query(query), dtype=np.float32)
+            vector = vector / (np.linalg.norm(vector) or 1.0)
+            return {strategy: float(centroid @ vector) for strategy, centroid in self._centroids.items()}
+        except Exception as e:
+            print(f"Centroid heuristic unavailable: {e}")
+            self.embeddings = None
+            return None
+    
+    def _heuristic_route(self, query: str) -> Dict[str, Any]:
+        """Score the query with keyword cues (and embedding centroids when available)"""
+        normalized = self._normalize_query(query)
+        traversal_hits = [cue for cue, pattern in zip(TRAVERSAL_CUES, self._traversal_patterns) if pattern.search(normalized)]
+        standard_hits = [cue for cue, pattern in zip(STANDARD_CUES, self._standard_patterns) if pattern.search(normalized)]
+        
+        if max(len(traversal_hits), len(standard_hits)) < MIN_HEURISTIC_CUES:
+            return {"strategy": RetrievalStrategy.TRAVERSAL, "confidence": 0.0,
+                    "reasoning": "Too few routing cues found",
+                    "analysis": f"Heuristic cues - traversal: {traversal_hits}, standard: {standard_hits}"}
+        
+        traversal_score = float(len(traversal_hits))
+        standard_score = float(len(standard_hits))
+        centroid_scores = self._centroid_scores(query)
+        if centroid_scores:
+            # Centroid margin only adjusts cue-backed scores, worth at most one cue
+            margin = centroid_scores[RetrievalStrategy.TRAVERSAL] - centroid_scores[RetrievalStrategy.STANDARD]
+            traversal_score += min(max(margin, 0.0) * 10, 1.0)
+            standard_score += min(max(-margin, 0.0) * 10, 1.0)
+        
+        total = traversal_score + standard_score
+        strategy = RetrievalStrategy.TRAVERSAL if traversal_score >= standard_score else RetrievalStrategy.STANDARD
+        winning = max(traversal_score, standard_score)
+        # Share of the evidence for the winner, damped when there is little evidence overall
+        confidence = (winning / total) * min(1.0, 0.6 + 0.2 * winning)
+        cues = traversal_hits if strategy == RetrievalStrategy.TRAVERSAL else standard_hits
+        return {
+            "strategy": strategy,
+            "confidence": round(confidence, 3),
+            "reasoning": f"Heuristic match on {', '.join(cues) if cues else 'embedding similarity'}",
+            "analysis": f"Heuristic cues - traversal: {traversal_hits}, standard: {standard_hits}"
+        }
+    
+    def _record_latency(self, tier: str, started: float) -> float:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        metrics = self._metrics[tier]
+        metrics["count"] += 1
+        metrics["total_ms"] += elapsed_ms
+        metrics["max_ms"] = max(metrics["max_ms"], elapsed_ms)
+        return elapsed_ms
+    
+    def get_routing_metrics(self) -> Dict[str, Any]:
+        """Routing counts and latency per tier, plus decision cache usage"""
+        total = sum(metrics["count"] for metrics in self._metrics.values())
+        return {
+            "total_routes": total,
+            "cache_entries": len(self._decision_cache),
+            "tiers": {
+                tier: {
+                    "count": metrics["count"],
+                    "share": metrics["count"] / total if total else 0.0,
+                    "avg_ms": metrics["total_ms"] / metrics["count"] if metrics["count"] else 0.0,
+                    "max_ms": metrics["max_ms"]
+                } for tier, metrics in self._metrics.items()
+            }
+        }
+    
+    def clear_cache(self):
+        self._decision_cache.clear()
+    
+    def _retriever_for(self, strategy) -> BaseRetriever:
+        if strategy == RetrievalStrategy.STANDARD or strategy == RetrievalStrategy.STANDARD.value:
+            return self.standard_retriever
+        return self.traversal_retriever
+    
     def route(self, query: str) -> tuple[BaseRetriever, Dict[str, Any]]:
         """
-        Route the query to the appropriate retriever using agentic decision making.
+        Route the query to the appropriate retriever.
+        
+        Cached decisions are returned immediately; otherwise the heuristic tier
+        decides when its confidence clears ``heuristic_confidence_threshold`` and
+        the LLM workflow handles the remaining, ambiguous queries.
         
         Returns:
             tuple: (selected_retriever, routing_info)
         """
+        started = time.perf_counter()
+        key = self._normalize_query(query)
+        
+        cached = self._decision_cache.get(key)
+        if cached is not None:
+            self._decision_cache.move_to_end(key)
+            routing_info = dict(cached, tier="cache")
+            routing_info["latency_ms"] = self._record_latency("cache", started)
+            return self._retriever_for(routing_info["strategy"]), routing_info
+        
+        heuristic = self._heuristic_route(query)
+        if heuristic["confidence"] >= self.heuristic_confidence_threshold:
+            routing_info = dict(heuristic, strategy=heuristic["strategy"].value, tier="heuristic")
+            cacheable = True
+        else:
+            routing_info, cacheable = self._route_with_llm(query)
+            routing_info["tier"] = "llm"
+        
+        tier = routing_info["tier"]
+        routing_info["latency_ms"] = self._record_latency(tier, started)
+        if cacheable:
+            self._decision_cache[key] = {k: v for k, v in routing_info.items() if k not in ("tier", "latency_ms")}
+            if len(self._decision_cache) > self.cache_size:
+                self._decision_cache.popitem(last=False)
+        
+        return self._retriever_for(routing_info["strategy"]), routing_info
+    
+    def _route_with_llm(self, query: str) -> tuple[Dict[str, Any], bool]:
+        """Run the LangGraph analysis workflow; returns (routing_info, cacheable)"""
         
         # Initialize state
         initial_state = RouterState(query=query)
@@ -214,12 +388,6 @@ class AgenticRetrieverRouter:
                 reasoning = final_state.reasoning
                 query_analysis = final_state.query_analysis
             
-            # Select the appropriate retriever
-            if selected_strategy == RetrievalStrategy.TRAVERSAL:
-                selected_retriever = self.traversal_retriever
-            else:
-                selected_retriever = self.standard_retriever
-            
             # Prepare routing information
             routing_info = {
                 "strategy": selected_strategy.value if hasattr(selected_strategy, 'value') else str(selected_strategy),
@@ -228,7 +396,8 @@ class AgenticRetrieverRouter:
                 "analysis": query_analysis
             }
             
-            return selected_retriever, routing_info
+            # Don't cache decisions that fell back because a workflow step failed
+            return routing_info, not str(reasoning).startswith("Defaulted to traversal due to error")
             
         except Exception as e:
             print(f"Error in routing workflow: {e}")
@@ -239,7 +408,7 @@ class AgenticRetrieverRouter:
                 "reasoning": f"Fallback due to error: {str(e)}",
                 "analysis": "Error in analysis"
             }
-            return self.traversal_retriever, routing_info
+            return routing_info, False
     
     def get_routing_explanation(self, query: str) -> Dict[str, Any]:
         """
@@ -250,7 +419,8 @@ class AgenticRetrieverRouter:
         return routing_info
 
 
-def create_agentic_router(llm, traversal_retriever: BaseRetriever, standard_retriever: BaseRetriever) -> AgenticRetrieverRouter:
+def create_agentic_router(llm, traversal_retriever: BaseRetriever, standard_retriever: BaseRetriever,
+                          embeddings=None, heuristic_confidence_threshold: float = 0.75) -> AgenticRetrieverRouter:
     """
     Factory function to create an agentic router.
     
@@ -258,8 +428,16 @@ def create_agentic_router(llm, traversal_retriever: BaseRetriever, standard_retr
         llm: Language model for decision making
         traversal_retriever: Graph-based retriever for relationship queries
         standard_retriever: Vector similarity retriever for direct queries
+        embeddings: Optional embeddings for the centroid heuristic
+        heuristic_confidence_threshold: Minimum heuristic confidence to skip the LLM
     
     Returns:
         AgenticRetrieverRouter: Configured agentic router
     """
-    return AgenticRetrieverRouter(llm, traversal_retriever, standard_retriever)
\ No newline at end of file
+    return AgenticRetrieverRouter(
+        llm,
+        traversal_retriever,
+        standard_retriever,
+        embeddings=embeddings,
+        heuristic_confidence_threshold=heuristic_confidence_threshold
+    )
\ No newline at end of file
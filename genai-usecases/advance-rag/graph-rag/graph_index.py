@@ -0,0 +1,291 @@
+"""
+Persisted graph index for Graph RAG.
+
+Builds, in a single pass over the whole corpus, a metadata inverted index
+(field -> value -> document ids), detects which metadata fields actually
+connect documents, and precomputes adjacency arrays from them. Document
+embeddings are stored on disk keyed by content hash, so re-initializing the
+system with the same (or an overlapping) corpus never re-embeds a document.
+Retrieval is a similarity-seeded breadth-first search over the adjacency
+arrays, run entirely in memory.
+"""
+
+import hashlib
+import json
+import re
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+# Positional or bookkeeping metadata that would link unrelated chunks
+IGNORED_EDGE_FIELDS = {
+    "id", "page", "page_label", "total_pages", "start_index", "row",
+    "creationdate", "moddate", "creator", "producer", "creation_date", "mod_date"
+}
+
+
+def document_hash(doc: Document) -> str:
+    """Stable content hash used as the document key in the embedding store"""
+    payload = json.dumps({"content": doc.page_content, "metadata": doc.metadata}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _metadata_values(value: Any) -> List[str]:
+    """Flatten a metadata value into hashable index keys"""
+    if isinstance(value, (list, tuple, set)):
+        return [str(item) for item in value if item is not None and not isinstance(item, (dict, list))]
+    if value is None or isinstance(value, dict):
+        return []
+    return [str(value)]
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class EmbeddingStore:
+    """On-disk embedding cache keyed by document hash, one file pair per embedding model"""
+
+    def __init__(self, directory: str, model_name: str):
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+        self.directory = Path(directory)
+        self.vectors_path = self.directory / f"{slug}.npy"
+        self.ids_path = self.directory / f"{slug}.ids.json"
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._vectors: Optional[np.ndarray] = None
+        self._load()
+
+    def _load(self):
+        if self.vectors_path.exists() and self.ids_path.exists():
+            try:
+                self._vectors = np.load(self.vectors_path)
+                self._ids = json.loads(self.ids_path.read_text())
+                if len(self._ids) != self._vectors.shape[0]:
+                    raise ValueError(f"{len(self._ids)} ids for {self._vectors.shape[0]} vectors")
+                self._rows = {doc_id: row for row, doc_id in enumerate(self._ids)}
+            except Exception as e:
+                print(f"Ignoring unreadable embedding store {self.vectors_path}: {e}")
+                self._ids, self._rows, self._vectors = [], {}, None
+
+    def _save(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        np.save(self.vectors_path, self._vectors)
+        self.ids_path.write_text(json.dumps(self._ids))
+
+    def get_or_embed(self, doc_hashes: List[str], texts: List[str],
+                     embed_documents: Callable[[List[str]], List[List[float]]]) -> Tuple[np.ndarray, int]:
+        """Return the embedding matrix for the given documents and how many had to be embedded"""
+        # First occurrence of each unseen hash; duplicates within a batch are embedded once
+        missing: Dict[str, int] = {}
+        for i, doc_hash in enumerate(doc_hashes):
+            if doc_hash not in self._rows and doc_hash not in missing:
+                missing[doc_hash] = i
+        if missing:
+            new_vectors = np.asarray(embed_documents([texts[i] for i in missing.values()]), dtype=np.float32)
+            first_row = 0 if self._vectors is None else self._vectors.shape[0]
+            self._vectors = new_vectors if self._vectors is None else np.vstack([self._vectors, new_vectors])
+            for offset, doc_hash in enumerate(missing):
+                self._rows[doc_hash] = first_row + offset
+                self._ids.append(doc_hash)
+            self._save()
+
+        rows = [self._rows[doc_hash] for doc_hash in doc_hashes]
+        return self._vectors[rows], len(missing)
+
+
+class GraphIndex:
+    """Inverted metadata index, adjacency arrays and normalized embeddings for one corpus"""
+
+    def __init__(self, documents: List[Document], vectors: np.ndarray, inverted_index: Dict[str, Dict[str, List[int]]],
+                 edge_fields: List[str], adjacency: List[np.ndarray], embed_query: Callable[[str], List[float]],
+                 query_cache_size: int = 256):
+        self.documents = documents
+        self.vectors = _normalize_rows(np.asarray(vectors, dtype=np.float32))
+        self.inverted_index = inverted_index
+        self.edge_fields = edge_fields
+        self.adjacency = adjacency
+        self.embed_query = embed_query
+        self.query_cache_size = query_cache_size
+        self._query_vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.stats = {"documents": len(documents), "embedded": 0, "reused_embeddings": len(documents),
+                      "loaded_from_disk": False}
+
+    @property
+    def edges(self) -> List[Tuple[str, str]]:
+        return [(field, field) for field in self.edge_fields]
+
+    @staticmethod
+    def build_inverted_index(documents: List[Document]) -> Dict[str, Dict[str, List[int]]]:
+        index: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        for doc_id, doc in enumerate(documents):
+            for field, value in (doc.metadata or {}).items():
+                for key in dict.fromkeys(_metadata_values(value)):
+                    index[field][key].append(doc_id)
+        return {field: dict(values) for field, values in index.items()}
+
+    @staticmethod
+    def detect_edge_fields(inverted_index: Dict[str, Dict[str, List[int]]]) -> List[str]:
+        """Metadata fields whose values are shared by at least two documents across the full corpus"""
+        edge_fields = []
+        for field, postings in inverted_index.items():
+            if field.lower() in IGNORED_EDGE_FIELDS or field.startswith("_"):
+                continue
+            if any(len(doc_ids) > 1 for doc_ids in postings.values()):
+                edge_fields.append(field)
+        return sorted(edge_fields)
+
+    @staticmethod
+    def build_adjacency(n_docs: int, inverted_index: Dict[str, Dict[str, List[int]]],
+                        edge_fields: List[str], max_value_fanout: int) -> List[np.ndarray]:
+        """Link documents sharing an edge-field value
+
+        Values shared by more than ``max_value_fanout`` documents (e.g. every
+        chunk of one large PDF sharing ``source``) only link each document to
+        its ``max_value_fanout`` nearest neighbours in corpus order, keeping
+        the graph sparse instead of quadratic.
+        """
+        neighbors = [set() for _ in range(n_docs)]
+        half_window = max(1, max_value_fanout // 2)
+        for field in edge_fields:
+            for doc_ids in inverted_index[field].values():
+                if len(doc_ids) < 2:
+                    continue
+                if len(doc_ids) <= max_value_fanout:
+                    for doc_id in doc_ids:
+                        neighbors[doc_id].update(doc_ids)
+                else:
+                    for position, doc_id in enumerate(doc_ids):
+                        neighbors[doc_id].update(doc_ids[max(0, position - half_window):position + half_window + 1])
+
+        adjacency = []
+        for doc_id, linked in enumerate(neighbors):
+            linked.discard(doc_id)
+            adjacency.append(np.fromiter(sorted(linked), dtype=np.int32, count=len(linked)))
+        return adjacency
+
+    @classmethod
+    def build(cls, documents: List[Document], embeddings, index_directory: str, model_name: str,
+              max_value_fanout: int = 50) -> "GraphIndex":
+        """Build (or load from disk) the graph index and embeddings for a corpus"""
+        doc_hashes = [document_hash(doc) for doc in documents]
+        fingerprint = hashlib.sha256(
+            json.dumps([doc_hashes, max_value_fanout]).encode("utf-8")
+        ).hexdigest()[:16]
+        graph_path = Path(index_directory) / f"graph_{fingerprint}.json"
+
+        store = EmbeddingStore(index_directory, model_name)
+        vectors, embedded = store.get_or_embed(
+            doc_hashes, [doc.page_content for doc in documents], embeddings.embed_documents
+        )
+
+        loaded_from_disk = False
+        if graph_path.exists():
+            try:
+                persisted = json.loads(graph_path.read_text())
+                inverted_index = persisted["inverted_index"]
+                edge_fields = persisted["edge_fields"]
+                adjacency = [np.asarray(linked, dtype=np.int32) for linked in persisted["adjacency"]]
+                loaded_from_disk = True
+            except Exception as e:
+                print(f"Rebuilding unreadable graph index {graph_path}: {e}")
+
+        if not loaded_from_disk:
+            inverted_index = cls.build_inverted_index(documents)
+            edge_fields = cls.detect_edge_fields(inverted_index)
+            adjacency = cls.build_adjacency(len(documents), inverted_index, edge_fields, max_value_fanout)
+            graph_path.parent.mkdir(parents=True, exist_ok=True)
+            graph_path.write_text(json.dumps({
+                "doc_hashes": doc_hashes,
+                "inverted_index": inverted_index,
+                "edge_fields": edge_fields,
+                "adjacency": [linked.tolist() for linked in adjacency]
+            }))
+
+        index = cls(documents, vectors, inverted_index, edge_fields, adjacency, embeddings.embed_query)
+        index.stats.update({
+            "embedded": embedded,
+            "reused_embeddings": len(documents) - embedded,
+            "loaded_from_disk": loaded_from_disk,
+            "edges": sum(len(linked) for linked in adjacency) // 2
+        })
+        return index
+
+    def lookup(self, field: str, value: Any) -> List[Document]:
+        """Documents whose metadata ``field`` contains ``value``"""
+        return [self.documents[doc_id] for doc_id in self.inverted_index.get(field, {}).get(str(value), [])]
+
+    def _query_vector(self, query: str) -> np.ndarray:
+        vector = self._query_vectors.get(query)
+        if vector is None:
+            vector = np.asarray(self.embed_query(query), dtype=np.float32)
+            vector = vector / (np.linalg.norm(vector) or 1.0)
+            self._query_vectors[query] = vector
+            if len(self._query_vectors) > self.query_cache_size:
+                self._query_vectors.popitem(last=False)
+        else:
+            self._query_vectors.move_to_end(query)
+        return vector
+
+    def search(self, query: str, k: int, start_k: int, max_depth: int) -> List[Document]:
+        """Seed with the ``start_k`` most similar documents, then expand breadth-first
+
+        Each depth's newly reached documents are ranked by similarity and added
+        until ``k`` documents are selected; traversal stops as soon as ``k`` is
+        reached or ``max_depth`` is exhausted.
+        """
+        if not self.documents:
+            return []
+
+        similarities = self.vectors @ self._query_vector(query)
+        start_k = min(max(start_k, 1), len(self.documents))
+        seeds = np.argpartition(-similarities, start_k - 1)[:start_k]
+        seeds = seeds[np.argsort(-similarities[seeds])]
+
+        selected = [(int(doc_id), 0) for doc_id in seeds[:k]]
+        visited = {doc_id for doc_id, _ in selected}
+        frontier = [doc_id for doc_id, _ in selected]
+
+        for depth in range(1, max_depth + 1):
+            if len(selected) >= k or not frontier:
+                break
+            reached = {
+                int(neighbor) for doc_id in frontier for neighbor in self.adjacency[doc_id]
+                if int(neighbor) not in visited
+            }
+            if not reached:
+                break
+            ranked = sorted(reached, key=lambda doc_id: similarities[doc_id], reverse=True)
+            visited.update(reached)
+            frontier = ranked[:k - len(selected)]
+            selected.extend((doc_id, depth) for doc_id in frontier)
+
+        results = []
+        for doc_id, depth in selected:
+            doc = self.documents[doc_id]
+            metadata = dict(doc.metadata)
+            metadata.update({"_depth": depth, "_similarity_score": round(float(similarities[doc_id]), 4)})
+            results.append(Document(id=doc.id, page_content=doc.page_content, metadata=metadata))
+        return results
+
+
+class GraphIndexRetriever(BaseRetriever):
+    """Retriever over a GraphIndex; ``max_depth=0`` gives plain similarity search"""
+    index: Any
+    k: int = 5
+    start_k: int = 1
+    max_depth: int = 2
+
+    @property
+    def edges(self) -> List[Tuple[str, str]]:
+        return self.index.edges
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> List[Document]:
+        return self.index.search(query, k=self.k, start_k=self.start_k, max_depth=self.max_depth)
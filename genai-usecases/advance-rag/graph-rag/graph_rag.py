@@ -7,21 +7,19 @@ from dataclasses import dataclass
 from enum import Enum
 
 from langchain_core.documents import Document
-from langchain_core.vectorstores import InMemoryVectorStore
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.prompts import ChatPromptTemplate
 from langchain.chat_models import init_chat_model
 from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_graph_retriever import GraphRetriever
 from langchain_community.document_loaders import (
     PyPDFLoader, 
     TextLoader, 
     CSVLoader
 )
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from graph_retriever.strategies import Eager
 from graph_rag_example_helpers.datasets.animals import fetch_documents
 from agentic_router import create_agentic_router
+from graph_index import GraphIndex, GraphIndexRetriever
 
 load_dotenv()
 
@@ -44,6 +42,8 @@ class GraphRAGConfig:
     chunk_overlap: int = 200
     k_retrieval: int = 5
     max_depth: int = 2
+    index_directory: str = "./graph_index_store"
+    max_value_fanout: int = 50
 
 class DocumentProcessor:
     def __init__(self, config: GraphRAGConfig):
@@ -81,7 +81,7 @@ class GraphRAGSystem:
     def __init__(self, config: GraphRAGConfig = None):
         self.config = config or GraphRAGConfig()
         self.embeddings = None
-        self.vector_store = None
+        self.graph_index = None
         self.traversal_retriever = None
         self.standard_retriever = None
         self.llm = None
@@ -121,113 +121,50 @@ class GraphRAGSystem:
         self._create_vector_store_and_retrievers([doc])
     
     def _create_vector_store_and_retrievers(self, documents: List[Document]):
-        self.vector_store = InMemoryVectorStore.from_documents(
-            documents=documents,
-            embedding=self.embeddings,
+        # Embeddings are reused from the on-disk store; only unseen documents are embedded
+        self.graph_index = GraphIndex.build(
+            documents,
+            embeddings=self.embeddings,
+            index_directory=self.config.index_directory,
+            model_name=self.config.embedding_model,
+            max_value_fanout=self.config.max_value_fanout
         )
+        print(f"Graph index ready: {self.graph_index.stats}")
+        print(f"Detected edges: {self.graph_index.edges}")
         
-        # Auto-detect edges based on content and metadata
-        edges = self._detect_edges(documents)
-        print(f"Detected edges: {edges}")
-        self.traversal_retriever = GraphRetriever(
-            store=self.vector_store,
-            edges=edges,
-            strategy=Eager(k=self.config.k_retrieval, start_k=1, max_depth=self.config.max_depth),
+        self.traversal_retriever = GraphIndexRetriever(
+            index=self.graph_index,
+            k=self.config.k_retrieval,
+            start_k=1,
+            max_depth=self.config.max_depth
         )
         
-        self.standard_retriever = GraphRetriever(
-            store=self.vector_store,
-            edges=edges,
-            strategy=Eager(k=self.config.k_retrieval, start_k=self.config.k_retrieval, max_depth=0),
+        self.standard_retriever = GraphIndexRetriever(
+            index=self.graph_index,
+            k=self.config.k_retrieval,
+            start_k=self.config.k_retrieval,
+            max_depth=0
         )
         
         # Initialize agentic router
         self.agentic_router = create_agentic_router(
             llm=self.llm,
             traversal_retriever=self.traversal_retriever,
-            standard_retriever=self.standard_retriever
+            standard_retriever=self.standard_retriever,
+            embeddings=self.embeddings
         )
         print("Agentic router initialized successfully")
     
-    def _detect_edges(self, documents: List[Document]) -> List[tuple]:
-        """Auto-detect graph edges based on document content and metadata"""
-        edges = []
-        
-        # Debug: Print sample metadata to understand structure
-        print(f"Sample document metadata: {documents[0].metadata if documents else 'None'}")
-        
-        # Check if this is the default animal dataset - look for specific animal dataset indicators
-        sample_metadata = [str(doc.metadata).lower() for doc in documents[:5]]
-        sample_content = [doc.page_content.lower() for doc in documents[:5]]
-        
-        # Look for animal-specific fields or content
-        animal_indicators = ["habitat", "origin", "species", "mammal", "bird", "reptile", "capybara", "elephant"]
-        
-        if (any("habitat" in meta for meta in sample_metadata) or 
-            any("origin" in meta for meta in sample_metadata) or
-            any(indicator in " ".join(sample_content) for indicator in animal_indicators)):
-            print("Detected animal dataset - using animal-specific edges")
-            return [("habitat", "habitat"), ("origin", "origin"), ("category", "category")]
-        
-        # Extract common metadata keys
-        metadata_keys = set()
-        for doc in documents[:10]:
-            if hasattr(doc, 'metadata') and doc.metadata:
-                metadata_keys.update(doc.metadata.keys())
-        
-        # Common relationship patterns
-        relationship_patterns = {
-            'source': 'source',
-            'author': 'author', 
-            'category': 'category',
-            'topic': 'topic',
-            'type': 'type',
-            'section': 'section',
-            'chapter': 'chapter',
-            'department': 'department',
-            'location': 'location',
-            'date': 'date',
-            'tag': 'tag',
-            'subject': 'subject'
-        }
-        
-        # Add edges for matching metadata keys
-        for key in metadata_keys:
-            key_lower = key.lower()
-            for pattern, edge_name in relationship_patterns.items():
-                if pattern in key_lower:
-                    edges.append((key, key))
-                    break
-        
-        # Content-based edges
-        sample_text = " ".join([doc.page_content[:500] for doc in documents[:5]]).lower()
-        
-        content_patterns = {
-            'person': ['person', 'people', 'individual', 'name', 'author'],
-            'organization': ['company', 'organization', 'corp', 'university'],
-            'location': ['city', 'country', 'state', 'region', 'place'],
-            'technology': ['software', 'system', 'platform', 'tool'],
-            'concept': ['concept', 'idea', 'theory', 'method']
-        }
-        
-        for pattern_name, keywords in content_patterns.items():
-            if any(keyword in sample_text for keyword in keywords):
-                edges.append((pattern_name, pattern_name))
-        
-        # Default fallback
-        if not edges:
-            edges = [("source", "source"), ("content_type", "content_type")]
-            
-        return edges
-    
     def get_detected_relationships(self) -> List[str]:
         """Get list of detected relationships for display"""
-        if not self.vector_store or not self.traversal_retriever:
+        if not self.graph_index:
             return []
-            
-        if hasattr(self.traversal_retriever, 'edges'):
-            return [f"{edge[0]} ↔ {edge[1]}" for edge in self.traversal_retriever.edges]
-        return []
+        
+        return [f"{edge[0]} ↔ {edge[1]}" for edge in self.graph_index.edges]
+    
+    def get_index_stats(self) -> Dict[str, Any]:
+        """Get graph index build statistics (embedding reuse, edge count)"""
+        return dict(self.graph_index.stats) if self.graph_index else {}
     
     def format_docs(self, docs: List[Document]) -> str:
         return "\n\n".join(f"Content: {doc.page_content}\nMetadata: {doc.metadata}" for doc in docs)
@@ -235,7 +172,7 @@ class GraphRAGSystem:
     def query(self, question: str, retriever_type: RetrieverType = RetrieverType.TRAVERSAL, return_details: bool = False) -> str | Dict[str, Any]:
         print(f"Starting query: {question}")
         
-        if not self.vector_store:
+        if not self.graph_index:
             raise ValueError("System not initialized. Please load documents first.")
         
         try:
@@ -250,7 +187,8 @@ class GraphRAGSystem:
                 print("Using standard retriever")
             else:  # HYBRID - agentic routing
                 retriever, routing_info = self._get_agentic_retriever(question)
-                print(f"Using agentic router: {routing_info['strategy']} (confidence: {routing_info['confidence']:.2f})")
+                print(f"Using agentic router: {routing_info['strategy']} via {routing_info['tier']} "
+                      f"(confidence: {routing_info['confidence']:.2f}, {routing_info['latency_ms']:.1f} ms)")
                 print(f"Reasoning: {routing_info['reasoning']}")
             
             if not retriever:
@@ -336,3 +274,10 @@ class GraphRAGSystem:
             raise ValueError("Agentic router not initialized. Please load documents first.")
         
         return self.agentic_router.get_routing_explanation(question)
+    
+    def get_routing_metrics(self) -> Dict[str, Any]:
+        """Get routing tier counts, latency and decision cache usage"""
+        if not self.agentic_router:
+            return {}
+        
+        return self.agentic_router.get_routing_metrics()
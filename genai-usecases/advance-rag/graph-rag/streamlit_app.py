@@ -477,6 +477,9 @@ def main():
                     st.markdown("**📊 Decision Metrics**")
                     st.metric("Selected Strategy", query_details["routing_info"]["strategy"].title())
                     st.metric("Confidence Score", f"{query_details['routing_info']['confidence']:.2f}")
+                    if "tier" in query_details["routing_info"]:
+                        st.metric("Routing Tier", query_details["routing_info"]["tier"].title())
+                        st.metric("Routing Latency", f"{query_details['routing_info']['latency_ms']:.1f} ms")
                 
                 with router_col2:
                     st.markdown("**🧠 Decision Reasoning**")
@@ -629,6 +632,19 @@ def main():
                 st.subheader("🔍 Retriever Usage")
                 for retriever, count in retriever_usage.items():
                     st.metric(retriever, count)
+            
+            routing_metrics = st.session_state.rag.get_routing_metrics() if st.session_state.rag else {}
+            if routing_metrics.get("total_routes"):
+                st.subheader("🤖 Router Tiers")
+                st.dataframe(pd.DataFrame([
+                    {
+                        "Tier": tier,
+                        "Routes": metrics["count"],
+                        "Share": f"{metrics['share']:.0%}",
+                        "Avg Latency (ms)": round(metrics["avg_ms"], 2),
+                        "Max Latency (ms)": round(metrics["max_ms"], 2)
+                    } for tier, metrics in routing_metrics["tiers"].items()
+                ]), width="stretch")
         
         with col2:
             st.subheader("⚙️ Current Configuration")
@@ -0,0 +1,41 @@
+"""Tests for the on-disk embedding store used by the graph index"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("langchain_core")
+
+from graph_index import EmbeddingStore
+
+
+def fake_embed(calls):
+    def embed_documents(texts):
+        calls.append(list(texts))
+        return [[float(len(text)), float(ord(text[0]))] for text in texts]
+    return embed_documents
+
+
+def test_duplicate_text_in_one_batch_is_embedded_once(tmp_path):
+    calls = []
+    store = EmbeddingStore(str(tmp_path), "test-model")
+
+    vectors, embedded = store.get_or_embed(["a", "b", "a"], ["alpha", "be", "alpha"], fake_embed(calls))
+
+    assert calls == [["alpha", "be"]]
+    assert embedded == 2
+    np.testing.assert_array_equal(vectors[0], vectors[2])
+    np.testing.assert_array_equal(vectors[1], [2.0, ord("b")])
+
+
+def test_rows_stay_aligned_across_batches_and_reload(tmp_path):
+    calls = []
+    store = EmbeddingStore(str(tmp_path), "test-model")
+    store.get_or_embed(["a", "a"], ["alpha", "alpha"], fake_embed(calls))
+    store.get_or_embed(["b", "a", "c", "b"], ["be", "alpha", "cee", "be"], fake_embed(calls))
+
+    reloaded = EmbeddingStore(str(tmp_path), "test-model")
+    vectors, embedded = reloaded.get_or_embed(["c", "b", "a"], ["cee", "be", "alpha"], fake_embed(calls))
+
+    assert embedded == 0
+    assert calls == [["alpha"], ["be", "cee"]]
+    np.testing.assert_array_equal(vectors, [[3.0, ord("c")], [2.0, ord("b")], [5.0, ord("a")]])
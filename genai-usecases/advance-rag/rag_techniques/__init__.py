@@ -7,4 +7,7 @@ This package contains various RAG (Retrieval-Augmented Generation) implementatio
 - Corrective RAG
 - Hybrid Search RAG
 - Re-ranking RAG
+
+Shared helpers:
+- pdf_ingestion: streaming PDF ingestion (in-memory, batched embeddings)
 """
\ No newline at end of file
@@ -1,11 +1,8 @@
 import streamlit as st
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
-from langchain_community.vectorstores import Chroma
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import PyPDFLoader
-import tempfile
 import os
 import nest_asyncio
+from pdf_ingestion import StreamingPDFIngestor, streamlit_progress
 # Apply the patch to allow nested event loops
 nest_asyncio.apply()
 
@@ -33,27 +30,16 @@ class PDFRAG:
         self.chunk_overlap = chunk_overlap  
         
     
-    def load_pdfs(self, pdf_files):
-        all_docs = []
-        for pdf_file in pdf_files:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                tmp_file.write(pdf_file.read())
-                tmp_file_path = tmp_file.name
-            
-            # Load PDF
-            loader = PyPDFLoader(tmp_file_path)
-            docs = loader.load()
-            all_docs.extend([doc.page_content for doc in docs])
-            
-            # Clean up temp file
-            os.unlink(tmp_file_path)
-        
-        # Create vector store
-        text_splitter = RecursiveCharacterTextSplitter(chunk_size=self.chunk_size, chunk_overlap=self.chunk_overlap)
-        texts = text_splitter.create_documents(all_docs)
-        
-        self.vectorstore = Chroma.from_documents(texts, self.embeddings)
+    def load_pdfs(self, pdf_files, progress_callback=None):
+        # Stream pages from the in-memory uploads, chunk and embed in batches
+        ingestor = StreamingPDFIngestor(
+            self.embeddings,
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            progress_callback=progress_callback
+        )
+        self.vectorstore, _ = ingestor.ingest(pdf_files, keep_chunks=False)
+        self.ingestion_stats = ingestor.stats
         self.retriever = self.vectorstore.as_retriever(search_kwargs={"k": 4})
 
     def generate_answer(self, query, context):
@@ -120,7 +106,7 @@ if st.button("Ask"):
         try:
             with st.spinner("Processing PDFs..."):
                 rag = PDFRAG(model_name, temperature, chunk_size, chunk_overlap)
-                rag.load_pdfs(uploaded_files)
+                rag.load_pdfs(uploaded_files, progress_callback=streamlit_progress(st.progress(0.0)))
                 answer = rag.run(query)
             
             st.write(answer)
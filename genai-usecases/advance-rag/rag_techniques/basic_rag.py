@@ -1,12 +1,9 @@
 import streamlit as st
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
-from langchain_community.vectorstores import Chroma
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.prompts import ChatPromptTemplate
-from langchain_community.document_loaders import PyPDFLoader
-import tempfile
 import os
 import nest_asyncio
+from pdf_ingestion import StreamingPDFIngestor, streamlit_progress
 
 # Apply the patch to allow nested event loops
 nest_asyncio.apply()
@@ -38,36 +35,17 @@ class BasicRAG:
         self.chunk_overlap = chunk_overlap
         self.top_k = top_k
         
-    def load_pdfs(self, pdf_files):
-        all_docs = []
-        for pdf_file in pdf_files:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                tmp_file.write(pdf_file.read())
-                tmp_file_path = tmp_file.name
-            
-            # Load PDF
-            loader = PyPDFLoader(tmp_file_path)
-            docs = loader.load()
-            all_docs.extend([doc.page_content for doc in docs])
-            
-            # Clean up temp file
-            os.unlink(tmp_file_path)
-        
-        # Create text splitter
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.chunk_size, 
-            chunk_overlap=self.chunk_overlap
+    def load_pdfs(self, pdf_files, progress_callback=None):
+        # Stream pages from the in-memory uploads, chunk and embed in batches
+        ingestor = StreamingPDFIngestor(
+            self.embeddings,
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            progress_callback=progress_callback
         )
-        texts = text_splitter.create_documents(all_docs)
-        
-        # Add unique IDs to each text chunk
-        for idx, text in enumerate(texts):
-            text.metadata["id"] = idx
-        
-        # Create vector store and retriever
-        self.vectorstore = Chroma.from_documents(texts, self.embeddings)
+        self.vectorstore, texts = ingestor.ingest(pdf_files)
         self.retriever = self.vectorstore.as_retriever(search_kwargs={"k": self.top_k})
+        self.ingestion_stats = ingestor.stats
         
         # Store chunks for display
         self.chunks = texts
@@ -267,7 +245,7 @@ if st.button("Ask"):
         try:
             with st.spinner("Processing PDFs and running Basic RAG..."):
                 rag = BasicRAG(model_name, temperature, chunk_size, chunk_overlap, top_k)
-                rag.load_pdfs(uploaded_files)
+                rag.load_pdfs(uploaded_files, progress_callback=streamlit_progress(st.progress(0.0)))
                 result = rag.run(query)
             
             # Display results in tabs
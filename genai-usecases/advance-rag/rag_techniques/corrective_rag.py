@@ -1,12 +1,9 @@
 import streamlit as st
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
-from langchain_community.vectorstores import Chroma
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.prompts import ChatPromptTemplate
-from langchain_community.document_loaders import PyPDFLoader
-import tempfile
 import os
 import nest_asyncio
+from pdf_ingestion import StreamingPDFIngestor, streamlit_progress
 
 # Apply the patch to allow nested event loops
 nest_asyncio.apply()
@@ -34,30 +31,16 @@ class CorrectiveRAG:
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap  
         
-    def load_pdfs(self, pdf_files):
-        all_docs = []
-        for pdf_file in pdf_files:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                tmp_file.write(pdf_file.read())
-                tmp_file_path = tmp_file.name
-            
-            # Load PDF
-            loader = PyPDFLoader(tmp_file_path)
-            docs = loader.load()
-            all_docs.extend([doc.page_content for doc in docs])
-            
-            # Clean up temp file
-            os.unlink(tmp_file_path)
-        
-        # Create vector store
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.chunk_size, 
-            chunk_overlap=self.chunk_overlap
+    def load_pdfs(self, pdf_files, progress_callback=None):
+        # Stream pages from the in-memory uploads, chunk and embed in batches
+        ingestor = StreamingPDFIngestor(
+            self.embeddings,
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            progress_callback=progress_callback
         )
-        texts = text_splitter.create_documents(all_docs)
-        
-        self.vectorstore = Chroma.from_documents(texts, self.embeddings)
+        self.vectorstore, _ = ingestor.ingest(pdf_files, keep_chunks=False)
+        self.ingestion_stats = ingestor.stats
 
     def corrective_rag(self, query):
         # Initial retrieval
@@ -176,7 +159,7 @@ if st.button("Ask"):
         try:
             with st.spinner("Processing PDFs and running Corrective RAG..."):
                 rag = CorrectiveRAG(model_name, temperature, chunk_size, chunk_overlap)
-                rag.load_pdfs(uploaded_files)
+                rag.load_pdfs(uploaded_files, progress_callback=streamlit_progress(st.progress(0.0)))
                 result = rag.run(query)
             
             # Display results in tabs
@@ -1,14 +1,11 @@
 import streamlit as st
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
-from langchain_community.vectorstores import Chroma
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.prompts import PromptTemplate
-from langchain_community.document_loaders import PyPDFLoader
 from langchain_community.retrievers import BM25Retriever
 from langchain.retrievers import EnsembleRetriever
-import tempfile
 import os
 import nest_asyncio
+from pdf_ingestion import StreamingPDFIngestor, streamlit_progress
 
 # Apply the patch to allow nested event loops
 nest_asyncio.apply()
@@ -41,41 +38,24 @@ class HybridSearchRAG:
         self.bm25_weight = bm25_weight
         self.vector_weight = vector_weight
         
-    def load_pdfs(self, pdf_files):
-        all_docs = []
-        for pdf_file in pdf_files:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                tmp_file.write(pdf_file.read())
-                tmp_file_path = tmp_file.name
-            
-            # Load PDF
-            loader = PyPDFLoader(tmp_file_path)
-            docs = loader.load()
-            all_docs.extend([doc.page_content for doc in docs])
-            
-            # Clean up temp file
-            os.unlink(tmp_file_path)
-        
-        # Create chunks
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.chunk_size, 
-            chunk_overlap=self.chunk_overlap
+    def load_pdfs(self, pdf_files, progress_callback=None):
+        # Stream pages from the in-memory uploads, chunk and embed in batches
+        ingestor = StreamingPDFIngestor(
+            self.embeddings,
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            progress_callback=progress_callback
         )
-        self.chunks = text_splitter.create_documents(all_docs)
-        
-        # Add metadata IDs to chunks
-        for idx, chunk in enumerate(self.chunks):
-            chunk.metadata["id"] = idx
+        self.vectorstore, self.chunks = ingestor.ingest(pdf_files)
+        self.ingestion_stats = ingestor.stats
         
         # Create retrievers
         self.create_retrievers()
 
     def create_retrievers(self):
         """Create vector store and BM25 retrievers, then combine them"""
-        # Create vector store retriever
-        vectorstore = Chroma.from_documents(self.chunks, self.embeddings)
-        vector_retriever = vectorstore.as_retriever(search_kwargs={"k": 5})
+        # Create vector store retriever from the already-embedded store
+        vector_retriever = self.vectorstore.as_retriever(search_kwargs={"k": 5})
         
         # Create BM25 retriever
         bm25_retriever = BM25Retriever.from_documents(self.chunks)
@@ -309,7 +289,7 @@ if st.button("Ask"):
         try:
             with st.spinner("Processing PDFs and running Hybrid Search RAG..."):
                 rag = HybridSearchRAG(model_name, temperature, chunk_size, chunk_overlap, bm25_weight, vector_weight)
-                rag.load_pdfs(uploaded_files)
+                rag.load_pdfs(uploaded_files, progress_callback=streamlit_progress(st.progress(0.0)))
                 result = rag.run(query)
             
             # Display results in tabs
@@ -0,0 +1,221 @@
+"""
+Streaming PDF ingestion shared by the RAG technique apps.
+
+Uploaded PDFs are read straight from their in-memory buffers page by page,
+split into chunks as each page is read, and added to a Chroma vector store
+in bounded concurrent batches. Every chunk gets a stable id derived from the
+file hash, page number and chunk position, and files whose chunks are
+already in the store (same content hash and chunking) are reused instead of
+being embedded again.
+"""
+import hashlib
+import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain.schema import Document
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_community.vectorstores import Chroma
+from pypdf import PdfReader
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _as_buffer(pdf_file):
+    """Return a seekable binary buffer for an uploaded file, path or raw bytes"""
+    if isinstance(pdf_file, (bytes, bytearray)):
+        return io.BytesIO(pdf_file)
+    if isinstance(pdf_file, str):
+        return open(pdf_file, "rb")
+    if hasattr(pdf_file, "seek"):
+        pdf_file.seek(0)
+        return pdf_file
+    return io.BytesIO(pdf_file.read())
+
+
+def file_hash(buffer):
+    """SHA-256 of a binary buffer, read in blocks and rewound afterwards"""
+    digest = hashlib.sha256()
+    buffer.seek(0)
+    for block in iter(lambda: buffer.read(HASH_BLOCK_SIZE), b""):
+        digest.update(block)
+    buffer.seek(0)
+    return digest.hexdigest()
+
+
+def iter_pdf_pages(buffer):
+    """Yield (page_number, text) pairs without materialising the whole document"""
+    reader = PdfReader(buffer)
+    for page_number, page in enumerate(reader.pages, start=1):
+        yield page_number, page.extract_text() or ""
+
+
+class StreamingPDFIngestor:
+    def __init__(self, embeddings, chunk_size, chunk_overlap, batch_size=32, max_concurrency=4,
+                 progress_callback=None):
+        self.embeddings = embeddings
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.progress_callback = progress_callback
+        self.text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap
+        )
+        self.chunking = f"{chunk_size}/{chunk_overlap}"
+        self.stats = {
+            "files_total": 0,
+            "files_processed": 0,
+            "duplicates_skipped": 0,
+            "pages": 0,
+            "chunks": 0,
+            "chunks_embedded": 0,
+            "chunks_reused": 0
+        }
+
+    def _report(self, stage):
+        if self.progress_callback:
+            self.progress_callback(stage, dict(self.stats))
+
+    def _stored_chunks(self, vectorstore, digest):
+        """Chunks of a file already in the store, or [] when it has to be (re-)embedded
+
+        Chunks stored with a different chunk size or overlap are deleted so the
+        file is not indexed twice under two chunkings.
+        """
+        if vectorstore is None:
+            return []
+        stored = vectorstore.get(where={"file_hash": digest}, include=["documents", "metadatas"])
+        if not stored["ids"]:
+            return []
+        if any(metadata.get("chunking") != self.chunking for metadata in stored["metadatas"]):
+            vectorstore.delete(ids=stored["ids"])
+            return []
+        chunks = [Document(page_content=text, metadata=metadata)
+                  for text, metadata in zip(stored["documents"], stored["metadatas"])]
+        chunks.sort(key=lambda doc: (doc.metadata["page"], doc.metadata["chunk_index"]))
+        return chunks
+
+    def iter_chunks(self, pdf_files, vectorstore=None):
+        """Yield (chunk, stored) pairs one page at a time
+
+        Files repeated within ``pdf_files`` are skipped, and files already in
+        ``vectorstore`` yield their stored chunks with ``stored=True`` so they
+        are not embedded again.
+        """
+        pdf_files = list(pdf_files)
+        self.stats["files_total"] += len(pdf_files)
+        seen_hashes = set()
+
+        for pdf_file in pdf_files:
+            buffer = _as_buffer(pdf_file)
+            try:
+                digest = file_hash(buffer)
+                if digest in seen_hashes:
+                    self.stats["duplicates_skipped"] += 1
+                    self._report("duplicate")
+                    continue
+                seen_hashes.add(digest)
+
+                stored = self._stored_chunks(vectorstore, digest)
+                if stored:
+                    self.stats["duplicates_skipped"] += 1
+                    self.stats["chunks"] += len(stored)
+                    self.stats["chunks_reused"] += len(stored)
+                    self._report("duplicate")
+                    for chunk in stored:
+                        yield chunk, True
+                    continue
+
+                source = getattr(pdf_file, "name", None) or (pdf_file if isinstance(pdf_file, str) else digest[:12])
+                for page_number, page_text in iter_pdf_pages(buffer):
+                    self.stats["pages"] += 1
+                    for chunk_index, chunk_text in enumerate(self.text_splitter.split_text(page_text)):
+                        self.stats["chunks"] += 1
+                        yield Document(
+                            page_content=chunk_text,
+                            metadata={
+                                "id": f"{digest[:16]}-p{page_number}-c{chunk_index}",
+                                "source": source,
+                                "file_hash": digest,
+                                "chunking": self.chunking,
+                                "page": page_number,
+                                "chunk_index": chunk_index
+                            }
+                        ), False
+            finally:
+                if isinstance(pdf_file, str):
+                    buffer.close()
+
+            self.stats["files_processed"] += 1
+            self._report("file")
+
+    @staticmethod
+    def _keep(pairs, chunks):
+        """Collect every chunk into ``chunks`` (if given) and pass on the ones to embed"""
+        for chunk, stored in pairs:
+            if chunks is not None:
+                chunks.append(chunk)
+            if not stored:
+                yield chunk
+
+    def _iter_batches(self, chunks):
+        batch = []
+        for chunk in chunks:
+            batch.append(chunk)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _add_batch(vectorstore, batch):
+        # Chroma embeds and upserts by id, so re-adding a chunk overwrites it
+        vectorstore.add_documents(batch, ids=[doc.metadata["id"] for doc in batch])
+        return batch
+
+    def _record_added(self, batch):
+        self.stats["chunks_embedded"] += len(batch)
+        self._report("embedded")
+
+    def ingest(self, pdf_files, vectorstore=None, keep_chunks=True):
+        """Stream PDFs into a Chroma store; returns (vectorstore, chunks)
+
+        At most ``max_concurrency`` embedding batches are in flight at once, so
+        memory stays bounded by the batch window rather than the corpus size.
+        Files already in ``vectorstore`` are returned from the store without
+        being embedded again. Pass ``keep_chunks=False`` when the caller does not need the chunk list
+        (e.g. no BM25 index or chunk preview).
+        """
+        if vectorstore is None:
+            vectorstore = Chroma(embedding_function=self.embeddings)
+
+        chunks = []
+        new_chunks = self._keep(self.iter_chunks(pdf_files, vectorstore), chunks if keep_chunks else None)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for batch in self._iter_batches(new_chunks):
+                if len(pending) >= self.max_concurrency:
+                    self._record_added(pending.popleft().result())
+                pending.append(executor.submit(self._add_batch, vectorstore, batch))
+
+            while pending:
+                self._record_added(pending.popleft().result())
+
+        self._report("done")
+        return vectorstore, chunks
+
+
+def streamlit_progress(progress_bar):
+    """Build a progress callback that drives an ``st.progress`` element"""
+    def callback(stage, stats):
+        total = stats["files_total"] or 1
+        done = stats["files_processed"] + stats["duplicates_skipped"]
+        text = (f"Files {done}/{stats['files_total']} · pages {stats['pages']} · "
+                f"chunks embedded {stats['chunks_embedded']}/{stats['chunks'] - stats['chunks_reused']}")
+        if stats["chunks_reused"]:
+            text += f" · chunks reused {stats['chunks_reused']}"
+        if stats["duplicates_skipped"]:
+            text += f" · duplicates skipped {stats['duplicates_skipped']}"
+        progress_bar.progress(min(done / total, 1.0), text=text)
+    return callback
@@ -1,13 +1,10 @@
 import streamlit as st
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
-from langchain_community.vectorstores import Chroma
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.prompts import ChatPromptTemplate
-from langchain_community.document_loaders import PyPDFLoader
 from langchain.retrievers import ContextualCompressionRetriever
-import tempfile
 import os
 import nest_asyncio
+from pdf_ingestion import StreamingPDFIngestor, streamlit_progress
 
 # Apply the patch to allow nested event loops
 nest_asyncio.apply()
@@ -39,34 +36,16 @@ class ReRankingRAG:
         self.chunk_overlap = chunk_overlap
         self.reranker_type = reranker_type
         
-    def load_pdfs(self, pdf_files):
-        all_docs = []
-        for pdf_file in pdf_files:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                tmp_file.write(pdf_file.read())
-                tmp_file_path = tmp_file.name
-            
-            # Load PDF
-            loader = PyPDFLoader(tmp_file_path)
-            docs = loader.load()
-            all_docs.extend([doc.page_content for doc in docs])
-            
-            # Clean up temp file
-            os.unlink(tmp_file_path)
-        
-        # Create vector store
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.chunk_size, 
-            chunk_overlap=self.chunk_overlap
+    def load_pdfs(self, pdf_files, progress_callback=None):
+        # Stream pages from the in-memory uploads, chunk and embed in batches
+        ingestor = StreamingPDFIngestor(
+            self.embeddings,
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            progress_callback=progress_callback
         )
-        texts = text_splitter.create_documents(all_docs)
-        
-        # Add metadata IDs to chunks
-        for idx, chunk in enumerate(texts):
-            chunk.metadata["id"] = idx
-        
-        self.vectorstore = Chroma.from_documents(texts, self.embeddings)
+        self.vectorstore, _ = ingestor.ingest(pdf_files, keep_chunks=False)
+        self.ingestion_stats = ingestor.stats
 
     def get_reranker_compressor(self):
         """Get the appropriate reranker based on selection"""
@@ -315,7 +294,7 @@ if st.button("Ask"):
         try:
             with st.spinner(f"Processing PDFs and running Re-ranking RAG with {reranker_type}..."):
                 rag = ReRankingRAG(model_name, temperature, chunk_size, chunk_overlap, reranker_type)
-                rag.load_pdfs(uploaded_files)
+                rag.load_pdfs(uploaded_files, progress_callback=streamlit_progress(st.progress(0.0)))
                 result = rag.run(query)
             
             # Display results in tabs
@@ -7,62 +7,39 @@ Centralized interface for all agentic AI implementations
 - Multi-agent orchestration with cross framework integration
 """
 
+import time
+_SCRIPT_START = time.perf_counter()
+
 import streamlit as st
 import sys
 import asyncio
 from pathlib import Path
 
-# Add paths for imports
+# Component modules are imported lazily by the registry when their page is selected
 current_dir = Path(__file__).parent
 sys.path.append(str(current_dir))
-sys.path.append(str(current_dir / "agentic_frameworks" / "crewai" / "data_analysis_crew"))
-sys.path.append(str(current_dir / "agentic_frameworks" / "crewai" / "content_creation_crew"))
-sys.path.append(str(current_dir / "agentic_frameworks" / "crewai" / "research_assistant_crew"))
-sys.path.append(str(current_dir / "agentic_frameworks" / "crewai" / "code_review_crew"))
-sys.path.append(str(current_dir / "agentic_frameworks" / "langgraph"))
-sys.path.append(str(current_dir / "agentic_workflows"))
-sys.path.append(str(current_dir / "multi_agent_orchestration"))
-
-# Import platform implementations
-try:
-    from data_analysis_crew import render_crew_interface
-    from content_creation_crew import render_content_crew_interface
-    from research_assistant_crew import render_research_crew_interface
-    from code_review_crew import render_code_review_interface
-    crewai_available = True
-except ImportError as e:
-    crewai_available = False
-    crewai_error = str(e)
-
-try:
-    from customer_support_agent import render_customer_support_interface
-    from document_processing_pipeline import render_document_processing_interface
-    from task_planning_system import render_task_planning_interface
-    langgraph_available = True
-except ImportError as e:
-    langgraph_available = False
-    langgraph_error = str(e)
-
-# Individual workflow pattern imports
-try:
-    from prompt_chaining import render_prompt_chaining_interface
-    from query_routing import render_query_routing_interface
-    from parallel_execution import render_parallel_execution_interface
-    from event_driven import render_event_driven_interface
-    from tool_orchestration import render_tool_orchestration_interface
-    individual_workflows_available = True
-except ImportError as e:
-    individual_workflows_available = False
-    individual_workflows_error = str(e)
-
-try:
-    from multi_agent_orchestration import render_orchestration_interface
-    orchestration_available = True
-except ImportError as e:
-    orchestration_available = False
-    orchestration_error = str(e)
-
-def render_welcome_page():
+
+from component_registry import ComponentRegistry, COMPONENTS, profile_imports, summarize_profile
+
+
+_PRELUDE_MS = (time.perf_counter() - _SCRIPT_START) * 1000
+
+
+@st.cache_resource
+def get_component_registry() -> ComponentRegistry:
+    """Registry shared across reruns and sessions, so each component is imported once per process"""
+    return ComponentRegistry()
+
+
+@st.cache_data(show_spinner=False)
+def get_import_profile(module: str, mtime: float) -> dict:
+    """Cold-import profile of a component, cached until its source file changes"""
+    spec = next(spec for spec in COMPONENTS if spec.module == module)
+    profile = profile_imports(spec)
+    return {"profile": profile, "summary": summarize_profile(profile, top=15)}
+
+
+def render_welcome_page(registry: ComponentRegistry):
     """Render the welcome page with feature overview"""
     st.title("Agentic AI Learning")
 
@@ -74,19 +51,19 @@ def render_welcome_page():
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        status = "✅" if crewai_available else "❌"
+        status = "✅" if registry.framework_available("CrewAI") else "❌"
         st.metric("CrewAI", status, "Framework")
 
     with col2:
-        status = "✅" if langgraph_available else "❌"
+        status = "✅" if registry.framework_available("LangGraph") else "❌"
         st.metric("LangGraph", status, "Framework")
 
     with col3:
-        status = "✅" if individual_workflows_available else "❌"
+        status = "✅" if registry.framework_available("Workflows") else "❌"
         st.metric("Advanced Workflows", status, "Patterns")
 
     with col4:
-        status = "✅" if orchestration_available else "❌"
+        status = "✅" if registry.framework_available("Orchestration") else "❌"
         st.metric("Orchestration", status, "Multi-Agent")
 
     # Feature overview
@@ -191,6 +168,9 @@ def render_welcome_page():
 
     # Multi-Agent Orchestration:
     streamlit run multi_agent_orchestration\\multi_agent_orchestration.py                  # Advanced Orchestration
+
+    # Import-time profile of every component:
+    python component_registry.py --top 15
     """, language="bash")
 
 def render_error_page(component_name: str, error_message: str):
@@ -262,6 +242,65 @@ def render_error_page(component_name: str, error_message: str):
 
     st.info("💡 **Tip**: Try running the individual component files directly to get more specific error messages.")
 
+def render_diagnostics_page(registry: ComponentRegistry):
+    """Render component load status and import-time profiles"""
+    st.title("🩺 Platform Diagnostics")
+
+    st.markdown("""
+    Components are imported the first time their page is opened and then stay loaded for later reruns.
+    Profiles run a cold import in a separate interpreter with `python -X importtime`.
+    """)
+
+    rows = registry.status()
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Components Loaded", f"{sum(row['Status'] == 'loaded' for row in rows)}/{len(rows)}")
+    with col2:
+        st.metric("Modules in Process", len(sys.modules))
+    with col3:
+        st.metric("Script Prelude", f"{_PRELUDE_MS:.0f} ms")
+
+    st.subheader("📦 Component Status")
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    st.subheader("⏱️ Import-Time Profile")
+    specs = {spec.title: spec for spec in COMPONENTS}
+    selected = st.selectbox("Component", list(specs), key="diagnostics_component")
+    spec = specs[selected]
+
+    if st.button("Profile imports", type="primary"):
+        source = current_dir / spec.path / f"{spec.module}.py"
+        mtime = source.stat().st_mtime if source.exists() else 0.0
+        with st.spinner(f"Importing {spec.module} in a fresh interpreter..."):
+            result = get_import_profile(spec.module, mtime)
+
+        profile, summary = result["profile"], result["summary"]
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Cold Import", f"{summary['total_ms']:.0f} ms")
+        with col2:
+            st.metric("Modules Imported", summary["module_count"])
+
+        if not profile["ok"]:
+            st.error("Import failed; timings cover the modules loaded before the error")
+            with st.expander("🔍 Error Details", expanded=False):
+                st.code(profile["error"], language="python")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**Slowest Modules (self time)**")
+            st.dataframe(
+                [{"Module": row["module"], "Self (ms)": row["self_ms"], "Cumulative (ms)": row["cumulative_ms"]}
+                 for row in summary["slowest_modules"]],
+                use_container_width=True, hide_index=True
+            )
+        with col2:
+            st.markdown("**Time per Package**")
+            st.dataframe(
+                [{"Package": row["package"], "Self (ms)": row["self_ms"]} for row in summary["packages"]],
+                use_container_width=True, hide_index=True
+            )
+
 def main():
     """Main application entry point"""
     st.set_page_config(
@@ -271,28 +310,15 @@ def main():
         initial_sidebar_state="expanded"
     )
 
+    registry = get_component_registry()
+
     # Sidebar navigation
     with st.sidebar:
         st.subheader("Multi-Agent AI")
 
         page = st.selectbox(
             "Choose Component",
-            [
-                "🏠 Platform Overview",
-                "📊 CrewAI - Data Analysis",
-                "✍️ CrewAI - Content Creation",
-                "🔬 CrewAI - Research Assistant",
-                "👨‍💻 CrewAI - Code Review",
-                "🎧 LangGraph - Customer Support",
-                "📄 LangGraph - Document Processing",
-                "🗂️ LangGraph - Task Planning",
-                "🔗 Workflow - Prompt Chaining",
-                "🎯 Workflow - Query Routing",
-                "⚡ Workflow - Parallel Execution",
-                "📡 Workflow - Event-Driven",
-                "🛠️ Workflow - Tool Orchestration",
-                "🌟 Multi-Agent Orchestration"
-            ],
+            ["🏠 Platform Overview"] + registry.pages() + ["🩺 Diagnostics"],
             key='page_selection'
         )
 
@@ -300,85 +326,23 @@ def main():
 
     # Main content based on selection
     if page == "🏠 Platform Overview":
-        render_welcome_page()
-
-    elif page == "📊 CrewAI - Data Analysis":
-        if crewai_available:
-            render_crew_interface()
-        else:
-            render_error_page("CrewAI - Data Analysis", crewai_error)
+        render_welcome_page(registry)
 
-    elif page == "✍️ CrewAI - Content Creation":
-        if crewai_available:
-            render_content_crew_interface()
-        else:
-            render_error_page("CrewAI - Content Creation", crewai_error)
-
-    elif page == "🔬 CrewAI - Research Assistant":
-        if crewai_available:
-            render_research_crew_interface()
-        else:
-            render_error_page("CrewAI - Research Assistant", crewai_error)
-
-    elif page == "👨‍💻 CrewAI - Code Review":
-        if crewai_available:
-            render_code_review_interface()
-        else:
-            render_error_page("CrewAI - Code Review", crewai_error)
-
-    elif page == "🎧 LangGraph - Customer Support":
-        if langgraph_available:
-            render_customer_support_interface()
-        else:
-            render_error_page("LangGraph - Customer Support", langgraph_error)
+    elif page == "🩺 Diagnostics":
+        render_diagnostics_page(registry)
 
-    elif page == "📄 LangGraph - Document Processing":
-        if langgraph_available:
-            render_document_processing_interface()
-        else:
-            render_error_page("LangGraph - Document Processing", langgraph_error)
-
-    elif page == "🗂️ LangGraph - Task Planning":
-        if langgraph_available:
-            render_task_planning_interface()
-        else:
-            render_error_page("LangGraph - Task Planning", langgraph_error)
-
-    elif page == "🔗 Workflow - Prompt Chaining":
-        if individual_workflows_available:
-            render_prompt_chaining_interface()
-        else:
-            render_error_page("Workflow - Prompt Chaining", individual_workflows_error)
-
-    elif page == "🎯 Workflow - Query Routing":
-        if individual_workflows_available:
-            render_query_routing_interface()
-        else:
-            render_error_page("Workflow - Query Routing", individual_workflows_error)
-
-    elif page == "⚡ Workflow - Parallel Execution":
-        if individual_workflows_available:
-            render_parallel_execution_interface()
-        else:
-            render_error_page("Workflow - Parallel Execution", individual_workflows_error)
-
-    elif page == "📡 Workflow - Event-Driven":
-        if individual_workflows_available:
-            render_event_driven_interface()
-        else:
-            render_error_page("Workflow - Event-Driven", individual_workflows_error)
-
-    elif page == "🛠️ Workflow - Tool Orchestration":
-        if individual_workflows_available:
-            render_tool_orchestration_interface()
-        else:
-            render_error_page("Workflow - Tool Orchestration", individual_workflows_error)
+    else:
+        spec = registry.spec(page)
+        try:
+            render = registry.load(page)
+        except ImportError as e:
+            render_error_page(spec.title, str(e))
+            return
 
-    elif page == "🌟 Multi-Agent Orchestration":
-        if orchestration_available:
-            asyncio.run(render_orchestration_interface())
+        if spec.is_async:
+            asyncio.run(render())
         else:
-            render_error_page("Multi-Agent Orchestration", orchestration_error)
+            render()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
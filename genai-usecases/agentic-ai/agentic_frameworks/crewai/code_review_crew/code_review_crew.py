@@ -7,6 +7,7 @@ Features:
 - Code quality assessment
 - Best practices enforcement
 - Documentation review
+- Repository-wide static analysis with line-level findings (see static_analysis.py)
 """
 
 import streamlit as st
@@ -14,6 +15,7 @@ import yaml
 import json
 import os
 import re
+import sys
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
@@ -24,6 +26,13 @@ from crewai import Agent, Task, Crew, LLM, Process
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+# Rule engine lives in its own module so process-pool workers can import it without Streamlit/CrewAI
+from static_analysis import get_rule_engine, scan_repository, flagged_snippets, ScanCache
+
+# Shared background execution service (agentic_frameworks/crewai/crew_execution.py)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from crew_execution import get_crew_execution_service, config_fingerprint, render_crew_run, render_execution_metrics
+
 
 load_dotenv()
 
@@ -70,27 +79,17 @@ class SecurityAnalyzerTool(BaseTool):
             str: JSON formatted security analysis report
         """
         try:
-            # Simulate security analysis
+            # Precompiled rule engine: one scan gives every finding with its line and column
+            engine = get_rule_engine()
             security_issues = []
 
-            # Common security patterns to check
-            security_patterns = {
-                "SQL Injection": r"(SELECT|INSERT|UPDATE|DELETE).*(\+|\|\|)",
-                "XSS Vulnerability": r"innerHTML|outerHTML|document\.write",
-                "Hardcoded Secrets": r"(password|secret|key|token)\s*=\s*['\"][^'\"]{8,}['\"]",
-                "Command Injection": r"exec|system|shell_exec|eval",
-                "Insecure Random": r"Math\.random|Random\(\)",
-                "Weak Cryptography": r"MD5|SHA1(?!SHA256|SHA512)"
-            }
-
-            for issue_type, pattern in security_patterns.items():
-                if re.search(pattern, code, re.IGNORECASE):
-                    security_issues.append({
-                        "type": issue_type,
-                        "severity": "Medium" if "Injection" in issue_type else "Low",
-                        "description": f"Potential {issue_type.lower()} vulnerability detected",
-                        "recommendation": f"Review and secure {issue_type.lower()} implementation"
-                    })
+            for issue in engine.summarize(engine.scan(code, language=language), "security"):
+                issue_type = issue["type"]
+                security_issues.append({
+                    **issue,
+                    "description": f"Potential {issue_type.lower()} vulnerability detected",
+                    "recommendation": f"Review and secure {issue_type.lower()} implementation"
+                })
 
             analysis = {
                 "language": language,
@@ -133,29 +132,23 @@ class PerformanceAnalyzerTool(BaseTool):
             str: JSON formatted performance analysis report
         """
         try:
+            # Precompiled rule engine: one scan gives every finding with its line and column
+            engine = get_rule_engine()
+            scan = engine.scan(code, language=language)
             performance_issues = []
 
-            # Performance patterns to check
-            performance_patterns = {
-                "Nested Loops": r"for\s*\([^}]*\{[^}]*for\s*\(",
-                "Inefficient String Concatenation": r"\+\=.*['\"]",
-                "Redundant Database Calls": r"(SELECT|INSERT|UPDATE|DELETE).*for\s*\(",
-                "Memory Leaks": r"new\s+\w+\s*\([^}]*(?!delete|free)",
-                "Synchronous I/O": r"(readFileSync|writeFileSync)",
-                "Large Object Creation": r"new\s+(Array|Object)\s*\(\s*\d{4,}"
-            }
-
-            for issue_type, pattern in performance_patterns.items():
-                if re.search(pattern, code, re.IGNORECASE):
-                    performance_issues.append({
-                        "type": issue_type,
-                        "impact": "High" if "Loop" in issue_type or "Database" in issue_type else "Medium",
-                        "description": f"Potential {issue_type.lower()} performance issue",
-                        "suggestion": f"Consider optimizing {issue_type.lower()}"
-                    })
+            for issue in engine.summarize(scan, "performance"):
+                issue_type = issue.pop("type")
+                performance_issues.append({
+                    "type": issue_type,
+                    "impact": issue.pop("severity"),
+                    **issue,
+                    "description": f"Potential {issue_type.lower()} performance issue",
+                    "suggestion": f"Consider optimizing {issue_type.lower()}"
+                })
 
             # Calculate complexity score
-            complexity_indicators = len(re.findall(r'\bif\b|\bfor\b|\bwhile\b|\bcatch\b', code, re.IGNORECASE))
+            complexity_indicators = scan["metrics"]["complexity_indicators"]
 
             analysis = {
                 "language": language,
@@ -201,15 +194,15 @@ class CodeQualityTool(BaseTool):
         try:
             quality_issues = []
 
-            # Code quality checks
-            lines = code.split('\n')
-            total_lines = len(lines)
-            comment_lines = len([line for line in lines if line.strip().startswith(('//','#','/*','*','"""',"'''"))])
-            empty_lines = len([line for line in lines if not line.strip()])
+            # Code quality checks (line and function metrics come from the same rule engine scan)
+            metrics = get_rule_engine().scan(code, language=language)["metrics"]
+            total_lines = metrics["total_lines"]
+            comment_lines = metrics["comment_lines"]
+            empty_lines = metrics["empty_lines"]
 
             # Calculate metrics
             comment_ratio = (comment_lines / total_lines * 100) if total_lines > 0 else 0
-            function_count = len(re.findall(r'\b(def|function|func)\s+\w+', code, re.IGNORECASE))
+            function_count = metrics["function_count"]
             avg_function_length = (total_lines - comment_lines - empty_lines) / max(1, function_count)
 
             # Quality assessments
@@ -624,30 +617,43 @@ class CodeReviewCrew:
                     'step_number': st.session_state.current_step + 1
                 }
 
-                # Add to progress tracking
+                # Add to progress tracking (the execution timeline; live progress comes from task completions)
                 st.session_state.crew_progress.append(step_info)
                 st.session_state.current_step += 1
 
-                # Calculate progress percentage based on step number
-                # Assume typical crew has 3-5 tasks, so calculate accordingly
-                progress_percentage = min(0.9, (step_info['step_number'] * 0.2))
-
-                # Update any progress indicators if they exist
-                if hasattr(st.session_state, 'progress_placeholder') and st.session_state.progress_placeholder:
-                    try:
-                        progress_msg = f"🔄 **Step {step_info['step_number']}:** {agent_name} is working..."
-                        st.session_state.progress_placeholder.info(progress_msg)
-
-                        # Also update progress bar if available
-                        if hasattr(st.session_state, 'progress_bar') and st.session_state.progress_bar:
-                            st.session_state.progress_bar.progress(progress_percentage)
-                    except:
-                        pass  # Fail silently if UI update fails
-
             except Exception as e:
                 print(f"[CrewAI Callback Error] {str(e)}")
                 # Log error but don't break the crew execution
 
+# ============================================================================
+# BACKEND: REPOSITORY SCANNING
+# ============================================================================
+
+@st.cache_resource
+def get_scan_cache() -> ScanCache:
+    """Per-file scan results shared across reviews; unchanged files are never rescanned"""
+    return ScanCache(Path(__file__).parent / "output" / ".review_cache")
+
+def display_repository_scan(repository_scan: Dict[str, Any]):
+    """Show repository scan statistics and the flagged locations"""
+    stats = repository_scan["stats"]
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Files Scanned", stats["files_scanned"], f"{stats['files_from_cache']} cached")
+    col2.metric("Lines", f"{stats['total_lines']:,}")
+    col3.metric("Findings", stats["findings"])
+    col4.metric("Scan Time", f"{stats['seconds']:.2f}s")
+
+    rows = [
+        {"File": result["path"], "Line": finding["line"], "Column": finding["column"],
+         "Issue": finding["type"], "Severity": finding["severity"], "Code": finding["snippet"]}
+        for result in repository_scan["files"] for finding in result["findings"]
+    ]
+    with st.expander(f"🔎 Static Analysis Findings ({len(rows)})", expanded=False):
+        if rows:
+            st.dataframe(rows, width="stretch")
+        else:
+            st.success("No issues flagged by static analysis.")
+
 # ============================================================================
 # BACKEND: YAML CONFIGURATION VALIDATION AND UTILITIES
 # ============================================================================
@@ -841,17 +847,35 @@ def render_code_review_interface():
     # Split the main area into two columns: bigger one for code, smaller one for settings
     left_column, right_column = st.columns([2, 1])  # Left column is twice as wide as right
 
-    # LEFT COLUMN: Where users paste their code
+    # LEFT COLUMN: Where users paste their code (or point at a whole repository)
     with left_column:
-        # Create a large text box where users can paste or type their code
-        code_content = st.text_area(
-            "Code to Review *",                           # Label at the top of the text box
-            placeholder="Paste your code here...",     # Gray text shown when empty
-            height=300,                                # Make it tall enough for lots of code
-            key='code_content',                        # Unique identifier for this input
-            help="Paste the code you want the AI to review. Can be any programming language."
+        review_source = st.radio(
+            "Review Source",
+            ["Paste Code", "Repository Path"],
+            horizontal=True,
+            key='review_source',
+            help="Repository reviews run the static analysis rules over every source file and send only the flagged snippets to the AI."
         )
 
+        repository_path = ""
+        code_content = ""
+        if review_source == "Paste Code":
+            # Create a large text box where users can paste or type their code
+            code_content = st.text_area(
+                "Code to Review *",                           # Label at the top of the text box
+                placeholder="Paste your code here...",     # Gray text shown when empty
+                height=300,                                # Make it tall enough for lots of code
+                key='code_content',                        # Unique identifier for this input
+                help="Paste the code you want the AI to review. Can be any programming language."
+            )
+        else:
+            repository_path = st.text_input(
+                "Repository Path *",
+                placeholder="e.g., C:/projects/my-service",
+                key='repository_path',
+                help="Local directory to scan. VCS, dependency and build folders are skipped."
+            )
+
     # RIGHT COLUMN: Settings for the code review
     with right_column:
         # Let users tell us what programming language they're using
@@ -900,9 +924,26 @@ def render_code_review_interface():
             key='code_human_in_loop',
             help="Enable human review and approval at key stages"
         )
+        force_fresh = st.checkbox(
+            "Force Fresh Run",
+            value=False,
+            key='code_force_fresh',
+            help="Ignore the stored output for identical inputs and run the crew again"
+        )
 
     # Execute code review
     if st.button("👨‍💻 Start Code Review", type="primary", key='start_review'):
+        if review_source == "Repository Path":
+            if not repository_path or not os.path.isdir(repository_path):
+                st.error("Please provide an existing repository directory.")
+                return
+
+            with st.spinner("🔎 Scanning repository with static analysis rules..."):
+                repository_scan = scan_repository(repository_path, cache=get_scan_cache())
+            display_repository_scan(repository_scan)
+            # The AI reviews only the code around flagged locations
+            code_content = flagged_snippets(repository_scan["files"])
+
         if not code_content:
             st.error("Please provide code to review.")
             return
@@ -944,64 +985,49 @@ def render_code_review_interface():
                 if llm_provider == "Ollama" and ollama_base_url:
                     llm_kwargs['base_url'] = ollama_base_url
 
-                crew = crew_manager.create_crew(llm_provider, selected_model, code_review_input_dict, human_in_loop, **llm_kwargs)
-
-                # Initialize progress tracking
-                progress_placeholder = st.empty()
-                progress_bar = st.progress(0)
-
                 # Initialize session state for progress tracking
                 if 'crew_progress' not in st.session_state:
                     st.session_state.crew_progress = []
                 if 'current_step' not in st.session_state:
                     st.session_state.current_step = 0
 
-                # Store progress components in session state for callback access
-                st.session_state.progress_placeholder = progress_placeholder
-                st.session_state.progress_bar = progress_bar
-
-                # Execute crew with enhanced progress tracking
-                with st.spinner("👨‍💻 Starting comprehensive code review..."):
-                    try:
-                        # Get task count for progress calculation
-                        task_count = len(crew.tasks)
-
-                        # Update progress - Initialization
-                        progress_bar.progress(0.05)
-                        progress_placeholder.info("🔄 **Initializing:** Setting up code review agents...")
-
-                        # Execute crew with kickoff - let the callback handle progress updates
-                        result = crew.kickoff()
-
-                        # Update progress - Complete
-                        progress_bar.progress(1.0)
-                        progress_placeholder.success("✅ **Complete:** All agents finished comprehensive analysis!")
+                # Run the crew on the background execution service; identical reviews return the stored output
+                cache_inputs = {
+                    **code_review_input_dict,
+                    'llm_provider': llm_provider,
+                    'model': selected_model,
+                    'llm_kwargs': llm_kwargs,
+                    'human_in_loop': human_in_loop,
+                    'config': config_fingerprint(crew_manager.config_path)
+                }
+                run = get_crew_execution_service().submit(
+                    "code_review",
+                    cache_inputs,
+                    lambda: crew_manager.create_crew(llm_provider, selected_model, code_review_input_dict, human_in_loop, **llm_kwargs),
+                    use_cache=not force_fresh
+                )
 
-                        # Ensure we have a result
-                        if not result or str(result).strip() == "":
-                            st.error("❌ No final result generated. Check agent configurations and API connectivity.")
-                            return
+                # Stream each agent's findings as its task completes
+                st.markdown("### 🔄 Live Review Progress")
+                render_crew_run(run, label="Review Task")
 
-                    except Exception as e:
-                        progress_bar.progress(0.0)
-                        progress_placeholder.error(f"❌ **Error during review:** {str(e)}")
-                        st.error(f"Code review failed: {str(e)}")
+                if run.status == "failed":
+                    st.error(f"Code review failed: {run.error}")
 
-                        # Provide specific guidance for common errors
-                        if "API" in str(e) or "key" in str(e).lower():
-                            st.info("💡 **Quick Fix:** Check your API key configuration in the sidebar.")
-                        elif "timeout" in str(e).lower():
-                            st.info("💡 **Quick Fix:** Try using a smaller code snippet or different model.")
+                    # Provide specific guidance for common errors
+                    if "API" in run.error or "key" in run.error.lower():
+                        st.info("💡 **Quick Fix:** Check your API key configuration in the sidebar.")
+                    elif "timeout" in run.error.lower():
+                        st.info("💡 **Quick Fix:** Try using a smaller code snippet or different model.")
 
-                        return
+                    return
 
-                # Clear progress indicators
-                progress_placeholder.empty()
-                progress_bar.empty()
+                result = run.result
 
-                # Clean up session state
-                if 'progress_placeholder' in st.session_state:
-                    del st.session_state.progress_placeholder
+                # Ensure we have a result
+                if not result or str(result).strip() == "":
+                    st.error("❌ No final result generated. Check agent configurations and API connectivity.")
+                    return
 
                 # Display results
                 st.success("✅ Code review completed successfully!")
@@ -1146,14 +1172,12 @@ def render_code_review_interface():
 
                     # Display task breakdown
                     st.markdown("#### 📋 Review Tasks Executed")
-                    if hasattr(crew, 'tasks') and crew.tasks:
-                        for i, task in enumerate(crew.tasks, 1):
-                            with st.expander(f"Task {i}: {task.agent.role if hasattr(task, 'agent') else 'Unknown Agent'}", expanded=False):
-                                st.markdown(f"**Agent:** {task.agent.role if hasattr(task, 'agent') else 'Unknown'}")
-                                st.markdown(f"**Task Description:** {task.description[:200]}...")
-                                st.markdown(f"**Expected Output:** {task.expected_output}")
-                                if hasattr(task, 'tools') and task.tools:
-                                    st.markdown(f"**Tools Used:** {', '.join([tool.name for tool in task.tools])}")
+                    if run.task_outputs:
+                        for task in run.task_outputs:
+                            with st.expander(f"Task {task['index']}: {task['agent']}", expanded=False):
+                                st.markdown(f"**Agent:** {task['agent']}")
+                                st.markdown(f"**Task Description:** {task['description'][:200]}...")
+                                st.markdown(f"**Duration:** {task['latency']:.1f}s")
                     else:
                         st.info("Task information not available.")
 
@@ -1161,13 +1185,15 @@ def render_code_review_interface():
                     st.markdown("#### ⏱️ Performance Metrics")
                     col1, col2, col3 = st.columns(3)
                     with col1:
-                        st.metric("Agents Deployed", len(crew.agents) if hasattr(crew, 'agents') else 0)
+                        st.metric("Agents Deployed", len({task['agent'] for task in run.task_outputs}))
                     with col2:
-                        st.metric("Tasks Completed", len(crew.tasks) if hasattr(crew, 'tasks') else 0)
+                        st.metric("Tasks Completed", len(run.task_outputs), "Cached" if run.from_cache else None)
                     with col3:
                         steps_completed = len(st.session_state.crew_progress) if 'crew_progress' in st.session_state else 0
                         st.metric("Steps Tracked", steps_completed)
 
+                    render_execution_metrics()
+
                 # Additional insights
                 with st.expander("💡 Review Process Insights", expanded=False):
                     st.markdown(f"""
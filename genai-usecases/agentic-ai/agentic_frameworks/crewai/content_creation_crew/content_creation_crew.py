@@ -13,6 +13,7 @@ import streamlit as st
 import yaml
 import json
 import os
+import sys
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +24,9 @@ from crewai import Agent, Task, Crew, LLM, Process
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+# Shared background execution service (agentic_frameworks/crewai/crew_execution.py)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from crew_execution import get_crew_execution_service, config_fingerprint, render_crew_run, render_execution_metrics
 
 load_dotenv()
 
@@ -660,6 +664,12 @@ def render_content_crew_interface():
             key='content_human_in_loop',
             help="Enable human review and approval at key stages"
         )
+        force_fresh = st.checkbox(
+            "Force Fresh Run",
+            value=False,
+            key='content_force_fresh',
+            help="Ignore the stored output for identical inputs and run the crew again"
+        )
 
     # ========================================
     # UI SECTION: Content Generation Execution
@@ -700,11 +710,31 @@ def render_content_crew_interface():
                 if llm_provider == "Ollama" and ollama_base_url:
                     llm_kwargs['base_url'] = ollama_base_url
 
-                crew = crew_manager.create_crew(llm_provider, model, content_input_dict, human_in_loop, **llm_kwargs)
+                # Execute the content creation workflow in the background; identical requests return the stored content
+                cache_inputs = {
+                    **content_input_dict,
+                    'llm_provider': llm_provider,
+                    'model': model,
+                    'llm_kwargs': llm_kwargs,
+                    'human_in_loop': human_in_loop,
+                    'config': config_fingerprint(crew_manager.config_path)
+                }
+                run = get_crew_execution_service().submit(
+                    "content_creation",
+                    cache_inputs,
+                    lambda: crew_manager.create_crew(llm_provider, model, content_input_dict, human_in_loop, **llm_kwargs),
+                    use_cache=not force_fresh
+                )
+
+                # Stream each stage's output as soon as it is ready
+                st.markdown("### 🎨 Creating Content")
+                render_crew_run(run, label="Stage")
+
+                if run.status == "failed":
+                    st.error(f"Content creation error: {run.error}")
+                    return
 
-                # Execute the content creation workflow
-                with st.spinner("🎨 Creating content..."):
-                    result = crew.kickoff()
+                result = run.result
 
                 # ========================================
                 # UI SECTION: Results Display
@@ -722,11 +752,11 @@ def render_content_crew_interface():
                 # Tab 2: Process Details and Workflow
                 with tab2:
                     st.markdown("### 📊 Content Creation Process")
-                    if hasattr(crew, 'tasks') and crew.tasks:
-                        for i, task in enumerate(crew.tasks, 1):
-                            with st.expander(f"Step {i}: {task.agent.role}", expanded=False):
-                                st.write(f"**Description:** {task.description}")
-                                st.write(f"**Expected Output:** {task.expected_output}")
+                    if run.task_outputs:
+                        for task in run.task_outputs:
+                            with st.expander(f"Step {task['index']}: {task['agent']}", expanded=False):
+                                st.write(f"**Description:** {task['description']}")
+                                st.write(f"**Duration:** {task['latency']:.1f}s")
                     else:
                         st.write("**Process Steps:**")
                         st.write("1. Content Strategy Development")
@@ -734,6 +764,8 @@ def render_content_crew_interface():
                         st.write("3. SEO Optimization")
                         st.write("4. Quality Review")
 
+                    render_execution_metrics()
+
                 # Tab 3: Recommendations and Best Practices
                 with tab3:
                     st.markdown("### 💡 Content Strategy Recommendations")
@@ -0,0 +1,436 @@
+"""
+Crew Execution Service
+
+Background execution for the CrewAI crews in this folder:
+- Crews run on a shared worker pool instead of blocking the Streamlit request
+- Each task's output is streamed to the UI as soon as that task completes
+- Completed runs are persisted; identical inputs return the stored output
+  until it expires (CREW_RUN_TTL_SECONDS) or a fresh run is forced
+- Identical runs already in flight are shared instead of started twice;
+  every viewer receives the task outputs through CrewRun.stream()
+- Throughput, run latency and per-task latency metrics
+
+Usage from a crew interface:
+    run = get_crew_execution_service().submit("code_review", cache_inputs, build_crew)
+    render_crew_run(run)          # streams task outputs while the crew works
+    result_text = run.result
+"""
+
+import hashlib
+import json
+import os
+import statistics
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+CREW_RUNS_DIR = Path(os.getenv("CREW_RUNS_DIR", Path(__file__).parent / ".crew_runs"))
+CREW_EXECUTION_WORKERS = int(os.getenv("CREW_EXECUTION_WORKERS", "2"))   # LLM rate limits favour few workers
+CREW_RUN_TTL_SECONDS = int(os.getenv("CREW_RUN_TTL_SECONDS", str(24 * 3600)))  # 0 keeps stored runs forever
+THROUGHPUT_WINDOW_SECONDS = 3600
+RUN_HISTORY_SIZE = 200
+
+
+def config_fingerprint(config_path: Path) -> str:
+    """Hash of a crew's YAML configuration, so config edits invalidate stored runs"""
+    digest = hashlib.sha256()
+    for path in sorted(Path(config_path).glob("*.y*ml")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _script_run_context():
+    """Current Streamlit script context, if any (lets crew callbacks reach the session from worker threads)"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        return get_script_run_ctx()
+    except Exception:
+        return None
+
+
+def _attach_script_run_context(ctx):
+    """Set (or with None, clear) the Streamlit script context of the current thread"""
+    try:
+        from streamlit.runtime.scriptrunner import add_script_run_ctx
+        add_script_run_ctx(threading.current_thread(), ctx)
+    except Exception:
+        pass
+
+
+# ============================================================================
+# CREW RUN
+# ============================================================================
+
+class CrewRun:
+    """One crew execution: status, streamed task outputs, final result and timings"""
+
+    def __init__(self, crew_name: str, cache_key: str, task_count: int = 0):
+        self.run_id = uuid.uuid4().hex[:12]
+        self.crew_name = crew_name
+        self.cache_key = cache_key
+        self.task_count = task_count
+        self.status = "queued"            # queued -> running -> completed | failed; or cached
+        self.from_cache = False
+        self.result: Optional[str] = None
+        self.error: Optional[str] = None
+        self.task_outputs: List[Dict[str, Any]] = []
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._changed = threading.Condition()
+        self._done = threading.Event()
+        self._last_mark: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def record_task(self, task_output: Any) -> Dict[str, Any]:
+        """Record a finished CrewAI TaskOutput and publish it to stream() consumers"""
+        now = time.time()
+        entry = {
+            "index": len(self.task_outputs) + 1,
+            "agent": str(getattr(task_output, "agent", "") or "Agent"),
+            "name": getattr(task_output, "name", None) or "",
+            "description": str(getattr(task_output, "description", "") or ""),
+            "output": str(getattr(task_output, "raw", None) or task_output),
+            # Time since the previous task (or run start) finished; tasks run one after another
+            "latency": round(now - (self._last_mark or self.started_at or now), 3),
+            "completed_at": datetime.now().isoformat()
+        }
+        self._last_mark = now
+        with self._changed:
+            self.task_outputs.append(entry)
+            self._changed.notify_all()
+        return entry
+
+    def finish(self):
+        if self.finished_at is None:
+            self.finished_at = time.time()
+        with self._changed:
+            self._done.set()
+            self._changed.notify_all()
+
+    def stream(self, poll_interval: float = 0.25) -> Iterator[Dict[str, Any]]:
+        """
+        Yield task outputs as they complete, until the run finishes
+
+        Every call replays from the first task, so several viewers (or a
+        Streamlit rerun reattaching to a run) each see the full sequence.
+        """
+        cursor = 0
+        while True:
+            with self._changed:
+                while cursor >= len(self.task_outputs) and not self.done:
+                    self._changed.wait(poll_interval)
+                pending = self.task_outputs[cursor:]
+                finished = self.done
+            for entry in pending:
+                cursor += 1
+                yield entry
+            if finished and cursor >= len(self.task_outputs):
+                return
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def to_record(self) -> Dict[str, Any]:
+        """Serializable form persisted to disk"""
+        return {
+            "crew_name": self.crew_name,
+            "cache_key": self.cache_key,
+            "task_count": self.task_count,
+            "result": self.result,
+            "task_outputs": self.task_outputs,
+            "duration": self.duration,
+            "created_at": datetime.now().isoformat()
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "CrewRun":
+        """Rebuild a completed run from a persisted record (all outputs immediately streamable)"""
+        run = cls(record["crew_name"], record["cache_key"], record.get("task_count", 0))
+        run.status = "cached"
+        run.from_cache = True
+        run.result = record.get("result")
+        run.started_at = run.submitted_at
+        run.task_outputs = list(record.get("task_outputs", []))
+        run.finish()
+        return run
+
+
+# ============================================================================
+# EXECUTION SERVICE
+# ============================================================================
+
+class CrewExecutionService:
+    """Runs crews on background workers with persisted, deduplicated results and live metrics"""
+
+    def __init__(self, max_workers: int = CREW_EXECUTION_WORKERS, runs_dir: Optional[Path] = CREW_RUNS_DIR,
+                 ttl_seconds: int = CREW_RUN_TTL_SECONDS):
+        self.runs_dir = Path(runs_dir) if runs_dir else None
+        self.ttl_seconds = ttl_seconds
+        if self.runs_dir:
+            self.runs_dir.mkdir(parents=True, exist_ok=True)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crew-worker")
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, CrewRun] = {}
+        self._runs: "deque[CrewRun]" = deque(maxlen=RUN_HISTORY_SIZE)
+        self._counters = {"submitted": 0, "completed": 0, "failed": 0, "cache_hits": 0, "shared": 0}
+        self.max_workers = max_workers
+
+    @staticmethod
+    def cache_key(crew_name: str, cache_inputs: Dict[str, Any]) -> str:
+        payload = json.dumps({"crew": crew_name, "inputs": cache_inputs}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load_record(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.runs_dir:
+            return None
+        path = self.runs_dir / f"{key}.json"
+        try:
+            if self.ttl_seconds and time.time() - path.stat().st_mtime > self.ttl_seconds:
+                path.unlink()
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _save_record(self, run: CrewRun):
+        if not self.runs_dir:
+            return
+        path = self.runs_dir / f"{run.cache_key}.json"
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(run.to_record(), f, indent=2)
+        os.replace(tmp_path, path)
+
+    def submit(self, crew_name: str, cache_inputs: Dict[str, Any], build_crew: Callable[[], Any],
+               use_cache: bool = True) -> CrewRun:
+        """
+        Start a crew in the background, or return a stored/in-flight run for identical inputs
+
+        Args:
+            crew_name: Crew identifier used in the cache key and metrics
+            cache_inputs: Everything that determines the output (inputs, provider, model, config fingerprint)
+            build_crew: Zero-argument callable returning a ready-to-run Crew (called on the worker)
+            use_cache: Set False to force a fresh execution (the new result still replaces the stored one)
+
+        Crew callbacks that touch Streamlit run in the submitting session only;
+        sessions that join an in-flight run get its task outputs via stream().
+        """
+        key = self.cache_key(crew_name, cache_inputs)
+
+        with self._lock:
+            self._counters["submitted"] += 1
+
+            if key in self._in_flight:
+                self._counters["shared"] += 1
+                return self._in_flight[key]
+
+            if use_cache:
+                record = self._load_record(key)
+                if record:
+                    self._counters["cache_hits"] += 1
+                    run = CrewRun.from_record(record)
+                    self._runs.append(run)
+                    return run
+
+            run = CrewRun(crew_name, key)
+            self._in_flight[key] = run
+            self._runs.append(run)
+
+        self._pool.submit(self._execute, run, build_crew, _script_run_context())
+        return run
+
+    def _execute(self, run: CrewRun, build_crew: Callable[[], Any], script_ctx):
+        # Pool threads are reused, so the submitting session's context is attached
+        # for this run only and cleared afterwards
+        _attach_script_run_context(script_ctx)
+        run.status = "running"
+        run.started_at = time.time()
+        try:
+            crew = build_crew()
+            run.task_count = len(getattr(crew, "tasks", []) or [])
+
+            # Chain onto any task callback the crew already has
+            previous_callback = getattr(crew, "task_callback", None)
+            recorded = set()
+
+            def on_task_complete(task_output):
+                if id(task_output) not in recorded:
+                    recorded.add(id(task_output))
+                    run.record_task(task_output)
+                if previous_callback:
+                    previous_callback(task_output)
+
+            # CrewAI versions differ in whether the crew-level callback reaches tasks after construction
+            crew.task_callback = on_task_complete
+            for task in getattr(crew, "tasks", []) or []:
+                if getattr(task, "callback", None) in (None, previous_callback):
+                    task.callback = on_task_complete
+            result = crew.kickoff()
+
+            # Hierarchical runs may not report every task through the callback
+            for task_output in (getattr(result, "tasks_output", None) or [])[len(run.task_outputs):]:
+                run.record_task(task_output)
+
+            run.result = str(result)
+            run.finished_at = time.time()
+            run.status = "completed"
+            self._save_record(run)
+            with self._lock:
+                self._counters["completed"] += 1
+        except Exception as e:
+            run.error = str(e)
+            run.status = "failed"
+            with self._lock:
+                self._counters["failed"] += 1
+        finally:
+            with self._lock:
+                self._in_flight.pop(run.cache_key, None)
+            run.finish()
+            _attach_script_run_context(None)
+
+    def get_run(self, run_id: str) -> Optional[CrewRun]:
+        with self._lock:
+            return next((run for run in self._runs if run.run_id == run_id), None)
+
+    def clear_cache(self) -> int:
+        """Delete persisted runs; returns the number removed"""
+        if not self.runs_dir:
+            return 0
+        removed = 0
+        for path in self.runs_dir.glob("*.json"):
+            path.unlink()
+            removed += 1
+        return removed
+
+    def metrics(self) -> Dict[str, Any]:
+        """Throughput, run latency, queue wait and per-task latency for executed (non-cached) runs"""
+        now = time.time()
+        with self._lock:
+            runs = list(self._runs)
+            counters = dict(self._counters)
+            active = len(self._in_flight)
+
+        executed = [run for run in runs if run.status == "completed" and not run.from_cache]
+        durations = [run.duration for run in executed if run.duration is not None]
+        waits = [run.started_at - run.submitted_at for run in runs if run.started_at and not run.from_cache]
+        recent = [run for run in executed if run.finished_at and now - run.finished_at <= THROUGHPUT_WINDOW_SECONDS]
+
+        task_latency: Dict[str, List[float]] = {}
+        for run in executed:
+            for task in run.task_outputs:
+                task_latency.setdefault(f"{run.crew_name} · {task['name'] or task['agent']}", []).append(task["latency"])
+
+        lookups = counters["submitted"]
+        return {
+            **counters,
+            "active_runs": active,
+            "workers": self.max_workers,
+            "cache_hit_rate": round(counters["cache_hits"] / lookups, 3) if lookups else 0.0,
+            "throughput_per_hour": len(recent) * 3600 / THROUGHPUT_WINDOW_SECONDS,
+            "avg_run_seconds": round(statistics.mean(durations), 2) if durations else None,
+            "p95_run_seconds": round(sorted(durations)[int(0.95 * (len(durations) - 1))], 2) if durations else None,
+            "avg_queue_wait_seconds": round(statistics.mean(waits), 3) if waits else None,
+            "task_latency": {
+                name: {"count": len(values), "avg_seconds": round(statistics.mean(values), 2), "max_seconds": round(max(values), 2)}
+                for name, values in sorted(task_latency.items())
+            }
+        }
+
+
+# ============================================================================
+# SHARED SERVICE INSTANCE
+# ============================================================================
+
+_service: Optional[CrewExecutionService] = None
+_service_lock = threading.Lock()
+
+
+def get_crew_execution_service() -> CrewExecutionService:
+    """Process-wide service; the worker pool and run history survive Streamlit reruns"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = CrewExecutionService()
+    return _service
+
+
+# ============================================================================
+# FRONTEND: STREAMLIT HELPERS
+# ============================================================================
+
+def render_crew_run(run: CrewRun, label: str = "Task") -> CrewRun:
+    """Stream a run's task outputs into the page as each task completes; returns the finished run"""
+    import streamlit as st
+
+    status_placeholder = st.empty()
+    progress_bar = st.progress(0.0)
+    if run.from_cache:
+        status_placeholder.info("♻️ Identical inputs found - showing the stored crew output "
+                                "(enable **Force Fresh Run** to run the crew again).")
+    else:
+        status_placeholder.info("🔄 Crew is running in the background - task results appear as they finish...")
+
+    for task in run.stream():
+        total = max(run.task_count, task["index"], 1)
+        progress_bar.progress(min(1.0, task["index"] / total))
+        if not run.from_cache:
+            status_placeholder.info(f"✅ {label} {task['index']}/{total} finished by **{task['agent']}** in {task['latency']:.1f}s")
+        with st.expander(f"✅ {label} {task['index']}: {task['agent']}", expanded=False):
+            st.markdown(task["output"])
+
+    if run.status == "failed":
+        progress_bar.empty()
+        status_placeholder.error(f"❌ Crew execution failed: {run.error}")
+    else:
+        progress_bar.progress(1.0)
+        duration = f" in {run.duration:.1f}s" if run.duration and not run.from_cache else ""
+        status_placeholder.success(f"✅ All {len(run.task_outputs)} tasks completed{duration}.")
+    return run
+
+
+def render_execution_metrics(service: Optional[CrewExecutionService] = None):
+    """Show throughput, latency and cache statistics of the execution service"""
+    import streamlit as st
+
+    metrics = (service or get_crew_execution_service()).metrics()
+    with st.expander("⚙️ Crew Execution Service Metrics", expanded=False):
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Runs (completed/failed)", f"{metrics['completed']}/{metrics['failed']}", f"{metrics['active_runs']} active")
+        col2.metric("Cache Hits", metrics["cache_hits"], f"{metrics['cache_hit_rate']:.0%} of submissions")
+        col3.metric("Throughput", f"{metrics['throughput_per_hour']:.0f}/h", f"{metrics['workers']} workers")
+        col4.metric("Avg Run", f"{metrics['avg_run_seconds']}s" if metrics["avg_run_seconds"] is not None else "—",
+                    f"p95 {metrics['p95_run_seconds']}s" if metrics["p95_run_seconds"] is not None else None)
+
+        if st.button("🗑️ Clear Stored Runs", key="clear_crew_runs"):
+            removed = (service or get_crew_execution_service()).clear_cache()
+            st.success(f"Removed {removed} stored run(s)")
+
+        if metrics["task_latency"]:
+            st.markdown("**Per-task latency**")
+            st.dataframe(
+                [{"Task": name, **values} for name, values in metrics["task_latency"].items()],
+                width="stretch"
+            )
@@ -8,6 +8,7 @@ Features:
 - Advanced error handling
 - Real-time monitoring
 - Structured outputs
+- Shared dataset sessions: each dataset is read once and profiled once for all tools
 """
 
 import streamlit as st
@@ -16,6 +17,11 @@ import numpy as np
 import yaml
 import json
 import os
+import io
+import sys
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from datetime import datetime
@@ -36,6 +42,10 @@ from crewai.memory import LongTermMemory
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+# Shared background execution service (agentic_frameworks/crewai/crew_execution.py)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from crew_execution import get_crew_execution_service, config_fingerprint, render_crew_run, render_execution_metrics
+
 
 load_dotenv()
 
@@ -54,6 +64,257 @@ class DataAnalysisToolInput(BaseModel):
     analysis_type: str = Field(..., description="Type of analysis to perform")
     parameters: Dict[str, Any] = Field(default={}, description="Additional parameters")
 
+# ============================================================================
+# BACKEND: DATASET SESSION LAYER
+# ============================================================================
+
+try:
+    import pyarrow  # noqa: F401  (enables the pyarrow CSV engine and Parquet caching)
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Files above this size are streamed in chunks instead of loaded whole
+CHUNKED_LOAD_THRESHOLD_MB = float(os.getenv("DATASET_CHUNK_THRESHOLD_MB", "512"))
+CHUNK_ROWS = 250_000
+SAMPLE_ROWS = 200_000
+# Optional directory for typed Parquet copies of CSV files (reused while the CSV is unchanged)
+PARQUET_CACHE_DIR = os.getenv("DATASET_PARQUET_CACHE")
+
+def iqr_outlier_mask(numeric_df: pd.DataFrame, quantiles: pd.DataFrame) -> pd.DataFrame:
+    """Boolean mask of IQR outliers for every numeric column at once"""
+    q1, q3 = quantiles.loc[0.25], quantiles.loc[0.75]
+    iqr = q3 - q1
+    return numeric_df.lt(q1 - 1.5 * iqr, axis=1) | numeric_df.gt(q3 + 1.5 * iqr, axis=1)
+
+class DatasetSession:
+    """
+    Read-only dataset handle shared by all analysis tools
+
+    Holds the loaded DataFrame and computes one cached profile (summary
+    statistics, quantiles, correlations, null counts, outliers) with a handful
+    of vectorized calls. Files larger than ``CHUNKED_LOAD_THRESHOLD_MB`` are
+    streamed in chunks: row counts, nulls, mean, std, min and max are exact,
+    while ``df`` is a uniform random sample of ``SAMPLE_ROWS`` rows (in file
+    order) used for quantiles, correlations and row-level analysis.
+
+    Tools must not modify ``df``; it is shared between them.
+    """
+
+    def __init__(self, df: pd.DataFrame, source: Optional[str] = None, total_rows: Optional[int] = None,
+                 streamed_stats: Optional[Dict[str, Any]] = None):
+        self.df = df
+        self.source = source
+        self.total_rows = total_rows if total_rows is not None else len(df)
+        self.sampled = self.total_rows > len(df)
+        self._streamed_stats = streamed_stats
+        self._profile = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_csv(cls, path, parquet_cache_dir: Optional[str] = PARQUET_CACHE_DIR) -> "DatasetSession":
+        """Load a CSV file, streaming it in chunks when it is too large to load whole"""
+        path = Path(path)
+        stat = path.stat()
+        if stat.st_size / 1024 ** 2 > CHUNKED_LOAD_THRESHOLD_MB:
+            return cls._from_csv_chunks(path)
+
+        parquet_path = None
+        if parquet_cache_dir and PYARROW_AVAILABLE:
+            key = hashlib.sha256(f"{path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8")).hexdigest()[:24]
+            parquet_path = Path(parquet_cache_dir) / f"{key}.parquet"
+            if parquet_path.exists():
+                return cls(pd.read_parquet(parquet_path), source=str(path))
+
+        df = pd.read_csv(path, engine="pyarrow") if PYARROW_AVAILABLE else pd.read_csv(path)
+        if parquet_path is not None:
+            parquet_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(parquet_path, index=False)
+        return cls(df, source=str(path))
+
+    @classmethod
+    def _from_csv_chunks(cls, path: Path, chunk_rows: int = CHUNK_ROWS, sample_rows: int = SAMPLE_ROWS,
+                         seed: int = 42) -> "DatasetSession":
+        """Stream a large CSV: exact per-column moments plus a uniform row sample"""
+        rng = np.random.default_rng(seed)
+        chunk_moments, chunk_nulls = [], []
+        sample = None
+        total_rows = 0
+
+        for chunk in pd.read_csv(path, chunksize=chunk_rows):
+            total_rows += len(chunk)
+            numeric = chunk.select_dtypes(include=[np.number])
+            chunk_moments.append(pd.DataFrame({
+                "count": numeric.count(),
+                "mean": numeric.mean(),
+                "m2": numeric.var(ddof=0) * numeric.count(),
+                "min": numeric.min(),
+                "max": numeric.max()
+            }))
+            chunk_nulls.append(chunk.isna().sum())
+
+            # Keep the rows with the smallest random keys seen so far: a uniform sample without replacement
+            chunk = chunk.assign(_sample_key=rng.random(len(chunk)))
+            sample = chunk if sample is None else pd.concat([sample, chunk])
+            if len(sample) > sample_rows:
+                sample = sample.nsmallest(sample_rows, "_sample_key")
+
+        if sample is None:
+            return cls(pd.read_csv(path), source=str(path))
+
+        # Combine chunk means and variances (Chan et al. parallel algorithm)
+        moments = pd.concat(chunk_moments)
+        grouped = moments.groupby(level=0, sort=False)
+        count = grouped["count"].sum()
+        mean = (moments["mean"] * moments["count"]).groupby(level=0, sort=False).sum() / count
+        spread = moments["count"] * (moments["mean"] - mean.reindex(moments.index)) ** 2
+        m2 = (moments["m2"] + spread).groupby(level=0, sort=False).sum()
+
+        streamed_stats = {
+            "count": count,
+            "mean": mean,
+            "std": np.sqrt(m2 / (count - 1)),
+            "min": grouped["min"].min(),
+            "max": grouped["max"].max(),
+            "nulls": pd.concat(chunk_nulls).groupby(level=0, sort=False).sum()
+        }
+        sample = sample.drop(columns="_sample_key").sort_index()
+        return cls(sample, source=str(path), total_rows=total_rows, streamed_stats=streamed_stats)
+
+    @property
+    def profile(self) -> Dict[str, Any]:
+        """Dataset profile, computed on first use and shared by every tool"""
+        if self._profile is None:
+            with self._lock:
+                if self._profile is None:
+                    self._profile = self._compute_profile()
+        return self._profile
+
+    def _compute_profile(self) -> Dict[str, Any]:
+        df = self.df
+        numeric_df = df.select_dtypes(include=[np.number])
+
+        if numeric_df.columns.empty:
+            quantiles = pd.DataFrame(index=[0.25, 0.5, 0.75])
+            aggregates = pd.DataFrame(index=["count", "mean", "std", "min", "max", "skew", "kurt"])
+        else:
+            quantiles = numeric_df.quantile([0.25, 0.5, 0.75])
+            aggregates = numeric_df.agg(["count", "mean", "std", "min", "max", "skew", "kurt"])
+
+        null_counts = df.isna().sum()
+        if self._streamed_stats is not None:
+            # Exact whole-file statistics replace the sample's
+            for stat in ["count", "mean", "std", "min", "max"]:
+                aggregates.loc[stat] = self._streamed_stats[stat].reindex(aggregates.columns)
+            null_counts = self._streamed_stats["nulls"].reindex(df.columns).fillna(0).astype(int)
+
+        # Same layout as DataFrame.describe()
+        describe = pd.concat([
+            aggregates.loc[["count", "mean", "std", "min"]],
+            quantiles.rename(index={0.25: "25%", 0.5: "50%", 0.75: "75%"}),
+            aggregates.loc[["max"]]
+        ])
+
+        outlier_mask = iqr_outlier_mask(numeric_df, quantiles)
+
+        categorical = {}
+        for col in df.columns.difference(numeric_df.columns, sort=False):
+            value_counts = df[col].value_counts()
+            categorical[col] = {
+                "unique": len(value_counts),
+                "top": value_counts.index[0] if len(value_counts) > 0 else 'N/A'
+            }
+
+        return {
+            "rows": self.total_rows,
+            "sampled_rows": len(df) if self.sampled else None,
+            "numeric_columns": list(numeric_df.columns),
+            "describe": describe,
+            "quantiles": quantiles,
+            "skewness": aggregates.loc["skew"],
+            "kurtosis": aggregates.loc["kurt"],
+            "correlations": numeric_df.corr(),
+            "null_counts": null_counts,
+            "outlier_mask": outlier_mask,
+            "outlier_counts": outlier_mask.sum(),
+            "categorical": categorical,
+            "duplicate_rows": int(df.duplicated().sum()),
+            "complete_rows": int(df.notna().all(axis=1).sum()),
+            "memory_mb": df.memory_usage().sum() / 1024 ** 2,
+            "dtype_counts": df.dtypes.astype(str).value_counts().to_dict()
+        }
+
+class DatasetRegistry:
+    """
+    Cache of dataset sessions shared by the crew's tools
+
+    Sessions are keyed by file path, modification time and size (or by a hash
+    of inline CSV text), so every tool call in an analysis run reuses the
+    same loaded data. The least recently used sessions are evicted beyond
+    ``max_sessions``.
+    """
+
+    def __init__(self, max_sessions: int = 4):
+        self.max_sessions = max_sessions
+        self.loads = 0
+        self.hits = 0
+        self._sessions: "OrderedDict[str, DatasetSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(data: str) -> str:
+        if os.path.isfile(data):
+            stat = os.stat(data)
+            return f"file:{os.path.abspath(data)}:{stat.st_mtime_ns}:{stat.st_size}"
+        return f"inline:{hashlib.sha256(data.encode('utf-8')).hexdigest()}"
+
+    def _store(self, key: str, session: DatasetSession) -> DatasetSession:
+        self._sessions[key] = session
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+        return session
+
+    def get(self, data: str) -> DatasetSession:
+        """Session for a CSV file path or inline CSV text, loading it on first use"""
+        data = str(data)
+        key = self._key(data)
+        # Loading under the lock means concurrent tool calls never read the same file twice
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+                self.hits += 1
+                return session
+
+            if key.startswith("file:"):
+                session = DatasetSession.from_csv(data)
+            else:
+                session = DatasetSession(pd.read_csv(io.StringIO(data)))
+            self.loads += 1
+            return self._store(key, session)
+
+    def register(self, path, df: pd.DataFrame) -> DatasetSession:
+        """Register an already loaded DataFrame for the file it was saved to"""
+        key = self._key(str(path))
+        with self._lock:
+            return self._store(key, DatasetSession(df, source=str(path)))
+
+    def release(self, path) -> None:
+        """Drop sessions for a file (e.g. before deleting it)"""
+        prefix = f"file:{os.path.abspath(str(path))}:"
+        with self._lock:
+            for key in [key for key in self._sessions if key.startswith(prefix)]:
+                del self._sessions[key]
+
+@st.cache_resource
+def get_dataset_registry() -> DatasetRegistry:
+    """Process-wide dataset registry (survives Streamlit reruns)"""
+    return DatasetRegistry()
+
+def get_dataset_session(data: str) -> DatasetSession:
+    """Shared read-only session for a CSV file path or inline CSV text"""
+    return get_dataset_registry().get(data)
+
 # ============================================================================
 # BACKEND: CUSTOM TOOLS FOR DATA ANALYSIS
 # ============================================================================
@@ -82,41 +343,40 @@ class StatisticalAnalysisTool(BaseTool):
             str: JSON formatted statistical analysis results
         """
         try:
-            # Parse data (assuming CSV format)
-            df = pd.read_csv(data) if os.path.isfile(data) else pd.read_csv(pd.io.common.StringIO(data))
+            # Shared session: the dataset is parsed and profiled once for all tools
+            session = get_dataset_session(data)
+            df = session.df
+            profile = session.profile
 
             results = {
-                "summary_statistics": df.describe().to_dict(),
-                "data_types": df.dtypes.to_dict(),
-                "missing_values": df.isnull().sum().to_dict(),
-                "correlation_matrix": df.select_dtypes(include=[np.number]).corr().to_dict()
+                "summary_statistics": profile["describe"].to_dict(),
+                "data_types": df.dtypes.astype(str).to_dict(),
+                "missing_values": profile["null_counts"].to_dict(),
+                "correlation_matrix": profile["correlations"].to_dict()
             }
+            if session.sampled:
+                results["sampling"] = {"total_rows": session.total_rows, "sampled_rows": len(df)}
 
             if analysis_type == "comprehensive":
                 # Add advanced analytics
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
+                numeric_cols = profile["numeric_columns"]
                 results["advanced_metrics"] = {
-                    "skewness": df[numeric_cols].skew().to_dict(),
-                    "kurtosis": df[numeric_cols].kurtosis().to_dict(),
-                    "outliers": self._detect_outliers(df[numeric_cols])
+                    "skewness": profile["skewness"].to_dict(),
+                    "kurtosis": profile["kurtosis"].to_dict(),
+                    "outliers": self._detect_outliers(df[numeric_cols], profile["quantiles"])
                 }
 
-            return json.dumps(results, indent=2)
+            return json.dumps(results, indent=2, default=str)
 
         except Exception as e:
             return f"Error in statistical analysis: {str(e)}"
 
-    def _detect_outliers(self, df: pd.DataFrame) -> Dict[str, List[int]]:
-        """Detect outliers using IQR method"""
-        outliers = {}
-        for col in df.columns:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            outliers[col] = df[(df[col] < lower_bound) | (df[col] > upper_bound)].index.tolist()
-        return outliers
+    def _detect_outliers(self, df: pd.DataFrame, quantiles: Optional[pd.DataFrame] = None) -> Dict[str, List[int]]:
+        """Detect outliers using IQR method (one quantile pass for all columns)"""
+        if quantiles is None:
+            quantiles = df.quantile([0.25, 0.75])
+        outlier_mask = iqr_outlier_mask(df, quantiles)
+        return {col: df.index[outlier_mask[col]].tolist() for col in df.columns}
 
 class BusinessInsightsTool(BaseTool):
     """
@@ -142,36 +402,38 @@ class BusinessInsightsTool(BaseTool):
             str: JSON formatted business insights and recommendations
         """
         try:
-            # Parse data
-            df = pd.read_csv(data) if os.path.isfile(data) else pd.read_csv(pd.io.common.StringIO(data))
+            # Shared session: the dataset is parsed and profiled once for all tools
+            session = get_dataset_session(data)
+            df, profile = session.df, session.profile
 
             insights = {
-                "executive_summary": self._generate_executive_summary(df),
-                "key_insights": self._extract_key_insights(df),
-                "business_recommendations": self._generate_recommendations(df),
-                "risk_factors": self._identify_risks(df),
-                "growth_opportunities": self._identify_opportunities(df),
-                "performance_metrics": self._calculate_performance_metrics(df)
+                "executive_summary": self._generate_executive_summary(df, profile),
+                "key_insights": self._extract_key_insights(df, profile),
+                "business_recommendations": self._generate_recommendations(df, profile),
+                "risk_factors": self._identify_risks(df, profile),
+                "growth_opportunities": self._identify_opportunities(df, profile),
+                "performance_metrics": self._calculate_performance_metrics(df, profile)
             }
 
-            return json.dumps(insights, indent=2)
+            return json.dumps(insights, indent=2, default=str)
 
         except Exception as e:
             return f"Error generating business insights: {str(e)}"
 
-    def _generate_executive_summary(self, df: pd.DataFrame) -> str:
+    def _generate_executive_summary(self, df: pd.DataFrame, profile: Dict[str, Any]) -> str:
         """Generate executive summary of the dataset"""
-        total_records = len(df)
+        total_records = profile["rows"]
         total_columns = len(df.columns)
-        numeric_columns = len(df.select_dtypes(include=[np.number]).columns)
-        missing_data_pct = (df.isnull().sum().sum() / (df.shape[0] * df.shape[1]) * 100)
+        numeric_columns = len(profile["numeric_columns"])
+        missing_data_pct = (profile["null_counts"].sum() / (total_records * total_columns) * 100)
 
         return f"Dataset contains {total_records:,} records across {total_columns} variables ({numeric_columns} numeric). Data completeness: {100-missing_data_pct:.1f}%. Analysis reveals key patterns in performance trends and operational metrics suitable for strategic decision-making."
 
-    def _extract_key_insights(self, df: pd.DataFrame) -> List[str]:
+    def _extract_key_insights(self, df: pd.DataFrame, profile: Dict[str, Any]) -> List[str]:
         """Extract key business insights from data"""
         insights = []
-        numeric_df = df.select_dtypes(include=[np.number])
+        numeric_df = df[profile["numeric_columns"]]
+        stats = profile["describe"]
 
         if not numeric_df.empty:
             # Growth trends
@@ -182,14 +444,14 @@ class BusinessInsightsTool(BaseTool):
 
             # Volatility analysis
             for col in numeric_df.columns:
-                cv = (numeric_df[col].std() / numeric_df[col].mean() * 100) if numeric_df[col].mean() != 0 else 0
+                cv = (stats.at["std", col] / stats.at["mean", col] * 100) if stats.at["mean", col] != 0 else 0
                 if cv > 50:
                     insights.append(f"{col.title()} shows high volatility (CV: {cv:.1f}%), indicating potential risk or opportunity")
                 elif cv < 10:
                     insights.append(f"{col.title()} demonstrates stable performance (CV: {cv:.1f}%), suggesting predictable outcomes")
 
             # Correlation insights
-            corr_matrix = numeric_df.corr()
+            corr_matrix = profile["correlations"]
             for i, col1 in enumerate(corr_matrix.columns):
                 for j, col2 in enumerate(corr_matrix.columns):
                     if i < j and abs(corr_matrix.iloc[i, j]) > 0.7:
@@ -198,13 +460,14 @@ class BusinessInsightsTool(BaseTool):
 
         return insights[:10]  # Limit to top 10 insights
 
-    def _generate_recommendations(self, df: pd.DataFrame) -> List[str]:
+    def _generate_recommendations(self, df: pd.DataFrame, profile: Dict[str, Any]) -> List[str]:
         """Generate actionable business recommendations"""
         recommendations = []
-        numeric_df = df.select_dtypes(include=[np.number])
+        numeric_df = df[profile["numeric_columns"]]
+        stats = profile["describe"]
 
         # Data quality recommendations
-        missing_pct = df.isnull().sum() / len(df) * 100
+        missing_pct = profile["null_counts"] / profile["rows"] * 100
         high_missing = missing_pct[missing_pct > 20]
         if not high_missing.empty:
             recommendations.append(f"Improve data collection for {', '.join(high_missing.index)} (>20% missing values)")
@@ -213,12 +476,11 @@ class BusinessInsightsTool(BaseTool):
         if not numeric_df.empty:
             for col in numeric_df.columns:
                 if 'cost' in col.lower() or 'expense' in col.lower():
-                    if numeric_df[col].std() > numeric_df[col].mean():
+                    if stats.at["std", col] > stats.at["mean", col]:
                         recommendations.append(f"Investigate {col} variability to identify cost optimization opportunities")
 
                 if 'efficiency' in col.lower() or 'productivity' in col.lower():
-                    low_performers = numeric_df[numeric_df[col] < numeric_df[col].quantile(0.25)]
-                    if len(low_performers) > 0:
+                    if (numeric_df[col] < profile["quantiles"].at[0.25, col]).any():
                         recommendations.append(f"Focus improvement efforts on bottom 25% performers in {col}")
 
         # Strategic recommendations
@@ -230,18 +492,15 @@ class BusinessInsightsTool(BaseTool):
 
         return recommendations[:8]  # Limit to top 8 recommendations
 
-    def _identify_risks(self, df: pd.DataFrame) -> List[str]:
+    def _identify_risks(self, df: pd.DataFrame, profile: Dict[str, Any]) -> List[str]:
         """Identify potential business risks from data patterns"""
         risks = []
-        numeric_df = df.select_dtypes(include=[np.number])
+        numeric_df = df[profile["numeric_columns"]]
 
-        # Outlier risks
-        for col in numeric_df.columns:
-            Q1, Q3 = numeric_df[col].quantile([0.25, 0.75])
-            IQR = Q3 - Q1
-            outliers = numeric_df[(numeric_df[col] < Q1 - 1.5*IQR) | (numeric_df[col] > Q3 + 1.5*IQR)]
-            if len(outliers) > len(numeric_df) * 0.05:  # >5% outliers
-                risks.append(f"High outlier rate in {col} ({len(outliers)}/{len(numeric_df)}) may indicate data quality or process issues")
+        # Outlier risks (counts come from the profile's single quantile pass)
+        for col, outlier_count in profile["outlier_counts"].items():
+            if outlier_count > len(numeric_df) * 0.05:  # >5% outliers
+                risks.append(f"High outlier rate in {col} ({outlier_count}/{len(numeric_df)}) may indicate data quality or process issues")
 
         # Trend risks
         for col in numeric_df.columns:
@@ -254,42 +513,43 @@ class BusinessInsightsTool(BaseTool):
 
         return risks[:5]  # Limit to top 5 risks
 
-    def _identify_opportunities(self, df: pd.DataFrame) -> List[str]:
+    def _identify_opportunities(self, df: pd.DataFrame, profile: Dict[str, Any]) -> List[str]:
         """Identify growth and improvement opportunities"""
         opportunities = []
-        numeric_df = df.select_dtypes(include=[np.number])
+        stats = profile["describe"]
 
         # Performance gaps
-        for col in numeric_df.columns:
+        for col in stats.columns:
             if 'performance' in col.lower() or 'efficiency' in col.lower():
-                gap = numeric_df[col].max() - numeric_df[col].mean()
+                gap = stats.at["max", col] - stats.at["mean", col]
                 if gap > 0:
                     opportunities.append(f"Potential {gap:.1f}% improvement opportunity in {col} by reaching top performance levels")
 
         # Underutilized resources
-        for col in numeric_df.columns:
+        for col in stats.columns:
             if 'utilization' in col.lower() or 'capacity' in col.lower():
-                if numeric_df[col].mean() < 80:
-                    opportunities.append(f"Increase {col} from {numeric_df[col].mean():.1f}% to optimize resource usage")
+                if stats.at["mean", col] < 80:
+                    opportunities.append(f"Increase {col} from {stats.at['mean', col]:.1f}% to optimize resource usage")
 
         return opportunities[:5]  # Limit to top 5 opportunities
 
-    def _calculate_performance_metrics(self, df: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_performance_metrics(self, df: pd.DataFrame, profile: Dict[str, Any]) -> Dict[str, float]:
         """Calculate key performance metrics"""
         metrics = {}
-        numeric_df = df.select_dtypes(include=[np.number])
+        numeric_df = df[profile["numeric_columns"]]
+        stats = profile["describe"]
 
         if not numeric_df.empty:
-            metrics["data_completeness"] = (1 - df.isnull().sum().sum() / (df.shape[0] * df.shape[1])) * 100
-            metrics["average_numeric_variance"] = numeric_df.var().mean()
-            metrics["correlation_strength"] = abs(numeric_df.corr()).mean().mean()
+            metrics["data_completeness"] = (1 - profile["null_counts"].sum() / (profile["rows"] * df.shape[1])) * 100
+            metrics["average_numeric_variance"] = (stats.loc["std"] ** 2).mean()
+            metrics["correlation_strength"] = abs(profile["correlations"]).mean().mean()
 
             # Business-specific metrics
             for col in numeric_df.columns:
                 if 'revenue' in col.lower():
                     metrics[f"{col}_growth_rate"] = ((numeric_df[col].iloc[-1] - numeric_df[col].iloc[0]) / numeric_df[col].iloc[0] * 100) if len(numeric_df) > 1 and numeric_df[col].iloc[0] != 0 else 0
                 if 'efficiency' in col.lower():
-                    metrics[f"{col}_average"] = numeric_df[col].mean()
+                    metrics[f"{col}_average"] = stats.at["mean", col]
 
         return metrics
 
@@ -317,26 +577,27 @@ class DataVisualizationTool(BaseTool):
             str: JSON formatted visualization specifications and recommendations
         """
         try:
-            # Parse data
-            df = pd.read_csv(data) if os.path.isfile(data) else pd.read_csv(pd.io.common.StringIO(data))
+            # Shared session: the dataset is parsed and profiled once for all tools
+            session = get_dataset_session(data)
+            df, profile = session.df, session.profile
 
             visualizations = {
-                "recommended_charts": self._recommend_charts(df),
-                "statistical_plots": self._generate_statistical_plots(df),
-                "business_dashboards": self._create_dashboard_layout(df),
-                "trend_analysis": self._analyze_trends(df),
+                "recommended_charts": self._recommend_charts(df, profile),
+                "statistical_plots": self._generate_statistical_plots(df, profile),
+                "business_dashboards": self._create_dashboard_layout(df, profile),
+                "trend_analysis": self._analyze_trends(df, profile),
                 "interactive_features": self._suggest_interactive_features(df)
             }
 
-            return json.dumps(visualizations, indent=2)
+            return json.dumps(visualizations, indent=2, default=str)
 
         except Exception as e:
             return f"Error generating visualizations: {str(e)}"
 
-    def _recommend_charts(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _recommend_charts(self, df: pd.DataFrame, profile: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Recommend appropriate chart types based on data characteristics"""
         recommendations = []
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        numeric_cols = profile["numeric_columns"]
         categorical_cols = df.select_dtypes(include=['object']).columns
 
         # Distribution charts
@@ -368,7 +629,7 @@ class DataVisualizationTool(BaseTool):
             })
 
             # Scatter plots for strong correlations
-            corr_matrix = df[numeric_cols].corr()
+            corr_matrix = profile["correlations"]
             for i, col1 in enumerate(corr_matrix.columns):
                 for j, col2 in enumerate(corr_matrix.columns):
                     if i < j and abs(corr_matrix.iloc[i, j]) > 0.5:
@@ -383,7 +644,7 @@ class DataVisualizationTool(BaseTool):
 
         # Categorical analysis
         for col in categorical_cols:
-            if df[col].nunique() <= 20:  # Reasonable number of categories
+            if profile["categorical"][col]["unique"] <= 20:  # Reasonable number of categories
                 recommendations.append({
                     "chart_type": "bar_chart",
                     "title": f"Count by {col.title()}",
@@ -408,10 +669,10 @@ class DataVisualizationTool(BaseTool):
 
         return recommendations[:12]  # Limit to top 12 recommendations
 
-    def _generate_statistical_plots(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _generate_statistical_plots(self, df: pd.DataFrame, profile: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate statistical plot specifications"""
         plots = []
-        numeric_df = df.select_dtypes(include=[np.number])
+        numeric_df = df[profile["numeric_columns"]]
 
         if not numeric_df.empty:
             # Q-Q plots for normality testing
@@ -425,7 +686,7 @@ class DataVisualizationTool(BaseTool):
                 })
 
             # Residual plots if there are relationships
-            corr_matrix = numeric_df.corr()
+            corr_matrix = profile["correlations"]
             for i, col1 in enumerate(corr_matrix.columns):
                 for j, col2 in enumerate(corr_matrix.columns):
                     if i < j and abs(corr_matrix.iloc[i, j]) > 0.7:
@@ -440,7 +701,7 @@ class DataVisualizationTool(BaseTool):
 
         return plots[:6]  # Limit to top 6 statistical plots
 
-    def _create_dashboard_layout(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _create_dashboard_layout(self, df: pd.DataFrame, profile: Dict[str, Any]) -> Dict[str, Any]:
         """Create business dashboard layout recommendations"""
         dashboard = {
             "layout": "grid",
@@ -449,15 +710,16 @@ class DataVisualizationTool(BaseTool):
             "filters": []
         }
 
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        numeric_cols = profile["numeric_columns"]
         categorical_cols = df.select_dtypes(include=['object']).columns
+        stats = profile["describe"]
 
         # KPI Cards
         for col in numeric_cols:
             if any(keyword in col.lower() for keyword in ['revenue', 'sales', 'profit', 'count', 'total']):
                 dashboard["kpi_cards"].append({
                     "title": col.title(),
-                    "value": float(df[col].sum()),
+                    "value": float(stats.at["mean", col] * stats.at["count", col]),
                     "format": "currency" if any(money in col.lower() for money in ['revenue', 'sales', 'profit', 'cost']) else "number",
                     "trend": "up" if len(df) > 1 and df[col].iloc[-1] > df[col].iloc[0] else "down"
                 })
@@ -483,7 +745,7 @@ class DataVisualizationTool(BaseTool):
 
         # Interactive filters
         for col in categorical_cols:
-            if df[col].nunique() <= 50:  # Reasonable filter options
+            if profile["categorical"][col]["unique"] <= 50:  # Reasonable filter options
                 dashboard["filters"].append({
                     "column": col,
                     "type": "multiselect",
@@ -492,7 +754,7 @@ class DataVisualizationTool(BaseTool):
 
         return dashboard
 
-    def _analyze_trends(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_trends(self, df: pd.DataFrame, profile: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze trends in the data"""
         trends = {
             "linear_trends": [],
@@ -500,7 +762,7 @@ class DataVisualizationTool(BaseTool):
             "anomalies": []
         }
 
-        numeric_df = df.select_dtypes(include=[np.number])
+        numeric_df = df[profile["numeric_columns"]]
 
         for col in numeric_df.columns:
             if len(df) > 3:
@@ -512,7 +774,7 @@ class DataVisualizationTool(BaseTool):
                     "column": col,
                     "direction": trend_direction,
                     "slope": float(slope),
-                    "strength": "strong" if abs(slope) > numeric_df[col].std() / len(df) else "weak"
+                    "strength": "strong" if abs(slope) > profile["describe"].at["std", col] / len(df) else "weak"
                 })
 
         return trends
@@ -568,20 +830,21 @@ class ChartGeneratorTool(BaseTool):
             str: JSON formatted chart configurations
         """
         try:
-            # Parse data
-            df = pd.read_csv(data) if os.path.isfile(data) else pd.read_csv(pd.io.common.StringIO(data))
+            # Shared session: the dataset is parsed and profiled once for all tools
+            session = get_dataset_session(data)
+            df, profile = session.df, session.profile
 
             charts_config = {
                 "charts_created": [],
                 "data_summary": {
-                    "rows": len(df),
+                    "rows": profile["rows"],
                     "columns": len(df.columns),
-                    "numeric_columns": list(df.select_dtypes(include=[np.number]).columns),
+                    "numeric_columns": profile["numeric_columns"],
                     "categorical_columns": list(df.select_dtypes(include=['object']).columns)
                 }
             }
 
-            return json.dumps(charts_config, indent=2)
+            return json.dumps(charts_config, indent=2, default=str)
 
         except Exception as e:
             return f"Error generating charts: {str(e)}"
@@ -1134,40 +1397,54 @@ class DataAnalysisCrew:
     def get_data_context(self, data_path: str) -> str:
         """Generate comprehensive data context"""
         try:
-            df = pd.read_csv(data_path)
+            # The same session is later handed to every tool, so the file is read only once per run
+            session = get_dataset_session(str(data_path))
+            df, profile = session.df, session.profile
+            total_rows = profile["rows"]
+            missing_total = int(profile["null_counts"].sum())
+            stats = profile["describe"]
 
             context = f"""
             Dataset Analysis Context:
 
             📊 Basic Information:
-            - Total Records: {len(df):,}
+            - Source File: {data_path}
+            - Total Records: {total_rows:,}
             - Total Columns: {len(df.columns)}
-            - Memory Usage: {df.memory_usage().sum() / 1024**2:.2f} MB
-            - Data Types: {dict(df.dtypes.value_counts())}
+            - Memory Usage: {profile["memory_mb"]:.2f} MB
+            - Data Types: {profile["dtype_counts"]}
 
             📈 Data Quality Metrics:
-            - Missing Values: {df.isnull().sum().sum():,} ({(df.isnull().sum().sum() / (len(df) * len(df.columns)) * 100):.2f}%)
-            - Duplicate Rows: {df.duplicated().sum():,}
-            - Complete Records: {len(df.dropna()):,}
+            - Missing Values: {missing_total:,} ({(missing_total / (total_rows * len(df.columns)) * 100):.2f}%)
+            - Duplicate Rows: {profile["duplicate_rows"]:,}
+            - Complete Records: {profile["complete_rows"]:,}
+            """
+            if session.sampled:
+                context += f"""
+            ⚠️ Large file: statistics cover all rows; duplicates, medians and correlations use a {len(df):,}-row sample
+            """
 
+            context += """
             🔍 Column Details:
             """
 
             for col in df.columns:
-                if pd.api.types.is_numeric_dtype(df[col]):
+                missing = int(profile["null_counts"][col])
+                if col in stats.columns:
                     context += f"""
                     {col} (Numeric):
-                    - Range: {df[col].min():.2f} to {df[col].max():.2f}
-                    - Mean: {df[col].mean():.2f}, Median: {df[col].median():.2f}
-                    - Std Dev: {df[col].std():.2f}
-                    - Missing: {df[col].isnull().sum()} ({(df[col].isnull().sum()/len(df)*100):.1f}%)
+                    - Range: {stats.at["min", col]:.2f} to {stats.at["max", col]:.2f}
+                    - Mean: {stats.at["mean", col]:.2f}, Median: {stats.at["50%", col]:.2f}
+                    - Std Dev: {stats.at["std", col]:.2f}
+                    - Missing: {missing} ({(missing/total_rows*100):.1f}%)
                     """
                 else:
+                    categorical = profile["categorical"][col]
                     context += f"""
                     {col} (Categorical):
-                    - Unique Values: {df[col].nunique():,}
-                    - Most Common: {df[col].value_counts().index[0] if len(df[col].value_counts()) > 0 else 'N/A'}
-                    - Missing: {df[col].isnull().sum()} ({(df[col].isnull().sum()/len(df)*100):.1f}%)
+                    - Unique Values: {categorical["unique"]:,}
+                    - Most Common: {categorical["top"]}
+                    - Missing: {missing} ({(missing/total_rows*100):.1f}%)
                     """
 
             return context
@@ -1313,6 +1590,12 @@ def render_crew_interface():
             key='data_human_in_loop',
             help="Enable human review and approval at key stages"
         )
+        force_fresh = st.checkbox(
+            "Force Fresh Run",
+            value=False,
+            key='data_force_fresh',
+            help="Ignore the stored output for identical inputs and run the crew again"
+        )
 
     # Configuration display
     with st.expander("⚙️ Crew Configuration & Features", expanded=False):
@@ -1372,6 +1655,8 @@ def render_crew_interface():
                     temp_filename = f"data_analysis_{timestamp}.csv"
                     temp_path = input_dir / temp_filename
                     df.to_csv(temp_path, index=False)
+                    # Hand the already parsed frame to the tools instead of re-reading the file
+                    get_dataset_registry().register(temp_path, df)
 
                     # Clean up old files (keep only last 5 files)
                     cleanup_old_files(input_dir)
@@ -1389,11 +1674,33 @@ def render_crew_interface():
                     # Add analysis preferences to data context
                     enhanced_data_context = f"{data_context}\n\nAnalysis Configuration:\n- Depth: {analysis_depth}\n- Include Visualizations: {enable_visualization}\n- Include Recommendations: {include_recommendations}"
 
-                    crew = crew_manager.create_crew(llm_provider, model_name, enhanced_data_context, human_in_loop, **llm_kwargs)
+                    # Identical data and settings return the stored analysis
+                    cache_inputs = {
+                        'data_sha256': hashlib.sha256(temp_path.read_bytes()).hexdigest(),
+                        'data_context': enhanced_data_context,
+                        'llm_provider': llm_provider,
+                        'model': model_name,
+                        'llm_kwargs': llm_kwargs,
+                        'human_in_loop': human_in_loop,
+                        'config': config_fingerprint(crew_manager.config_path)
+                    }
+
+                # Execute crew analysis in the background, streaming each task's findings as it completes
+                st.markdown("### 🔍 Hierarchical Analysis Workflow")
+                run = get_crew_execution_service().submit(
+                    "data_analysis",
+                    cache_inputs,
+                    lambda: crew_manager.create_crew(llm_provider, model_name, enhanced_data_context, human_in_loop, **llm_kwargs),
+                    use_cache=not force_fresh
+                )
+                render_crew_run(run, label="Analysis Task")
+
+                if run.status == "failed":
+                    get_dataset_registry().release(temp_path)
+                    st.error(f"❌ Error during analysis: {run.error}")
+                    return
 
-                with st.spinner("🔍 Executing hierarchical analysis workflow..."):
-                    # Execute crew analysis
-                    result = crew.kickoff()
+                result = run.result
 
                 # Display results
                 st.success("✅ Analysis completed successfully!")
@@ -1412,10 +1719,10 @@ def render_crew_interface():
 
                 with tabs[1]:
                     st.markdown("### Detailed Analysis Results")
-                    if hasattr(result, 'tasks_outputs'):
-                        for i, task_output in enumerate(result.tasks_outputs):
-                            st.markdown(f"#### Task {i+1}: {task_output.agent}")
-                            st.markdown(task_output.raw)
+                    for task_output in run.task_outputs:
+                        st.markdown(f"#### Task {task_output['index']}: {task_output['agent']}")
+                        st.markdown(task_output['output'])
+                    render_execution_metrics()
 
                 with tabs[2]:
                     st.markdown("### Business Insights")
@@ -1462,6 +1769,7 @@ def render_crew_interface():
                     )
 
                 # Cleanup temporary file after analysis
+                get_dataset_registry().release(temp_path)
                 if temp_path.exists():
                     temp_path.unlink()
 
@@ -13,6 +13,7 @@ import streamlit as st
 import yaml
 import json
 import os
+import sys
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +24,10 @@ from crewai import Agent, Task, Crew, LLM, Process
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+# Shared background execution service (agentic_frameworks/crewai/crew_execution.py)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from crew_execution import get_crew_execution_service, config_fingerprint, render_crew_run, render_execution_metrics
+
 
 load_dotenv()
 
@@ -679,6 +684,12 @@ def render_research_crew_interface():
             key='research_human_in_loop',
             help="Enable human review and approval at key stages"
         )
+        force_fresh = st.checkbox(
+            "Force Fresh Run",
+            value=False,
+            key='research_force_fresh',
+            help="Ignore the stored output for identical inputs and run the crew again"
+        )
 
     # Execute research
     if st.button("Start Research", type="primary", key='start_research'):
@@ -713,11 +724,32 @@ def render_research_crew_interface():
                 if llm_provider == "Ollama" and ollama_base_url:
                     llm_kwargs['base_url'] = ollama_base_url
 
-                crew = crew_manager.create_crew(llm_provider, model, research_input_dict, human_in_loop, **llm_kwargs)
+                # Execute crew in the background; identical research requests return the stored report
+                cache_inputs = {
+                    **research_input_dict,
+                    'llm_provider': llm_provider,
+                    'model': model,
+                    'llm_kwargs': llm_kwargs,
+                    'human_in_loop': human_in_loop,
+                    'config': config_fingerprint(crew_manager.config_path)
+                }
+                run = get_crew_execution_service().submit(
+                    "research_assistant",
+                    cache_inputs,
+                    lambda: crew_manager.create_crew(llm_provider, model, research_input_dict, human_in_loop, **llm_kwargs),
+                    use_cache=not force_fresh
+                )
+
+                # Stream each research phase as it completes
+                st.markdown("### 🔬 Conducting Research")
+                render_crew_run(run, label="Phase")
+
+                if run.status == "failed":
+                    st.error(f"Research error: {run.error}")
+                    st.info("Please check your API keys and try again.")
+                    return
 
-                # Execute crew
-                with st.spinner("🔬 Conducting research..."):
-                    result = crew.kickoff()
+                result = run.result
 
                 # Display results
                 st.success("✅ Research completed!")
@@ -731,10 +763,11 @@ def render_research_crew_interface():
 
                 with tab2:
                     st.markdown("### 📊 Research Process")
-                    for i, task in enumerate(crew.tasks, 1):
-                        with st.expander(f"Phase {i}: {task.agent.role}", expanded=False):
-                            st.write(f"**Objective:** {task.description}")
-                            st.write(f"**Deliverable:** {task.expected_output}")
+                    for task in run.task_outputs:
+                        with st.expander(f"Phase {task['index']}: {task['agent']}", expanded=False):
+                            st.write(f"**Objective:** {task['description']}")
+                            st.write(f"**Duration:** {task['latency']:.1f}s")
+                    render_execution_metrics()
 
                 with tab3:
                     st.markdown("### 🔍 Research Methodology")
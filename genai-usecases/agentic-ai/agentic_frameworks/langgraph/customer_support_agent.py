@@ -4,7 +4,7 @@ Features:
 - Intelligent conversation flow management
 - Multi-tier escalation patterns
 - Sentiment analysis and emotion detection
-- Knowledge base integration
+- Knowledge base integration (BM25 index over article files, optional embeddings, hot reload)
 - Ticket routing and prioritization
 - Human handoff capabilities
 - Real-time conversation context tracking
@@ -14,7 +14,7 @@ import streamlit as st
 import json
 import os
 from pathlib import Path
-from typing import Annotated, TypedDict, Literal, List, Dict, Any
+from typing import Annotated, TypedDict, Literal, List, Dict, Any, Optional
 from dotenv import load_dotenv
 
 # LangGraph imports
@@ -29,11 +29,13 @@ from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_groq import ChatGroq
-from langchain_ollama import ChatOllama
+from langchain_ollama import ChatOllama, OllamaEmbeddings
 
 # Pydantic for structured outputs
 from pydantic import BaseModel, Field
 
+from knowledge_base_index import DEFAULT_KNOWLEDGE_BASE_DIR, KnowledgeBaseIndex, kb_tokenize
+
 load_dotenv()
 
 def setup_langgraph_directories():
@@ -74,132 +76,30 @@ class EscalationDecision(BaseModel):
     recommended_department: str = Field(description="Recommended department")
     escalation_notes: str = Field(description="Additional notes for escalation")
 
-# Support Tools
-@tool
-def knowledge_base_search(query: str, category: str = "general") -> str:
-    """Search comprehensive knowledge base for relevant solutions"""
-    try:
-        # Comprehensive, practical knowledge base
-        knowledge_base = {
-            "technical": {
-                "login_issues": {
-                    "solution": "Login Problems Resolution: 1) Verify correct email/username 2) Check caps lock and typing 3) Clear browser cache and cookies 4) Try incognito/private mode 5) Reset password if needed",
-                    "follow_up": "If still unable to login, I can help reset your password or check for account lockouts.",
-                    "escalation": False
-                },
-                "password_reset": {
-                    "solution": "Password Reset Process: 1) Click 'Forgot Password' on login page 2) Enter registered email address 3) Check email (including spam folder) 4) Click reset link within 24 hours 5) Create new strong password",
-                    "follow_up": "Password reset emails are sent within 5 minutes. Let me know if you don't receive it.",
-                    "escalation": False
-                },
-                "app_crashes": {
-                    "solution": "App Crash Troubleshooting: 1) Force close and restart app 2) Check for app updates in store 3) Restart your device 4) Free up storage space (need 1GB free) 5) Reinstall app if problem persists",
-                    "follow_up": "If crashes continue, I can escalate to our technical team with your device details.",
-                    "escalation": True
-                },
-                "slow_performance": {
-                    "solution": "Performance Optimization: 1) Close other apps running in background 2) Check internet connection speed 3) Clear app cache in settings 4) Update to latest app version 5) Restart device daily",
-                    "follow_up": "Performance issues can also be network-related. What's your current internet speed?",
-                    "escalation": False
-                },
-                "connectivity": {
-                    "solution": "Connection Issues Fix: 1) Check internet connection (try other apps) 2) Switch between WiFi and mobile data 3) Restart router/modem 4) Clear app cache 5) Disable VPN temporarily 6) Check firewall settings",
-                    "follow_up": "Let me know which step resolved it, or if you need help with network settings.",
-                    "escalation": False
-                }
-            },
-            "billing": {
-                "payment_failed": {
-                    "solution": "Payment Failure Resolution: 1) Verify card details and expiration date 2) Check available balance/credit limit 3) Contact bank about international/online restrictions 4) Try different payment method 5) Update billing address to match bank records",
-                    "follow_up": "I can help update your payment method or process a manual payment over phone.",
-                    "escalation": False
-                },
-                "refund_request": {
-                    "solution": "Refund Process: 1) Refunds available within 30 days of purchase 2) Provide order/transaction number 3) Specify refund reason 4) Process takes 5-7 business days 5) Refund goes to original payment method",
-                    "follow_up": "I can initiate your refund request now. What's your order number and reason?",
-                    "escalation": False
-                },
-                "billing_dispute": {
-                    "solution": "Billing Dispute Resolution: 1) Review detailed invoice in account settings 2) Check for pro-rated charges or upgrades 3) Verify billing cycle dates 4) Compare with previous invoices 5) Contact billing team for adjustments",
-                    "follow_up": "I can review your billing history and explain any charges you're questioning.",
-                    "escalation": True
-                },
-                "subscription_change": {
-                    "solution": "Subscription Management: 1) Changes take effect next billing cycle 2) Upgrades are immediate, downgrades at cycle end 3) Cancel anytime in account settings 4) No cancellation fees 5) Keep access until period ends",
-                    "follow_up": "Would you like me to help you change your plan or show you the options?",
-                    "escalation": False
-                }
-            },
-            "account": {
-                "account_locked": {
-                    "solution": "Account Lockout Resolution: 1) Wait 15 minutes after 3 failed attempts 2) Use password reset to unlock immediately 3) Check email for security alerts 4) Verify no unauthorized access 5) Contact security team if suspicious activity",
-                    "follow_up": "I can unlock your account manually or help secure it if you suspect unauthorized access.",
-                    "escalation": False
-                },
-                "data_privacy": {
-                    "solution": "Data Privacy & Export: 1) Request data export in Privacy Settings 2) Processing takes 24-48 hours 3) Download link valid for 7 days 4) Includes all personal data and activity 5) Delete account option available",
-                    "follow_up": "I can initiate your data export request or help with privacy settings.",
-                    "escalation": False
-                },
-                "account_security": {
-                    "solution": "Security Enhancement: 1) Enable two-factor authentication 2) Use unique, strong passwords 3) Review recent login activity 4) Update security questions 5) Monitor for suspicious activity alerts",
-                    "follow_up": "Let me help you set up 2FA or review your recent account activity for security.",
-                    "escalation": False
-                },
-                "profile_issues": {
-                    "solution": "Profile Update Help: 1) Go to Account Settings > Profile 2) Edit information carefully 3) Verify email changes via confirmation link 4) Upload photos in JPG/PNG format 5) Save changes and refresh",
-                    "follow_up": "What specific profile information do you need help updating?",
-                    "escalation": False
-                }
-            },
-            "general": {
-                "feature_request": {
-                    "solution": "Feature Requests: 1) Submit ideas in app feedback section 2) Vote on existing requests in community forum 3) Follow product updates blog 4) Join beta testing program 5) Contact product team directly",
-                    "follow_up": "I can forward your feature request to our product team and add you to relevant update lists.",
-                    "escalation": True
-                },
-                "service_outage": {
-                    "solution": "Service Status: 1) Check status page at status.company.com 2) Follow @company_status on social media 3) Enable service notifications 4) Current issues posted in real-time 5) Estimated resolution times provided",
-                    "follow_up": "Let me check current service status and provide updates on any ongoing issues.",
-                    "escalation": False
-                }
-            }
-        }
-
-        # Advanced search with keyword matching
-        results = []
-        query_words = query.lower().split()
-
-        for cat, items in knowledge_base.items():
-            if category == "general" or cat == category:
-                for key, data in items.items():
-                    # Check for keyword matches
-                    key_words = key.replace('_', ' ').lower().split()
-                    solution_words = data["solution"].lower().split()
-
-                    match_score = 0
-                    for word in query_words:
-                        if word in key_words:
-                            match_score += 3
-                        elif word in solution_words:
-                            match_score += 1
-                        elif any(word in kw for kw in key_words):
-                            match_score += 2
-
-                    if match_score > 0:
-                        results.append({
-                            "title": key.replace('_', ' ').title(),
-                            "solution": data["solution"],
-                            "follow_up": data["follow_up"],
-                            "needs_escalation": data["escalation"],
-                            "score": match_score
-                        })
+# Knowledge Base (index lives in knowledge_base_index.py so it can be used without Streamlit)
+KB_CACHE_KEY = "kb_cache"
+KB_CACHE_SIZE = 32
 
-        # Sort by relevance score
-        results.sort(key=lambda x: x["score"], reverse=True)
+@st.cache_resource
+def get_knowledge_base(embedding_model: Optional[str] = None, ollama_base_url: Optional[str] = None) -> KnowledgeBaseIndex:
+    """Shared knowledge base index (built once per process, hot-reloaded on file changes)
 
-        if not results:
-            return """No specific knowledge base articles found for your query.
+    ``embedding_model`` (or ``SUPPORT_KB_EMBEDDINGS``) names a local Ollama
+    embedding model such as ``nomic-embed-text``; without one, search is BM25 only.
+    """
+    embedding_model = embedding_model or os.getenv("SUPPORT_KB_EMBEDDINGS")
+    embeddings = None
+    if embedding_model:
+        embedding_kwargs = {"model": embedding_model}
+        if ollama_base_url:
+            embedding_kwargs["base_url"] = ollama_base_url
+        embeddings = OllamaEmbeddings(**embedding_kwargs)
+    return KnowledgeBaseIndex(DEFAULT_KNOWLEDGE_BASE_DIR, embeddings=embeddings)
+
+def format_kb_results(results: List[Dict[str, Any]]) -> str:
+    """Format knowledge base articles for the response prompt"""
+    if not results:
+        return """No specific knowledge base articles found for your query.
 
             **How I can help you:**
             - Technical issues (login, app crashes, connectivity)
@@ -209,16 +109,22 @@ def knowledge_base_search(query: str, category: str = "general") -> str:
 
             Please provide more specific details about your issue, and I'll find the right solution."""
 
-        # Format top 2 results
-        formatted_results = []
-        for result in results[:2]:
-            formatted_results.append(f"""**{result['title']}**
+    formatted_results = []
+    for result in results:
+        formatted_results.append(f"""**{result['title']}**
 
 {result['solution']}
 
 *Next steps:* {result['follow_up']}""")
 
-        return "\n\n---\n\n".join(formatted_results)
+    return "\n\n---\n\n".join(formatted_results)
+
+# Support Tools
+@tool
+def knowledge_base_search(query: str, category: str = "general") -> str:
+    """Search comprehensive knowledge base for relevant solutions"""
+    try:
+        return format_kb_results(get_knowledge_base().search(query, category, top_k=2))
 
     except Exception as e:
         return f"Knowledge base search error: {str(e)}"
@@ -556,8 +462,16 @@ def knowledge_search_node(state: SupportState) -> SupportState:
     latest_message = messages[-1].content if messages else ""
     category = state["issue_category"]
 
-    # Search knowledge base
-    kb_results = knowledge_base_search.invoke({"query": latest_message, "category": category})
+    # Repeated lookups within a ticket are served from the conversation's cache;
+    # entries are keyed by index version so a reloaded knowledge base is searched again
+    kb_cache = state["conversation_context"].setdefault(KB_CACHE_KEY, {})
+    cache_key = f"{get_knowledge_base().version}:{category}:{' '.join(sorted(set(kb_tokenize(latest_message))))}"
+    kb_results = kb_cache.get(cache_key)
+    if kb_results is None:
+        kb_results = knowledge_base_search.invoke({"query": latest_message, "category": category})
+        kb_cache[cache_key] = kb_results
+        while len(kb_cache) > KB_CACHE_SIZE:
+            kb_cache.pop(next(iter(kb_cache)))
 
     state["conversation_context"]["knowledge_results"] = kb_results
     state["next_action"] = "response_generation"
@@ -758,6 +672,17 @@ def render_customer_support_interface():
         st.markdown("### 👤 Customer Info")
         customer_id = st.text_input("Customer ID", value="CUST_001", key='customer_id')
 
+        # Knowledge base status
+        st.markdown("### 📚 Knowledge Base")
+        kb_stats = get_knowledge_base().stats()
+        st.caption(f"{kb_stats['articles']} articles · {kb_stats['terms']} terms · "
+                   f"{'BM25 + embeddings' if kb_stats['embeddings'] else 'BM25'} · loaded {kb_stats['loaded_at']}")
+        if kb_stats['last_error']:
+            st.warning(f"Article files could not be read, serving the previous index: {kb_stats['last_error']}")
+        if st.button("🔃 Reload Articles", key='reload_kb'):
+            get_knowledge_base().reload()
+            st.rerun()
+
 
         # Reset conversation
         if st.button("🔄 New Conversation", key='reset_support'):
@@ -0,0 +1,218 @@
+"""
+Knowledge base index for the customer support agent
+- BM25 over article title, keywords and solution text with light stemming
+- Optional blend with embedding similarity
+- Hot reload when the article files change, keeping the last good index
+  if a file is malformed or still being written
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_KNOWLEDGE_BASE_DIR = Path(os.getenv("SUPPORT_KB_DIR", Path(__file__).parent / "knowledge_base"))
+_KB_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_KB_SIBILANT_ENDINGS = ("s", "x", "z", "ch", "sh")
+
+def _kb_stem(token: str) -> str:
+    """Light stemmer mapping plural/singular and inflected forms to one term
+
+    crashes/crash -> crash, devices/device -> devic, updates/updated/update -> updat
+    """
+    if token.endswith("ies") and len(token) > 4:
+        token = token[:-3] + "y"
+    elif token.endswith("es") and len(token) - 2 >= 3 and token[:-2].endswith(_KB_SIBILANT_ENDINGS):
+        token = token[:-2]
+    elif token.endswith("s") and not token.endswith("ss") and len(token) - 1 >= 3:
+        token = token[:-1]
+    elif token.endswith("ing") and len(token) - 3 >= 3:
+        token = token[:-3]
+    elif token.endswith("ed") and len(token) - 2 >= 3:
+        token = token[:-2]
+    # Drop a silent final "e" so "update" meets "updat(ed|ing)" and "devices" meets "device"
+    if token.endswith("e") and len(token) - 1 >= 3:
+        token = token[:-1]
+    return token
+
+def kb_tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with light suffix stripping (crashes -> crash)"""
+    return [_kb_stem(token) for token in _KB_TOKEN_RE.findall(text.lower())]
+
+class KnowledgeBaseIndex:
+    """BM25 index over knowledge base articles stored as JSON files
+
+    Each ``*.json`` file in ``kb_dir`` holds ``{"category": ..., "articles": [...]}``
+    with ``title``, ``keywords``, ``solution``, ``follow_up`` and ``escalation``
+    per article. Files are read once into an inverted index; searches check the
+    files' modification times at most every ``reload_interval`` seconds and
+    rebuild the index when they change. With an ``embeddings`` model (any
+    LangChain ``Embeddings``) the BM25 score is blended with cosine similarity.
+    """
+
+    # Title and keyword terms count more than terms in the solution text
+    FIELD_WEIGHTS = {"title": 3, "keywords": 2, "solution": 1}
+
+    def __init__(self, kb_dir: Path = DEFAULT_KNOWLEDGE_BASE_DIR, k1: float = 1.5, b: float = 0.75,
+                 embeddings=None, embedding_weight: float = 0.4, reload_interval: float = 2.0):
+        self.kb_dir = Path(kb_dir)
+        self.k1 = k1
+        self.b = b
+        self.embeddings = embeddings
+        self.embedding_weight = embedding_weight
+        self.reload_interval = reload_interval
+        self.version = 0
+        self.loaded_at = None
+        self.last_error: Optional[str] = None
+        self.articles: List[Dict[str, Any]] = []
+        self._postings: Dict[str, List[Tuple[int, float]]] = {}
+        self._idf: Dict[str, float] = {}
+        self._vectors = None
+        self._vector_cache: Dict[str, List[float]] = {}
+        self._signature = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        self.reload()
+
+    def _file_signature(self) -> Tuple:
+        if not self.kb_dir.is_dir():
+            return ()
+        return tuple(sorted(
+            (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+            for entry in os.scandir(self.kb_dir) if entry.name.endswith(".json")
+        ))
+
+    def _load_articles(self) -> List[Dict[str, Any]]:
+        articles = []
+        for path in sorted(self.kb_dir.glob("*.json")):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            category = data.get("category", path.stem)
+            for article in data.get("articles", []):
+                articles.append({
+                    "id": article.get("id", article["title"]),
+                    "title": article["title"],
+                    "category": article.get("category", category),
+                    "keywords": article.get("keywords", []),
+                    "solution": article["solution"],
+                    "follow_up": article.get("follow_up", ""),
+                    "escalation": article.get("escalation", False)
+                })
+        return articles
+
+    def _embed_articles(self, articles: List[Dict[str, Any]]):
+        """Normalized article vectors, reusing vectors of unchanged articles"""
+        texts = [f"{a['title']}. {' '.join(a['keywords'])}. {a['solution']}" for a in articles]
+        keys = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in texts]
+        missing = [i for i, key in enumerate(keys) if key not in self._vector_cache]
+        if missing:
+            vectors = self.embeddings.embed_documents([texts[i] for i in missing])
+            for i, vector in zip(missing, vectors):
+                self._vector_cache[keys[i]] = vector
+        self._vector_cache = {key: self._vector_cache[key] for key in keys}
+        return [_normalize(self._vector_cache[key]) for key in keys]
+
+    def reload(self) -> bool:
+        """Rebuild the index if the article files changed; returns True if rebuilt"""
+        with self._lock:
+            self._last_check = time.monotonic()
+            signature = self._file_signature()
+            if signature == self._signature:
+                return False
+
+            try:
+                articles = self._load_articles()
+            except (OSError, UnicodeDecodeError, ValueError, KeyError, TypeError, AttributeError) as e:
+                # Malformed or half-written file: keep serving the previous index and retry
+                # after reload_interval (the signature is left unchanged)
+                self.last_error = f"{type(e).__name__}: {e}"
+                return False
+            postings: Dict[str, List[Tuple[int, float]]] = {}
+            lengths = []
+            for doc_id, article in enumerate(articles):
+                term_freq = Counter()
+                for field, weight in self.FIELD_WEIGHTS.items():
+                    text = " ".join(article[field]) if field == "keywords" else article[field]
+                    for term in kb_tokenize(text):
+                        term_freq[term] += weight
+                lengths.append(sum(term_freq.values()))
+                for term, freq in term_freq.items():
+                    postings.setdefault(term, []).append((doc_id, freq))
+
+            # Fold the BM25 length normalization into the postings once
+            avg_length = sum(lengths) / max(1, len(lengths))
+            n_docs = len(articles)
+            idf = {}
+            for term, entries in postings.items():
+                idf[term] = math.log(1 + (n_docs - len(entries) + 0.5) / (len(entries) + 0.5))
+                postings[term] = [
+                    (doc_id, freq * (self.k1 + 1) / (freq + self.k1 * (1 - self.b + self.b * lengths[doc_id] / avg_length)))
+                    for doc_id, freq in entries
+                ]
+
+            vectors = self._embed_articles(articles) if self.embeddings is not None and articles else None
+
+            # Swap everything in at once so concurrent searches see a consistent index
+            self.articles, self._postings, self._idf, self._vectors = articles, postings, idf, vectors
+            self._signature = signature
+            self.version += 1
+            self.loaded_at = time.strftime("%Y-%m-%d %H:%M:%S")
+            self.last_error = None
+            return True
+
+    def maybe_reload(self) -> bool:
+        if time.monotonic() - self._last_check < self.reload_interval:
+            return False
+        return self.reload()
+
+    def search(self, query: str, category: str = "general", top_k: int = 2) -> List[Dict[str, Any]]:
+        """Top-k articles for a query; ``general`` searches every category"""
+        self.maybe_reload()
+        articles, postings, idf, vectors = self.articles, self._postings, self._idf, self._vectors
+
+        scores: Dict[int, float] = {}
+        for term in set(kb_tokenize(query)):
+            term_idf = idf.get(term)
+            if term_idf is None:
+                continue
+            for doc_id, weight in postings[term]:
+                scores[doc_id] = scores.get(doc_id, 0.0) + term_idf * weight
+
+        if vectors is not None and scores:
+            query_vector = _normalize(self.embeddings.embed_query(query))
+            top_score = max(scores.values())
+            scores = {
+                doc_id: (1 - self.embedding_weight) * score / top_score
+                + self.embedding_weight * sum(q * v for q, v in zip(query_vector, vectors[doc_id]))
+                for doc_id, score in scores.items()
+            }
+
+        candidates = (
+            (score, doc_id) for doc_id, score in scores.items()
+            if category == "general" or articles[doc_id]["category"] == category
+        )
+        return [
+            {**articles[doc_id], "score": round(score, 4)}
+            for score, doc_id in heapq.nlargest(top_k, candidates)
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "articles": len(self.articles),
+            "terms": len(self._postings),
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "embeddings": self.embeddings is not None,
+            "last_error": self.last_error
+        }
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
@@ -0,0 +1,63 @@
+"""Tests for the customer support knowledge base index"""
+
+import json
+import time
+
+from knowledge_base_index import KnowledgeBaseIndex, kb_tokenize
+
+
+ARTICLES = {
+    "category": "technical",
+    "articles": [
+        {"title": "Registering a new device", "keywords": ["device", "pairing"],
+         "solution": "Open Settings and add the device."},
+        {"title": "Installing app updates", "keywords": ["update", "version"],
+         "solution": "Download the latest update from the store."},
+        {"title": "Reporting login issues", "keywords": ["issue", "login"],
+         "solution": "Reset your password and try again."},
+    ]
+}
+
+
+def write_articles(kb_dir, data, name="technical.json"):
+    (kb_dir / name).write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_singular_and_plural_forms_share_a_term():
+    pairs = [("issue", "issues"), ("device", "devices"), ("update", "updates"),
+             ("crash", "crashes"), ("box", "boxes"), ("cache", "caches"), ("battery", "batteries")]
+    for singular, plural in pairs:
+        assert kb_tokenize(singular) == kb_tokenize(plural), (singular, plural)
+
+
+def test_inflected_forms_share_a_term():
+    assert kb_tokenize("update updated updating updates") == ["updat"] * 4
+    assert kb_tokenize("access passes") == ["access", "pass"]
+    assert kb_tokenize("uses use") == ["use", "use"]
+
+
+def test_plural_query_finds_singular_article(tmp_path):
+    write_articles(tmp_path, ARTICLES)
+    index = KnowledgeBaseIndex(tmp_path)
+
+    assert index.search("devices")[0]["title"] == "Registering a new device"
+    assert [r["title"] for r in index.search("update")] == [r["title"] for r in index.search("updates")]
+    assert index.search("login issues")[0]["title"] == "Reporting login issues"
+
+
+def test_malformed_file_keeps_previous_index(tmp_path):
+    write_articles(tmp_path, ARTICLES)
+    index = KnowledgeBaseIndex(tmp_path, reload_interval=0)
+    version = index.version
+
+    time.sleep(0.01)
+    (tmp_path / "technical.json").write_text('{"category": "technical", "articles": [', encoding="utf-8")
+
+    assert index.search("devices")[0]["title"] == "Registering a new device"
+    assert index.version == version
+    assert index.stats()["last_error"]
+
+    write_articles(tmp_path, {"category": "technical", "articles": ARTICLES["articles"][:1]})
+    assert len(index.search("update login device", top_k=5)) == 1
+    assert index.version == version + 1
+    assert index.stats()["last_error"] is None
@@ -8,6 +8,7 @@ intelligent agent coordination, and real-time workflow adaptation capabilities.
 Key Features:
 - Reactive architecture with pub/sub event management
 - Multi-agent coordination via centralized event bus
+- Queue-backed concurrent dispatch so publishers never block on handlers
 - Real-time workflow adaptation based on event streams
 - Advanced event-driven state management and persistence
 - Comprehensive monitoring and analytics dashboard
@@ -31,32 +32,23 @@ Use Cases:
 # =============================================================================
 
 import asyncio
+import contextvars
 import streamlit as st
 import json
 import time
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 import os
 from dataclasses import dataclass
 from enum import Enum
-from collections import defaultdict
-from queue import Queue
+from collections import defaultdict, deque
 
 # LangChain core components for LLM integration
 from langchain_core.messages import HumanMessage, SystemMessage
 
 # Multi-provider LLM support
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_groq import ChatGroq
-
-# Ollama integration with error handling
-try:
-    from langchain_ollama import ChatOllama
-except ImportError:
-    ChatOllama = None
+from llm_clients import create_llm, render_llm_client_stats
 
 # Load environment configuration
 load_dotenv()
@@ -120,12 +112,16 @@ class EventHandler:
         handler_func: Callable function for event processing
         priority: Processing priority for handler ordering
         active: Whether handler is enabled for processing
+        timeout: Maximum seconds a single invocation may run
+        max_concurrency: Maximum concurrent invocations of this handler
     """
     handler_id: str
     event_types: List[EventType]
     handler_func: Callable
     priority: int = 1
     active: bool = True
+    timeout: float = 120.0
+    max_concurrency: int = 4
 
 # =============================================================================
 # BACKEND: EVENT BUS AND MANAGEMENT SYSTEM
@@ -135,27 +131,71 @@ class EventBus:
     """
     Centralized event bus for pub/sub messaging and event coordination.
 
-    Manages event publication, subscription, routing, and processing with
-    comprehensive error handling, priority management, and analytics.
+    Publishing only enqueues the event: each event type has its own bounded
+    priority queue drained by worker tasks, so publishers never wait on slow
+    (LLM-backed) handlers unless the queue is full. Workers fan an event out to
+    all of its handlers concurrently, each under its own timeout and
+    concurrency limit.
+
+    Handlers that publish never wait on a full queue (their own worker may be
+    the one that has to drain it): the event goes to a per-type overflow
+    buffer of the same capacity, and is dropped and counted once that is full
+    too. Events still queued (or cut off mid-dispatch) when the bus moves to a
+    new event loop, e.g. the next ``asyncio.run`` after a publish without
+    waiting, are carried over; ``publish_nowait`` buffers events until a loop
+    is bound.
 
     Features:
     - Type-safe event routing and subscription management
-    - Priority-based event processing with handler ordering
-    - Comprehensive error handling with automatic recovery
-    - Real-time statistics and performance monitoring
-    - Asynchronous event processing with queue management
+    - Handler index pre-sorted by priority, rebuilt only on (un)subscribe
+    - Per-event-type queues and workers with backpressure on full queues
+    - Concurrent handler fan-out with per-handler timeouts
+    - Ring-buffer history with throughput and latency statistics
+
+    Args:
+        max_queue_size: Capacity of each event-type queue (publish waits when full)
+        workers_per_type: Worker tasks draining each event-type queue
+        history_size: Number of events kept in the history ring buffer
     """
 
-    def __init__(self):
+    # Set while a handler runs, so its publishes don't block on a full queue
+    _in_handler = contextvars.ContextVar("event_bus_in_handler", default=False)
+
+    def __init__(self, max_queue_size: int = 100, workers_per_type: int = 2, history_size: int = 500):
         """Initialize event bus with default configuration."""
         self.handlers = defaultdict(list)
-        self.event_history = []
-        self.event_queue = Queue()
-        self.processing = False
+        self.max_queue_size = max_queue_size
+        self.workers_per_type = workers_per_type
+        self.event_history = deque(maxlen=history_size)
+        self.latencies = deque(maxlen=history_size)
+        self.completion_times = deque(maxlen=history_size)
+        self._handler_index: Dict[EventType, Tuple[EventHandler, ...]] = {}
+        self._handler_limits: Dict[str, asyncio.Semaphore] = {}
+        self._queues: Dict[EventType, asyncio.PriorityQueue] = {}
+        self._workers: Dict[EventType, List[asyncio.Task]] = {}
+        self._queued: Dict[int, tuple] = {}           # Sequence -> queue item, until a worker takes it
+        self._overflow: Dict[EventType, deque] = {}
+        self._unbound: deque = deque()                # publish_nowait() events waiting for a loop
+        self._loop = None
+        self._idle = None
+        self._pending = 0
+        self._sequence = 0
         self.stats = {
             "events_published": 0,
             "events_processed": 0,
-            "handlers_registered": 0
+            "handlers_registered": 0,
+            "handler_errors": 0,
+            "handler_timeouts": 0,
+            "events_overflowed": 0,
+            "events_dropped": 0,
+            "events_by_type": defaultdict(int)
+        }
+
+    def _rebuild_index(self):
+        """Pre-sort handlers by priority (higher first) once per subscription change"""
+        self._handler_index = {
+            event_type: tuple(sorted(handlers, key=lambda h: h.priority, reverse=True))
+            for event_type, handlers in self.handlers.items()
         }
 
     def subscribe(self, handler: EventHandler):
@@ -168,6 +208,7 @@ class EventBus:
         for event_type in handler.event_types:
             self.handlers[event_type].append(handler)
         self.stats["handlers_registered"] += 1
+        self._rebuild_index()
 
     def unsubscribe(self, handler_id: str):
         """
@@ -181,50 +222,336 @@ class EventBus:
                 h for h in self.handlers[event_type]
                 if h.handler_id != handler_id
             ]
+        self._handler_limits.pop(handler_id, None)
+        self._rebuild_index()
+
+    def _bind_loop(self):
+        """(Re)create queues and workers when running on a new event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Queues and worker tasks belong to the loop that created them; events the
+            # old loop never handled are re-queued on the new one
+            carried = sorted(self._queued.values())
+            carried += [item for overflow in self._overflow.values() for item in overflow]
+            carried += [self._make_item(event) for event in self._unbound]
+            self._unbound.clear()
+
+            self._loop = loop
+            self._queues = {}
+            self._workers = {}
+            self._queued = {}
+            self._overflow = {}
+            self._handler_limits = {}
+            self._pending = 0
+            self._idle = asyncio.Event()
+            self._idle.set()
+            for item in carried:
+                self._enqueue_nowait(item)
+
+    def _queue_for(self, event_type: EventType) -> asyncio.PriorityQueue:
+        queue = self._queues.get(event_type)
+        if queue is None:
+            queue = asyncio.PriorityQueue(maxsize=self.max_queue_size)
+            self._queues[event_type] = queue
+            self._workers[event_type] = [
+                asyncio.create_task(self._worker(event_type, queue)) for _ in range(self.workers_per_type)
+            ]
+        return queue
+
+    def _make_item(self, event: Event) -> tuple:
+        self._sequence += 1
+        return (-event.priority, self._sequence, time.perf_counter(), event)
+
+    def _record_published(self, event: Event) -> bool:
+        """Count the event; returns False when nobody is subscribed to its type"""
+        self.event_history.append(event)
+        self.stats["events_published"] += 1
+        self.stats["events_by_type"][event.event_type.value] += 1
+        return bool(self._handler_index.get(event.event_type))
+
+    def _track(self, item: tuple):
+        self._queued[item[1]] = item
+        self._pending += 1
+        self._idle.clear()
+
+    def _enqueue_nowait(self, item: tuple):
+        """Queue without waiting; a full queue spills into the overflow buffer, then drops"""
+        event_type = item[3].event_type
+        queue = self._queue_for(event_type)
+        if not queue.full():
+            self._track(item)
+            queue.put_nowait(item)
+            return
+
+        overflow = self._overflow.setdefault(event_type, deque())
+        if len(overflow) < self.max_queue_size:
+            overflow.append(item)
+            self._pending += 1
+            self._idle.clear()
+            self.stats["events_overflowed"] += 1
+        else:
+            self.stats["events_dropped"] += 1
+
+    def _refill(self, event_type: EventType, queue: asyncio.PriorityQueue):
+        """Move overflowed events into the queue as workers free up space"""
+        overflow = self._overflow.get(event_type)
+        while overflow and not queue.full():
+            item = overflow.popleft()
+            self._pending -= 1      # _track counts it again
+            self._track(item)
+            queue.put_nowait(item)
 
     async def publish(self, event: Event):
         """
-        Publish event to all subscribed handlers with priority processing.
+        Enqueue an event for its subscribers without waiting for them.
+
+        Waits only when the event type's queue is full (backpressure).
 
         Args:
             event: Event instance to publish and route
         """
-        self.event_history.append(event)
-        self.stats["events_published"] += 1
+        self._bind_loop()
+        if not self._record_published(event):
+            return
+
+        item = self._make_item(event)
+        if self._in_handler.get():
+            self._enqueue_nowait(item)
+            return
+
+        self._track(item)
+        try:
+            await self._queue_for(event.event_type).put(item)
+        except BaseException:
+            self._queued.pop(item[1], None)
+            self._pending -= 1
+            if self._pending == 0:
+                self._idle.set()
+            raise
+
+    def publish_nowait(self, event: Event):
+        """
+        Publish without awaiting, from any thread.
+
+        Never blocks: a full queue spills into the overflow buffer. Before the
+        bus is bound to a running loop, events are held and queued on binding.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            if self._record_published(event):
+                self._unbound.append(event)
+            return
+
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if not on_loop:
+            try:
+                loop.call_soon_threadsafe(self.publish_nowait, event)
+            except RuntimeError:
+                # The loop closed in the meantime
+                if self._record_published(event):
+                    self._unbound.append(event)
+            return
 
-        # Get active handlers for this event type
-        handlers = self.handlers.get(event.event_type, [])
-        active_handlers = [h for h in handlers if h.active]
+        if self._record_published(event):
+            self._enqueue_nowait(self._make_item(event))
 
-        # Sort by priority (higher priority first)
-        active_handlers.sort(key=lambda x: x.priority, reverse=True)
+    async def drain(self, timeout: Optional[float] = None):
+        """Wait until every published event (including cascades) has been handled
 
-        # Process handlers with error handling
-        for handler in active_handlers:
+        On a new event loop, events carried over from the previous one are
+        queued and dispatched here first.
+        """
+        self._bind_loop()
+        await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+
+    async def shutdown(self):
+        """Cancel all worker tasks"""
+        workers = [task for tasks in self._workers.values() for task in tasks]
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queues, self._workers, self._queued, self._overflow, self._loop = {}, {}, {}, {}, None
+        self._pending = 0
+        if self._idle is not None:
+            self._idle.set()
+
+    async def _worker(self, event_type: EventType, queue: asyncio.PriorityQueue):
+        while True:
+            item = await queue.get()
+            _, sequence, enqueued_at, event = item
+            self._queued.pop(sequence, None)
+            self._refill(event_type, queue)
+            try:
+                handlers = [h for h in self._handler_index.get(event.event_type, ()) if h.active]
+                await asyncio.gather(*[self._run_handler(handler, event) for handler in handlers])
+                event.processed = True
+                self.latencies.append(time.perf_counter() - enqueued_at)
+                self.completion_times.append(time.perf_counter())
+            except asyncio.CancelledError:
+                # The loop is shutting down mid-dispatch: hand the event to the next loop
+                self._queued[sequence] = item
+                raise
+            finally:
+                queue.task_done()
+                self._pending -= 1
+                if self._pending == 0:
+                    self._idle.set()
+
+    async def _run_handler(self, handler: EventHandler, event: Event):
+        limit = self._handler_limits.get(handler.handler_id)
+        if limit is None:
+            limit = asyncio.Semaphore(handler.max_concurrency)
+            self._handler_limits[handler.handler_id] = limit
+
+        async with limit:
+            self._in_handler.set(True)
             try:
                 # Support both async and sync handler functions
                 if asyncio.iscoroutinefunction(handler.handler_func):
-                    await handler.handler_func(event)
+                    await asyncio.wait_for(handler.handler_func(event), timeout=handler.timeout)
                 else:
-                    handler.handler_func(event)
+                    await asyncio.wait_for(asyncio.to_thread(handler.handler_func, event), timeout=handler.timeout)
 
                 self.stats["events_processed"] += 1
 
+            except asyncio.TimeoutError:
+                self.stats["handler_timeouts"] += 1
+                self._record_handler_error(event, handler, f"Handler timed out after {handler.timeout}s")
             except Exception as e:
-                # Create error event for failed handler execution
-                error_event = Event(
-                    event_id=f"error_{int(time.time())}",
-                    event_type=EventType.ERROR_OCCURRED,
-                    source="event_bus",
-                    payload={"error": str(e), "original_event": event.event_id},
-                    timestamp=datetime.now().isoformat()
-                )
-                self.event_history.append(error_event)
+                self.stats["handler_errors"] += 1
+                self._record_handler_error(event, handler, str(e))
+
+    def _record_handler_error(self, event: Event, handler: EventHandler, error: str):
+        # Create error event for failed handler execution
+        error_event = Event(
+            event_id=f"error_{int(time.time())}",
+            event_type=EventType.ERROR_OCCURRED,
+            source="event_bus",
+            payload={"error": error, "handler": handler.handler_id, "original_event": event.event_id},
+            timestamp=datetime.now().isoformat()
+        )
+        self.event_history.append(error_event)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Throughput, dispatch latency percentiles and queue depths"""
+        latencies = sorted(self.latencies)
+        throughput = 0.0
+        if len(self.completion_times) > 1:
+            span = self.completion_times[-1] - self.completion_times[0]
+            throughput = (len(self.completion_times) - 1) / span if span > 0 else 0.0
+
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else 0.0
+
+        return {
+            **{key: value for key, value in self.stats.items() if key != "events_by_type"},
+            "events_by_type": dict(self.stats["events_by_type"]),
+            "throughput_per_sec": throughput,
+            "latency_p50_ms": percentile(0.5) * 1000,
+            "latency_p95_ms": percentile(0.95) * 1000,
+            "pending_events": self._pending,
+            "overflow_depths": {event_type.value: len(items) for event_type, items in self._overflow.items() if items},
+            "queue_depths": {event_type.value: queue.qsize() for event_type, queue in self._queues.items()}
+        }
 
 # =============================================================================
 # BACKEND: REACTIVE AGENTS AND INTELLIGENT PROCESSING
 # =============================================================================
 
+@dataclass
+class CoalescingPolicy:
+    """
+    Batching/debounce settings for one event type.
+
+    Attributes:
+        debounce: Quiet period (seconds) after the last event before flushing
+        max_wait: Flush at the latest this many seconds after the first buffered event
+        max_batch: Flush immediately once this many events are buffered
+    """
+    debounce: float = 0.5
+    max_wait: float = 2.0
+    max_batch: int = 20
+
+class EventCoalescer:
+    """
+    Buffers events of one type and hands them to ``flush_func`` as a batch.
+
+    A batch is flushed when no new event arrived for ``debounce`` seconds,
+    ``max_wait`` seconds after its first event, or when it reaches
+    ``max_batch`` events, whichever happens first.
+
+    Timer and flush tasks belong to the event loop that created them. When a
+    later call runs on a different loop (each Streamlit action uses its own
+    ``asyncio.run``), tasks left on the old, closed loop are discarded and a
+    new timer is scheduled for anything still buffered.
+    """
+
+    def __init__(self, policy: CoalescingPolicy, flush_func: Callable):
+        self.policy = policy
+        self.flush_func = flush_func
+        self._buffer: List[Event] = []
+        self._first_at = 0.0
+        self._last_at = 0.0
+        self._timer = None
+        self._flushing = set()
+
+    def submit(self, event: Event):
+        now = time.monotonic()
+        if not self._buffer:
+            self._first_at = now
+        self._last_at = now
+        self._buffer.append(event)
+
+        if len(self._buffer) >= self.policy.max_batch:
+            self._flush()
+        else:
+            self._ensure_timer()
+
+    def _rebind(self):
+        """Forget tasks created on another (closed) event loop; they will never run"""
+        loop = asyncio.get_running_loop()
+        if self._timer is not None and self._timer.get_loop() is not loop:
+            self._timer = None
+        # Filter in place: flush tasks' done-callbacks discard from this same set
+        self._flushing.difference_update([task for task in self._flushing if task.get_loop() is not loop])
+
+    def _ensure_timer(self):
+        self._rebind()
+        if self._buffer and (self._timer is None or self._timer.done()):
+            self._timer = asyncio.create_task(self._wait_and_flush())
+
+    async def _wait_and_flush(self):
+        while self._buffer:
+            due = min(self._last_at + self.policy.debounce, self._first_at + self.policy.max_wait)
+            remaining = due - time.monotonic()
+            if remaining <= 0:
+                self._flush()
+                return
+            await asyncio.sleep(remaining)
+
+    def _flush(self):
+        batch, self._buffer = self._buffer, []
+        task = asyncio.create_task(self.flush_func(batch))
+        self._flushing.add(task)
+        task.add_done_callback(lambda done: self._flushing.discard(done))
+
+    @property
+    def idle(self) -> bool:
+        return not self._buffer and not self._flushing
+
+    async def wait_idle(self):
+        """Wait until buffered events have been flushed and processed"""
+        self._ensure_timer()
+        while not self.idle:
+            pending = [task for task in [self._timer, *self._flushing] if task and not task.done()]
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            else:
+                await asyncio.sleep(0)
+
 class ReactiveAgent:
     """
     Intelligent reactive agent with LLM-powered event processing.
@@ -238,20 +565,45 @@ class ReactiveAgent:
     - Dynamic event subscription and handler registration
     - Error handling with automatic recovery mechanisms
     - Context-aware response generation and coordination
+    - Batching/debounce of bursty event types into a single LLM call
 
     Args:
         agent_id: Unique identifier for the agent
         llm: Language model for intelligent processing
         event_bus: Central event bus for coordination
+        coalescing: Per-event-type batching policies (defaults to DEFAULT_COALESCING;
+            pass an empty dict to handle every event individually)
     """
 
-    def __init__(self, agent_id: str, llm, event_bus: EventBus):
+    DEFAULT_COALESCING = {
+        EventType.DATA_UPDATED: CoalescingPolicy(debounce=0.5, max_wait=2.0, max_batch=20),
+        EventType.USER_INPUT: CoalescingPolicy(debounce=0.2, max_wait=1.0, max_batch=5)
+    }
+
+    def __init__(self, agent_id: str, llm, event_bus: EventBus,
+                 coalescing: Optional[Dict[EventType, CoalescingPolicy]] = None):
         """Initialize reactive agent with LLM and event bus integration."""
         self.agent_id = agent_id
         self.llm = llm
         self.event_bus = event_bus
         self.state = {}
         self.active = True
+        self.coalescing_stats = {
+            "events_received": 0,
+            "llm_calls": 0,
+            "batches": 0,
+            "superseded_updates": 0
+        }
+
+        policies = self.DEFAULT_COALESCING if coalescing is None else coalescing
+        batch_handlers = {
+            EventType.DATA_UPDATED: self._handle_data_updates,
+            EventType.USER_INPUT: self._handle_user_inputs
+        }
+        self.coalescers = {
+            event_type: EventCoalescer(policy, self._guarded(batch_handlers[event_type]))
+            for event_type, policy in policies.items() if event_type in batch_handlers
+        }
 
         # Register event handlers for automatic processing
         self._register_handlers()
@@ -266,11 +618,36 @@ class ReactiveAgent:
         )
         self.event_bus.subscribe(handler)
 
+    def _guarded(self, batch_handler: Callable) -> Callable:
+        """Wrap a batch handler so failures become ERROR_OCCURRED events"""
+        async def run(events: List[Event]):
+            self.coalescing_stats["batches"] += 1
+            try:
+                await batch_handler(events)
+            except Exception as e:
+                await self._publish_error(e, events[-1])
+        return run
+
+    async def _publish_error(self, error: Exception, event: Event):
+        await self.event_bus.publish(Event(
+            event_id=f"agent_error_{int(time.time())}",
+            event_type=EventType.ERROR_OCCURRED,
+            source=self.agent_id,
+            payload={"error": str(error), "original_event": event.event_id},
+            timestamp=datetime.now().isoformat()
+        ))
+
     async def _handle_event(self, event: Event):
         """Handle incoming events"""
         if not self.active:
             return
 
+        self.coalescing_stats["events_received"] += 1
+        coalescer = self.coalescers.get(event.event_type)
+        if coalescer:
+            coalescer.submit(event)
+            return
+
         try:
             if event.event_type == EventType.USER_INPUT:
                 await self._handle_user_input(event)
@@ -280,25 +657,34 @@ class ReactiveAgent:
                 await self._handle_data_update(event)
 
         except Exception as e:
-            await self.event_bus.publish(Event(
-                event_id=f"agent_error_{int(time.time())}",
-                event_type=EventType.ERROR_OCCURRED,
-                source=self.agent_id,
-                payload={"error": str(e), "original_event": event.event_id},
-                timestamp=datetime.now().isoformat()
-            ))
+            await self._publish_error(e, event)
+
+    async def wait_idle(self):
+        """Wait until all buffered events have been flushed and handled"""
+        await asyncio.gather(*[coalescer.wait_idle() for coalescer in self.coalescers.values()])
+
+    @property
+    def idle(self) -> bool:
+        return all(coalescer.idle for coalescer in self.coalescers.values())
 
     async def _handle_user_input(self, event: Event):
         """Handle user input events"""
-        user_input = event.payload.get("input", "")
+        await self._handle_user_inputs([event])
+
+    async def _handle_user_inputs(self, events: List[Event]):
+        """Answer one or more buffered user inputs with a single LLM call"""
+        inputs = [event.payload.get("input", "") for event in events]
+        user_input = inputs[0] if len(inputs) == 1 else "\n".join(f"{i}. {text}" for i, text in enumerate(inputs, 1))
 
         # Process with LLM
         messages = [
-            SystemMessage(content=f"You are reactive agent {self.agent_id}. Respond to user input appropriately."),
+            SystemMessage(content=f"You are reactive agent {self.agent_id}. Respond to user input appropriately."
+                          + (" Several inputs arrived together; address each of them in one reply." if len(inputs) > 1 else "")),
             HumanMessage(content=f"User input: {user_input}\n\nCurrent state: {json.dumps(self.state)}")
         ]
 
         response = await self.llm.ainvoke(messages)
+        self.coalescing_stats["llm_calls"] += 1
 
         # Update state
         self.state["last_response"] = response.content
@@ -309,7 +695,7 @@ class ReactiveAgent:
             event_id=f"agent_response_{int(time.time())}",
             event_type=EventType.AGENT_MESSAGE,
             source=self.agent_id,
-            payload={"response": response.content, "user_input": user_input},
+            payload={"response": response.content, "user_input": user_input, "batched_events": len(events)},
             timestamp=datetime.now().isoformat()
         ))
 
@@ -326,6 +712,7 @@ class ReactiveAgent:
         ]
 
         response = await self.llm.ainvoke(messages)
+        self.coalescing_stats["llm_calls"] += 1
 
         # Check if new tasks should be triggered
         if "follow-up" in response.content.lower() or "next" in response.content.lower():
@@ -339,7 +726,17 @@ class ReactiveAgent:
 
     async def _handle_data_update(self, event: Event):
         """Handle data update events"""
-        updated_data = event.payload.get("data", {})
+        await self._handle_data_updates([event])
+
+    async def _handle_data_updates(self, events: List[Event]):
+        """Merge buffered data updates (later values win) and analyse them in one LLM call"""
+        updated_data = {}
+        for event in events:
+            for key, value in event.payload.get("data", {}).items():
+                if key in updated_data:
+                    # Intermediate value replaced before it was ever analysed
+                    self.coalescing_stats["superseded_updates"] += 1
+                updated_data[key] = value
 
         # Update internal state based on new data
         self.state.update(updated_data)
@@ -353,13 +750,14 @@ class ReactiveAgent:
         ]
 
         response = await self.llm.ainvoke(messages)
+        self.coalescing_stats["llm_calls"] += 1
 
         # Publish analysis
         await self.event_bus.publish(Event(
             event_id=f"data_analysis_{int(time.time())}",
             event_type=EventType.AGENT_MESSAGE,
             source=self.agent_id,
-            payload={"analysis": response.content, "updated_data": updated_data},
+            payload={"analysis": response.content, "updated_data": updated_data, "batched_events": len(events)},
             timestamp=datetime.now().isoformat()
         ))
 
@@ -399,8 +797,8 @@ class EventDrivenWorkflow:
         self.agents[agent_id] = agent
         return agent
 
-    async def start_workflow(self, initial_input: str):
-        """Start the event-driven workflow"""
+    async def start_workflow(self, initial_input: str, wait: bool = True):
+        """Start the event-driven workflow, optionally waiting until agents have reacted"""
         self.workflow_state = "running"
 
         # Publish workflow start event
@@ -421,8 +819,12 @@ class EventDrivenWorkflow:
             timestamp=datetime.now().isoformat()
         ))
 
-    async def trigger_event(self, event_type: EventType, payload: Dict[str, Any], source: str = "user"):
-        """Manually trigger an event"""
+        if wait:
+            await self.settle()
+
+    async def trigger_event(self, event_type: EventType, payload: Dict[str, Any], source: str = "user",
+                            wait: bool = True):
+        """Manually trigger an event, optionally waiting until it has been handled"""
         event = Event(
             event_id=f"manual_event_{int(time.time())}",
             event_type=event_type,
@@ -432,56 +834,34 @@ class EventDrivenWorkflow:
         )
 
         await self.event_bus.publish(event)
+        if wait:
+            await self.settle()
         return event
 
+    async def settle(self):
+        """Wait until the bus and every agent's batching buffers are quiet"""
+        while True:
+            await self.event_bus.drain()
+            await asyncio.gather(*[agent.wait_idle() for agent in self.agents.values()])
+            if self.event_bus.get_stats()["pending_events"] == 0 and all(a.idle for a in self.agents.values()):
+                return
+
     def get_workflow_stats(self) -> Dict[str, Any]:
         """Get workflow execution statistics"""
+        coalescing = defaultdict(int)
+        for agent in self.agents.values():
+            for key, value in agent.coalescing_stats.items():
+                coalescing[key] += value
+
         return {
+            "coalescing": dict(coalescing),
             "workflow_state": self.workflow_state,
             "active_agents": len([a for a in self.agents.values() if a.active]),
-            "total_events": len(self.event_bus.event_history),
-            "event_stats": self.event_bus.stats,
-            "recent_events": self.event_bus.event_history[-10:] if self.event_bus.event_history else []
+            "total_events": self.event_bus.stats["events_published"],
+            "event_stats": self.event_bus.get_stats(),
+            "recent_events": list(self.event_bus.event_history)[-10:]
         }
 
-# =============================================================================
-# BACKEND: LLM PROVIDER CONFIGURATION
-# =============================================================================
-
-def create_llm(provider: str, model: str, base_url: str = None):
-    """
-    Create LLM instance based on provider with comprehensive multi-provider support.
-
-    Args:
-        provider: LLM provider ("Ollama", "Gemini", "Groq", "Anthropic", "OpenAI")
-        model: Model identifier for the specific provider
-        base_url: Optional base URL for self-hosted providers (Ollama)
-
-    Returns:
-        Configured LLM instance ready for reactive agent integration
-
-    Raises:
-        ValueError: If provider is not supported
-        ConnectionError: If API keys are missing or invalid
-    """
-    if provider == "Ollama" and ChatOllama:
-        return ChatOllama(
-            model=model,
-            base_url=base_url or 'http://localhost:11434',
-            temperature=0.3,
-            timeout=120
-        )
-    elif provider == "Gemini":
-        return ChatGoogleGenerativeAI(model=model, api_key=os.getenv("GEMINI_API_KEY"), temperature=0.3)
-    elif provider == "Groq":
-        return ChatGroq(model=model, api_key=os.getenv("GROQ_API_KEY"), temperature=0.3)
-    elif provider == "Anthropic":
-        return ChatAnthropic(model=model, api_key=os.getenv("ANTHROPIC_API_KEY"), temperature=0.3)
-    elif provider == "OpenAI":
-        return ChatOpenAI(model=model, api_key=os.getenv("OPENAI_API_KEY"), temperature=0.3)
-    else:
-        raise ValueError(f"Unsupported provider: {provider}")
-
 # =============================================================================
 # FRONTEND: STREAMLIT INTERFACE AND USER INTERACTIONS
 # =============================================================================
@@ -589,6 +969,8 @@ def render_event_driven_interface():
             else:
                 st.warning(f"⚠️ {required_key} not found")
 
+        render_llm_client_stats()
+
     # =============================================================================
     # WORKFLOW INITIALIZATION
     # =============================================================================
@@ -715,6 +1097,10 @@ def render_event_driven_interface():
                             agent.active = not agent.active
                             st.rerun()
 
+                    st.caption(
+                        f"Events received: {agent.coalescing_stats['events_received']} · "
+                        f"LLM calls: {agent.coalescing_stats['llm_calls']}"
+                    )
                     st.markdown("**Current State:**")
                     st.json(agent.state)
 
@@ -722,15 +1108,30 @@ def render_event_driven_interface():
             st.markdown("### 📈 Event Analytics")
 
             # Event type distribution
-            event_types = {}
-            for event in workflow.event_bus.event_history:
-                event_type = event.event_type.value if hasattr(event, 'event_type') else event.get('event_type', 'unknown')
-                event_types[event_type] = event_types.get(event_type, 0) + 1
-
             st.markdown("**Event Type Distribution:**")
-            for event_type, count in event_types.items():
+            for event_type, count in stats["event_stats"]["events_by_type"].items():
                 st.write(f"• **{event_type}**: {count}")
 
+            # Dispatch performance
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Throughput", f"{stats['event_stats']['throughput_per_sec']:.1f} events/s")
+            with col2:
+                st.metric("Dispatch Latency p50", f"{stats['event_stats']['latency_p50_ms']:.0f} ms")
+            with col3:
+                st.metric("Dispatch Latency p95", f"{stats['event_stats']['latency_p95_ms']:.0f} ms")
+            coalescing = stats["coalescing"]
+            st.caption(
+                f"Agent events received: {coalescing.get('events_received', 0)} · "
+                f"LLM calls: {coalescing.get('llm_calls', 0)} · "
+                f"superseded updates dropped: {coalescing.get('superseded_updates', 0)}"
+            )
+            st.caption(
+                f"Handler errors: {stats['event_stats']['handler_errors']} · "
+                f"timeouts: {stats['event_stats']['handler_timeouts']} · "
+                f"pending: {stats['event_stats']['pending_events']}"
+            )
+
             # Processing efficiency
             total_events = stats["event_stats"]["events_published"]
             processed_events = stats["event_stats"]["events_processed"]
@@ -752,11 +1153,13 @@ def render_event_driven_interface():
         - Centralized event bus for coordination
         - Type-safe event definitions
         - Priority-based event handling
+        - Per-event-type queues with concurrent, time-limited handlers
 
         🔄 **Dynamic Adaptation**
         - Workflow adapts based on events
         - Real-time state management
         - Intelligent agent coordination
+        - Bursts of updates batched and debounced into one LLM call
 
         🛡️ **Fault Tolerance**
         - Event-level error handling
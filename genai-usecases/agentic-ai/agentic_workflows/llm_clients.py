@@ -0,0 +1,566 @@
+"""
+Shared LLM Client Registry
+==========================
+
+Process-wide registry of chat model clients shared by every workflow pattern
+in this package (prompt chaining, query routing, parallel execution,
+event-driven and tool orchestration).
+
+Key Features:
+- One client per (provider, model, base_url), reused across Streamlit reruns
+  so HTTP connection pools and auth setup are paid once
+- Global concurrency and requests-per-second budget across all workflows
+- Per-client call, error, latency and token counters
+- Ollama-compatible stand-in server for offline load testing
+
+Usage:
+    from llm_clients import create_llm, llm_registry
+
+    llm = create_llm("Gemini", "gemini-2.5-flash")
+    llm_registry.configure(max_concurrency=8, requests_per_second=5)
+    llm_registry.get_stats()
+
+Offline load test (starts a local stand-in and drives it through ChatOllama):
+    python agentic_workflows/llm_clients.py --requests 200 --concurrency 16
+"""
+
+# =============================================================================
+# IMPORTS AND CONFIGURATION
+# =============================================================================
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+from langchain_core.runnables import Runnable
+
+# Load environment variables for API keys
+load_dotenv()
+
+DEFAULT_OLLAMA_URL = "http://localhost:11434"
+DEFAULT_TEMPERATURE = 0.3
+
+# =============================================================================
+# BACKEND: BUDGETS AND METRICS
+# =============================================================================
+
+class RateBudget:
+    """
+    Thread-safe token bucket shared by every client.
+
+    ``reserve()`` takes a token immediately and returns how long the caller
+    must wait before using it, so concurrent callers queue up fairly.
+    """
+
+    def __init__(self, requests_per_second: float, burst: Optional[int] = None):
+        self.rate = requests_per_second
+        self.capacity = burst or max(1, int(requests_per_second))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class ConcurrencyLimit:
+    """
+    Counting semaphore usable from threads and from any event loop.
+
+    A released permit is handed directly to the oldest waiter: a thread is
+    woken through its Event, a coroutine through its future on the owning
+    loop, so async callers wait without polling or blocking their loop.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._in_use = 0
+        self._waiters: deque = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            if self._in_use < self.limit and not self._waiters:
+                self._in_use += 1
+                return
+            granted = threading.Event()
+            self._waiters.append(granted)
+        granted.wait()
+
+    async def acquire_async(self):
+        with self._lock:
+            if self._in_use < self.limit and not self._waiters:
+                self._in_use += 1
+                return
+            granted = asyncio.get_running_loop().create_future()
+            self._waiters.append(granted)
+        try:
+            await granted
+        except asyncio.CancelledError:
+            with self._lock:
+                if granted in self._waiters:
+                    self._waiters.remove(granted)
+                    raise
+            # The permit was handed over before the cancellation landed
+            if not granted.cancelled():
+                self.release()
+            raise
+
+    def _grant(self, future: asyncio.Future):
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+    def release(self):
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                    return
+                try:
+                    waiter.get_loop().call_soon_threadsafe(self._grant, waiter)
+                    return
+                except RuntimeError:
+                    continue  # Waiter's event loop is closed
+            if self._in_use <= 0:
+                raise ValueError("ConcurrencyLimit released too many times")
+            self._in_use -= 1
+
+
+class ClientStats:
+    """Call, error, latency and token counters for one registered client"""
+
+    def __init__(self, window: int = 500):
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.total_latency = 0.0
+        self.throttled_time = 0.0
+        self.latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, usage: Optional[Dict[str, Any]] = None, error: bool = False):
+        with self._lock:
+            self.calls += 1
+            self.errors += int(error)
+            self.total_latency += latency
+            self.latencies.append(latency)
+            if usage:
+                self.input_tokens += usage.get("input_tokens", 0) or 0
+                self.output_tokens += usage.get("output_tokens", 0) or 0
+
+    def start_call(self, throttled: float):
+        with self._lock:
+            self.throttled_time += throttled
+            self.in_flight += 1
+
+    def end_call(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self.latencies)
+            p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] if latencies else 0.0
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "avg_latency_ms": self.total_latency / self.calls * 1000 if self.calls else 0.0,
+                "p95_latency_ms": p95 * 1000,
+                "input_tokens": self.input_tokens,
+                "output_tokens": self.output_tokens,
+                "throttled_seconds": self.throttled_time
+            }
+
+
+def _usage(message) -> Optional[Dict[str, Any]]:
+    return getattr(message, "usage_metadata", None)
+
+# =============================================================================
+# BACKEND: MANAGED CLIENT AND REGISTRY
+# =============================================================================
+
+class BudgetedRunnable(Runnable):
+    """
+    Runnable wrapper that enforces the registry budget and records metrics.
+
+    ``invoke``/``ainvoke``/``stream``/``astream`` of the wrapped runnable run
+    inside a registry slot; the counters go to the owning client's stats.
+    """
+
+    def __init__(self, runnable, registry: "LLMClientRegistry", stats: "ClientStats"):
+        self.runnable = runnable
+        self.registry = registry
+        self.stats = stats
+
+    def __getattr__(self, name):
+        if name == "runnable":
+            raise AttributeError(name)
+        return getattr(self.runnable, name)
+
+    def __repr__(self):
+        return f"BudgetedRunnable({self.runnable!r})"
+
+    def invoke(self, input, config=None, **kwargs):
+        with self.registry.slot(self.stats):
+            start = time.perf_counter()
+            try:
+                result = self.runnable.invoke(input, config, **kwargs)
+            except Exception:
+                self.stats.record(time.perf_counter() - start, error=True)
+                raise
+            self.stats.record(time.perf_counter() - start, _usage(result))
+            return result
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        async with self.registry.aslot(self.stats):
+            start = time.perf_counter()
+            try:
+                result = await self.runnable.ainvoke(input, config, **kwargs)
+            except Exception:
+                self.stats.record(time.perf_counter() - start, error=True)
+                raise
+            self.stats.record(time.perf_counter() - start, _usage(result))
+            return result
+
+    def stream(self, input, config=None, **kwargs):
+        with self.registry.slot(self.stats):
+            start = time.perf_counter()
+            usage = None
+            try:
+                for chunk in self.runnable.stream(input, config, **kwargs):
+                    usage = _usage(chunk) or usage
+                    yield chunk
+            except Exception:
+                self.stats.record(time.perf_counter() - start, error=True)
+                raise
+            self.stats.record(time.perf_counter() - start, usage)
+
+    async def astream(self, input, config=None, **kwargs):
+        async with self.registry.aslot(self.stats):
+            start = time.perf_counter()
+            usage = None
+            try:
+                async for chunk in self.runnable.astream(input, config, **kwargs):
+                    usage = _usage(chunk) or usage
+                    yield chunk
+            except Exception:
+                self.stats.record(time.perf_counter() - start, error=True)
+                raise
+            self.stats.record(time.perf_counter() - start, usage)
+
+
+class ManagedChatModel(BudgetedRunnable):
+    """
+    Chat model wrapper that enforces the registry budget and records metrics.
+
+    Behaves like the wrapped LangChain chat model (usable in LCEL pipes); any
+    other attribute is delegated to the underlying client. Runnables derived
+    through ``bind_tools``/``with_structured_output`` stay on the budget.
+    """
+
+    _DERIVED_RUNNABLES = ("bind_tools", "with_structured_output")
+
+    def __init__(self, key: Tuple[str, str, Optional[str]], client, registry: "LLMClientRegistry"):
+        super().__init__(client, registry, ClientStats())
+        self.key = key
+
+    @property
+    def client(self):
+        return self.runnable
+
+    def __getattr__(self, name):
+        attribute = super().__getattr__(name)
+        if name in self._DERIVED_RUNNABLES:
+            def derive(*args, **kwargs):
+                return BudgetedRunnable(attribute(*args, **kwargs), self.registry, self.stats)
+            return derive
+        return attribute
+
+    def __repr__(self):
+        provider, model, base_url = self.key
+        return f"ManagedChatModel({provider}, {model}{', ' + base_url if base_url else ''})"
+
+
+class LLMClientRegistry:
+    """
+    Process-wide cache of chat model clients with a shared call budget.
+
+    Streamlit re-executes each page script on every interaction, but imported
+    modules (and therefore this registry) live for the whole process, so a
+    client is built once per (provider, model, base_url) and its HTTP
+    connection pool is reused by every workflow and session.
+
+    Args:
+        max_concurrency: Maximum LLM calls in flight across all clients
+        requests_per_second: Optional global request rate budget
+    """
+
+    def __init__(self, max_concurrency: int = 8, requests_per_second: Optional[float] = None):
+        self._clients: Dict[Tuple[str, str, Optional[str]], ManagedChatModel] = {}
+        self._lock = threading.Lock()
+        self.configure(max_concurrency, requests_per_second)
+
+    def configure(self, max_concurrency: Optional[int] = None, requests_per_second: Optional[float] = None):
+        """Set the global concurrency limit and request rate (``requests_per_second=0`` disables it)"""
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+            # Calls in flight keep (and release) the limit they acquired
+            self._limit = ConcurrencyLimit(max_concurrency)
+        if requests_per_second is not None or not hasattr(self, "rate_budget"):
+            self.rate_budget = RateBudget(requests_per_second) if requests_per_second else None
+
+    def get(self, provider: str, model: str, base_url: Optional[str] = None) -> ManagedChatModel:
+        """Return the shared client for (provider, model, base_url), creating it on first use"""
+        if provider == "Ollama":
+            base_url = base_url or DEFAULT_OLLAMA_URL
+        key = (provider, model, base_url)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = ManagedChatModel(key, self._build_client(provider, model, base_url), self)
+                    self._clients[key] = client
+        return client
+
+    @staticmethod
+    def _build_client(provider: str, model: str, base_url: Optional[str]):
+        # Provider SDKs are imported on demand so unused ones cost nothing at startup
+        if provider == "Ollama":
+            from langchain_ollama import ChatOllama
+            return ChatOllama(model=model, base_url=base_url, temperature=DEFAULT_TEMPERATURE, timeout=120)
+        elif provider == "Gemini":
+            from langchain_google_genai import ChatGoogleGenerativeAI
+            return ChatGoogleGenerativeAI(model=model, api_key=os.getenv("GEMINI_API_KEY"), temperature=DEFAULT_TEMPERATURE)
+        elif provider == "Groq":
+            from langchain_groq import ChatGroq
+            return ChatGroq(model=model, api_key=os.getenv("GROQ_API_KEY"), temperature=DEFAULT_TEMPERATURE)
+        elif provider == "Anthropic":
+            from langchain_anthropic import ChatAnthropic
+            return ChatAnthropic(model=model, api_key=os.getenv("ANTHROPIC_API_KEY"), temperature=DEFAULT_TEMPERATURE)
+        elif provider == "OpenAI":
+            from langchain_openai import ChatOpenAI
+            return ChatOpenAI(model=model, api_key=os.getenv("OPENAI_API_KEY"), temperature=DEFAULT_TEMPERATURE)
+        else:
+            raise ValueError(f"Unsupported provider: {provider}")
+
+    @contextmanager
+    def slot(self, stats: ClientStats):
+        """Hold one unit of the global budget for a synchronous call"""
+        waited = time.perf_counter()
+        rate_budget, limit = self.rate_budget, self._limit
+        if rate_budget:
+            time.sleep(rate_budget.reserve())
+        limit.acquire()
+        stats.start_call(time.perf_counter() - waited)
+        try:
+            yield
+        finally:
+            stats.end_call()
+            limit.release()
+
+    @asynccontextmanager
+    async def aslot(self, stats: ClientStats):
+        """Hold one unit of the global budget without blocking the event loop"""
+        waited = time.perf_counter()
+        rate_budget, limit = self.rate_budget, self._limit
+        if rate_budget:
+            delay = rate_budget.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+        await limit.acquire_async()
+        stats.start_call(time.perf_counter() - waited)
+        try:
+            yield
+        finally:
+            stats.end_call()
+            limit.release()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-client counters keyed by 'provider/model[@base_url]'"""
+        return {
+            f"{provider}/{model}" + (f"@{base_url}" if base_url and base_url != DEFAULT_OLLAMA_URL else ""): client.stats.snapshot()
+            for (provider, model, base_url), client in list(self._clients.items())
+        }
+
+    def clear(self):
+        """Drop all cached clients (e.g. after changing API keys)"""
+        with self._lock:
+            self._clients.clear()
+
+
+llm_registry = LLMClientRegistry(
+    max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+    requests_per_second=float(os.getenv("LLM_REQUESTS_PER_SECOND", "0")) or None
+)
+
+
+def create_llm(provider: str, model: str, base_url: str = None):
+    """
+    Get the shared LLM client for a provider and model.
+
+    Args:
+        provider: LLM provider ("Gemini", "Ollama", "Groq", "Anthropic", "OpenAI")
+        model: Model identifier for the specific provider
+        base_url: Optional base URL for self-hosted providers (Ollama or a compatible stand-in)
+
+    Returns:
+        Budgeted, instrumented chat model reused across calls
+
+    Raises:
+        ValueError: If provider is not supported
+    """
+    return llm_registry.get(provider, model, base_url)
+
+# =============================================================================
+# FRONTEND: CLIENT STATISTICS
+# =============================================================================
+
+def render_llm_client_stats():
+    """Sidebar expander with the shared budget and per-client counters"""
+    import streamlit as st
+
+    with st.expander("📡 Shared LLM Clients", expanded=False):
+        max_concurrency = st.number_input(
+            "Global max concurrent calls", 1, 64, llm_registry.max_concurrency, key='llm_registry_concurrency'
+        )
+        if max_concurrency != llm_registry.max_concurrency:
+            llm_registry.configure(max_concurrency=max_concurrency)
+
+        stats = llm_registry.get_stats()
+        if not stats:
+            st.caption("No clients created yet")
+        for name, client_stats in stats.items():
+            st.markdown(f"**{name}**")
+            st.caption(
+                f"{client_stats['calls']} calls · {client_stats['errors']} errors · "
+                f"avg {client_stats['avg_latency_ms']:.0f} ms · p95 {client_stats['p95_latency_ms']:.0f} ms · "
+                f"tokens {client_stats['input_tokens']} in / {client_stats['output_tokens']} out"
+            )
+
+# =============================================================================
+# OFFLINE LOAD TESTING: OLLAMA-COMPATIBLE STAND-IN
+# =============================================================================
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Minimal Ollama API (/api/tags, /api/chat) returning canned responses"""
+
+    latency = 0.05
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload: Dict[str, Any]):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/api/tags"):
+            self._send_json({"models": [{"name": "standin", "model": "standin"}]})
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        if not self.path.startswith("/api/chat"):
+            self.send_error(404)
+            return
+
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        prompt = " ".join(str(m.get("content", "")) for m in request.get("messages", []))
+        reply = f"Stand-in response to {len(prompt.split())} prompt words."
+        time.sleep(self.latency)
+
+        final = {
+            "model": request.get("model", "standin"),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "message": {"role": "assistant", "content": ""},
+            "done": True,
+            "done_reason": "stop",
+            "prompt_eval_count": len(prompt.split()),
+            "eval_count": len(reply.split())
+        }
+
+        if request.get("stream", True):
+            lines = [
+                {"model": final["model"], "created_at": final["created_at"],
+                 "message": {"role": "assistant", "content": reply}, "done": False},
+                final
+            ]
+            body = b"".join(json.dumps(line).encode("utf-8") + b"\n" for line in lines)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self._send_json({**final, "message": {"role": "assistant", "content": reply}})
+
+
+def start_ollama_standin(port: int = 0, latency: float = 0.05) -> Tuple[ThreadingHTTPServer, str]:
+    """Start an Ollama-compatible stand-in server in a daemon thread; returns (server, base_url)"""
+    handler = type("StandInHandler", (_StandInHandler,), {"latency": latency})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+async def run_load_test(llm, requests: int = 100, concurrency: int = 16) -> Dict[str, Any]:
+    """Fire ``requests`` calls at ``llm`` with ``concurrency`` callers and report throughput"""
+    from langchain_core.messages import HumanMessage
+
+    queue = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(i)
+
+    async def caller():
+        while not queue.empty():
+            i = queue.get_nowait()
+            await llm.ainvoke([HumanMessage(content=f"Load test request {i}")])
+
+    start = time.perf_counter()
+    await asyncio.gather(*[caller() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    return {"requests": requests, "seconds": elapsed, "requests_per_second": requests / elapsed}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Offline load test of the shared LLM client path")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.05, help="Stand-in response latency in seconds")
+    parser.add_argument("--max-in-flight", type=int, default=8, help="Global registry concurrency budget")
+    parser.add_argument("--rps", type=float, default=0, help="Global requests/second budget (0 = unlimited)")
+    args = parser.parse_args()
+
+    server, base_url = start_ollama_standin(latency=args.latency)
+    llm_registry.configure(max_concurrency=args.max_in_flight, requests_per_second=args.rps)
+    llm = create_llm("Ollama", "standin", base_url)
+
+    result = asyncio.run(run_load_test(llm, args.requests, args.concurrency))
+    print(json.dumps({"load_test": result, "clients": llm_registry.get_stats()}, indent=2))
+    server.shutdown()
@@ -7,8 +7,11 @@ with intelligent result synthesis and performance optimization.
 
 Key Features:
 - Concurrent task processing with semaphore-controlled resource management
-- Intelligent load distribution and automatic load balancing
+- Priority-queue scheduling with results streamed as tasks complete
+- Adaptive concurrency that backs off on rate limits and timeouts
+- Quorum and deadline based early termination
 - Result aggregation and synthesis with context preservation
+- Tree-reduce synthesis with bounded prompt size and streamed final output
 - Comprehensive error handling and fault tolerance
 - Performance monitoring and execution analytics
 
@@ -33,7 +36,8 @@ import asyncio
 import streamlit as st
 import json
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Callable
+from collections import deque
 from datetime import datetime
 from dotenv import load_dotenv
 import os
@@ -41,16 +45,15 @@ from dataclasses import dataclass
 
 # LangChain imports for multi-provider LLM support
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_groq import ChatGroq
-from langchain_ollama import ChatOllama
+from llm_clients import create_llm, render_llm_client_stats
 import requests
 
 # Load environment variables for API keys
 load_dotenv()
 
+# Smallest prompt share per synthesis section (clipped text plus its title and truncation marker)
+MIN_SECTION_PROMPT_CHARS = 300
+
 # =============================================================================
 # BACKEND: DATA MODELS AND CORE CLASSES
 # =============================================================================
@@ -85,18 +88,71 @@ class TaskResult:
         name: Task name for identification
         result: The actual result content from the LLM
         execution_time: Time taken to execute the task
-        status: Execution status (success, error, timeout)
-        error_message: Error details if status is error/timeout
+        status: Execution status (success, error, timeout, cancelled)
+        error_message: Error details if status is error/timeout/cancelled
         timestamp: When the task completed execution
     """
     task_id: str
     name: str
     result: str
     execution_time: float
-    status: str  # success, error, timeout
+    status: str  # success, error, timeout, cancelled
     error_message: Optional[str] = None
     timestamp: str = None
 
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit for provider calls.
+
+    The limit halves when the provider signals overload (HTTP 429, rate limit
+    errors or timeouts) and grows back by one slot after a run of consecutive
+    successes, never leaving [min_limit, max_limit].
+
+    Attributes:
+        limit: Current number of calls allowed in flight
+        in_flight: Calls currently holding a slot
+        backoffs: Number of times the limit was reduced
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1, increase_after: int = 3):
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.increase_after = increase_after
+        self.limit = max_limit
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.backoffs = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    async def release(self, overloaded: bool = False):
+        async with self._condition:
+            self.in_flight -= 1
+            if overloaded:
+                self.limit = max(self.min_limit, self.limit // 2)
+                self.backoffs += 1
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.increase_after and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "current_limit": self.limit,
+            "max_limit": self.max_limit,
+            "peak_in_flight": self.peak_in_flight,
+            "backoffs": self.backoffs
+        }
+
 class ParallelExecutor:
     """
     Core engine for parallel task execution with result synthesis.
@@ -104,96 +160,92 @@ class ParallelExecutor:
     This class handles the concurrent execution of multiple LLM tasks,
     managing resources, handling errors, and synthesizing results.
 
+    Two schedulers are available:
+    - "priority": a priority queue feeds a worker pool; results stream out as
+      they complete, concurrency adapts to provider backpressure, and the run
+      can stop early once a quorum of successes or a deadline is reached
+    - "gather": the original semaphore + asyncio.gather behaviour
+
     Attributes:
         llm: The language model instance for task execution
         max_workers: Maximum number of concurrent tasks
-        execution_history: History of all execution summaries
+        execution_history: Bounded history of recent execution summaries
     """
 
-    def __init__(self, llm, max_workers: int = 4):
+    RATE_LIMIT_MARKERS = ("429", "rate limit", "rate_limit", "too many requests", "resource exhausted", "overloaded")
+
+    def __init__(self, llm, max_workers: int = 4, history_size: int = 50, max_retries: int = 2):
         """
         Initialize the parallel executor.
 
         Args:
             llm: LangChain LLM instance for task execution
             max_workers: Maximum concurrent tasks (default: 4)
+            history_size: Number of execution summaries kept in history (default: 50)
+            max_retries: Re-queues allowed per task after a rate-limit error (default: 2)
         """
         self.llm = llm
         self.max_workers = max_workers
-        self.execution_history = []
-
-    async def execute_tasks_parallel(self, tasks: List[ParallelTask]) -> Dict[str, Any]:
+        self.max_retries = max_retries
+        self.execution_history = deque(maxlen=history_size)
+        self.last_scheduler_stats = {}
+        self.last_synthesis_stats = {}
+
+    async def execute_tasks_parallel(self, tasks: List[ParallelTask], scheduler: str = "priority",
+                                     quorum: Optional[int] = None, deadline: Optional[float] = None,
+                                     on_result: Optional[Callable[[TaskResult], None]] = None) -> Dict[str, Any]:
         """
         Execute multiple tasks concurrently with resource management.
 
-        This method orchestrates parallel execution using asyncio with semaphore
-        control to manage resource usage and prevent system overload.
-
         Args:
             tasks: List of ParallelTask objects to execute
+            scheduler: "priority" (streaming priority scheduler) or "gather" (all-at-once)
+            quorum: Stop once this many tasks succeeded (priority scheduler only)
+            deadline: Stop after this many seconds (priority scheduler only)
+            on_result: Optional callback invoked with each TaskResult as it completes
 
         Returns:
             Dict containing execution summary with results, timing, and statistics
-
-        Raises:
-            Exception: If critical execution error occurs
         """
         try:
             start_time = time.time()
+            first_result_time = None
 
-            # STEP 1: Resource Management Setup
-            # Create semaphore to limit concurrent executions and prevent resource exhaustion
-            semaphore = asyncio.Semaphore(self.max_workers)
-
-            # STEP 2: Task Orchestration
-            # Create coroutines for each task with semaphore control
-            task_coroutines = [
-                self._execute_single_task(task, semaphore)
-                for task in tasks
-            ]
-
-            # STEP 3: Parallel Execution
-            # Execute all tasks concurrently and handle exceptions gracefully
-            results = await asyncio.gather(*task_coroutines, return_exceptions=True)
-
-            # STEP 4: Result Processing and Classification
-            # Separate successful results from failures for analysis
-            task_results = []
-            successful_results = []
-            failed_results = []
-
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    # Handle exceptions
-                    task_result = TaskResult(
-                        task_id=tasks[i].task_id,
-                        name=tasks[i].name,
-                        result="",
-                        execution_time=0.0,
-                        status="error",
-                        error_message=str(result),
-                        timestamp=datetime.now().isoformat()
-                    )
-                    failed_results.append(task_result)
-                else:
+            if scheduler == "gather":
+                task_results = await self._gather_tasks(tasks)
+                for result in task_results:
+                    if on_result:
+                        on_result(result)
+            else:
+                task_results = []
+                async for result in self.stream_tasks(tasks, quorum=quorum, deadline=deadline):
+                    if first_result_time is None:
+                        first_result_time = time.time() - start_time
                     task_results.append(result)
-                    if result.status == "success":
-                        successful_results.append(result)
-                    else:
-                        failed_results.append(result)
+                    if on_result:
+                        on_result(result)
+
+            successful_results = [r for r in task_results if r.status == "success"]
+            cancelled_results = [r for r in task_results if r.status == "cancelled"]
+            failed_results = [r for r in task_results if r.status not in ("success", "cancelled")]
 
             total_time = time.time() - start_time
 
             # Create execution summary
             execution_summary = {
+                "scheduler": scheduler,
                 "total_tasks": len(tasks),
                 "successful_tasks": len(successful_results),
                 "failed_tasks": len(failed_results),
+                "cancelled_tasks": len(cancelled_results),
                 "total_execution_time": total_time,
+                "time_to_first_result": first_result_time if first_result_time is not None else total_time,
                 "average_task_time": sum(r.execution_time for r in successful_results) / max(len(successful_results), 1),
-                "results": task_results + failed_results,
+                "results": task_results,
                 "successful_results": successful_results,
                 "failed_results": failed_results,
+                "cancelled_results": cancelled_results,
+                "scheduler_stats": self.last_scheduler_stats if scheduler != "gather" else {},
                 "timestamp": datetime.now().isoformat()
             }
 
@@ -211,66 +263,185 @@ class ParallelExecutor:
                 "timestamp": datetime.now().isoformat()
             }
 
+    async def _gather_tasks(self, tasks: List[ParallelTask]) -> List[TaskResult]:
+        """Run every task at once behind a semaphore and wait for all of them"""
+        semaphore = asyncio.Semaphore(self.max_workers)
+        results = await asyncio.gather(
+            *[self._execute_single_task(task, semaphore) for task in tasks],
+            return_exceptions=True
+        )
+
+        task_results = []
+        for task, result in zip(tasks, results):
+            if isinstance(result, Exception):
+                result = self._task_result(task, "", 0.0, "error", str(result))
+            task_results.append(result)
+        return task_results
+
+    async def stream_tasks(self, tasks: List[ParallelTask], quorum: Optional[int] = None,
+                           deadline: Optional[float] = None) -> AsyncIterator[TaskResult]:
+        """
+        Yield TaskResults as tasks complete, highest priority first.
+
+        A pool of ``max_workers`` workers pulls from a priority queue (ties keep
+        submission order). Every LLM call goes through an adaptive limiter, so
+        a 429 or timeout halves the number of calls in flight; rate-limited
+        tasks are re-queued up to ``max_retries`` times. Once ``quorum``
+        successes are collected or ``deadline`` seconds have passed, remaining
+        work is cancelled: tasks that had already finished are still yielded
+        with their own result, and each unfinished task is yielded with status
+        "cancelled", so every task is reported exactly once.
+        """
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        for sequence, task in enumerate(tasks):
+            queue.put_nowait((-task.priority, sequence, 0, task))
+
+        results: asyncio.Queue = asyncio.Queue()
+        limiter = AdaptiveConcurrencyLimiter(self.max_workers)
+        retries = 0
+
+        async def worker():
+            nonlocal retries
+            while True:
+                try:
+                    neg_priority, sequence, attempt, task = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await limiter.acquire()
+                overloaded = False
+                retry = False
+                try:
+                    result = await self._invoke_task(task)
+                    overloaded = self._is_backpressure(result)
+                    retry = overloaded and result.status == "error" and attempt < self.max_retries
+                    if not retry:
+                        # Hand the result over before releasing, so a cancel during release can't lose it
+                        results.put_nowait(result)
+                finally:
+                    await limiter.release(overloaded)
+
+                if retry:
+                    retries += 1
+                    await asyncio.sleep(min(0.5 * (2 ** attempt), 4.0))
+                    queue.put_nowait((neg_priority, sequence, attempt + 1, task))
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_workers, len(tasks)))]
+        loop = asyncio.get_running_loop()
+        stop_at = loop.time() + deadline if deadline else None
+        reported = set()
+        successes = 0
+        stop_reason = "completed"
+
+        try:
+            while len(reported) < len(tasks):
+                timeout = None if stop_at is None else max(0.0, stop_at - loop.time())
+                try:
+                    result = await asyncio.wait_for(results.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    stop_reason = "deadline"
+                    break
+
+                reported.add(result.task_id)
+                yield result
+
+                if result.status == "success":
+                    successes += 1
+                    if quorum and successes >= quorum:
+                        stop_reason = "quorum"
+                        break
+        finally:
+            for worker_task in workers:
+                worker_task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.last_scheduler_stats = {
+                **limiter.get_stats(),
+                "retries": retries,
+                "stop_reason": stop_reason
+            }
+
+        # Tasks that finished before the workers were cancelled keep their real result
+        while not results.empty():
+            result = results.get_nowait()
+            if result.task_id not in reported:
+                reported.add(result.task_id)
+                yield result
+
+        for task in tasks:
+            if task.task_id not in reported:
+                yield self._task_result(task, "", 0.0, "cancelled", f"Cancelled: {stop_reason} reached")
+
+    def _is_backpressure(self, result: TaskResult) -> bool:
+        """Whether a failed result indicates provider overload"""
+        if result.status == "timeout":
+            return True
+        message = (result.error_message or "").lower()
+        return result.status == "error" and any(marker in message for marker in self.RATE_LIMIT_MARKERS)
+
+    def _task_result(self, task: ParallelTask, result: str, execution_time: float,
+                     status: str, error_message: Optional[str] = None) -> TaskResult:
+        return TaskResult(
+            task_id=task.task_id,
+            name=task.name,
+            result=result,
+            execution_time=execution_time,
+            status=status,
+            error_message=error_message,
+            timestamp=datetime.now().isoformat()
+        )
+
     async def _execute_single_task(self, task: ParallelTask, semaphore: asyncio.Semaphore) -> TaskResult:
         """Execute a single task with semaphore control"""
         async with semaphore:
-            start_time = time.time()
+            return await self._invoke_task(task)
 
-            try:
-                # Build prompt with context
-                context_str = ""
-                if task.context:
-                    context_str = f"\\n\\nContext: {json.dumps(task.context, indent=2)}"
+    async def _invoke_task(self, task: ParallelTask) -> TaskResult:
+        """Run one task against the LLM with its timeout, never raising"""
+        start_time = time.time()
 
-                full_prompt = task.prompt + context_str
+        try:
+            # Build prompt with context
+            context_str = ""
+            if task.context:
+                context_str = f"\n\nContext: {json.dumps(task.context, indent=2)}"
 
-                # Create timeout for the task
-                messages = [
-                    SystemMessage(content=f"You are executing task: {task.name}. Provide a comprehensive response."),
-                    HumanMessage(content=full_prompt)
-                ]
+            full_prompt = task.prompt + context_str
 
-                # Execute with timeout
-                try:
-                    response = await asyncio.wait_for(
-                        self.llm.ainvoke(messages),
-                        timeout=task.timeout
-                    )
-                    result_content = response.content
-                    status = "success"
-                    error_message = None
+            messages = [
+                SystemMessage(content=f"You are executing task: {task.name}. Provide a comprehensive response."),
+                HumanMessage(content=full_prompt)
+            ]
 
-                except asyncio.TimeoutError:
-                    result_content = f"Task timed out after {task.timeout} seconds"
-                    status = "timeout"
-                    error_message = f"Timeout after {task.timeout}s"
-
-                execution_time = time.time() - start_time
-
-                return TaskResult(
-                    task_id=task.task_id,
-                    name=task.name,
-                    result=result_content,
-                    execution_time=execution_time,
-                    status=status,
-                    error_message=error_message,
-                    timestamp=datetime.now().isoformat()
+            # Execute with timeout
+            try:
+                response = await asyncio.wait_for(
+                    self.llm.ainvoke(messages),
+                    timeout=task.timeout
                 )
+                return self._task_result(task, response.content, time.time() - start_time, "success")
 
-            except Exception as e:
-                execution_time = time.time() - start_time
-                return TaskResult(
-                    task_id=task.task_id,
-                    name=task.name,
-                    result="",
-                    execution_time=execution_time,
-                    status="error",
-                    error_message=str(e),
-                    timestamp=datetime.now().isoformat()
+            except asyncio.TimeoutError:
+                return self._task_result(
+                    task, f"Task timed out after {task.timeout} seconds", time.time() - start_time,
+                    "timeout", f"Timeout after {task.timeout}s"
                 )
 
-    async def synthesize_results(self, results: List[TaskResult], synthesis_prompt: str = None) -> str:
-        """Synthesize multiple task results into a cohesive response"""
+        except Exception as e:
+            return self._task_result(task, "", time.time() - start_time, "error", str(e))
+
+    async def synthesize_results(self, results: List[TaskResult], synthesis_prompt: str = None,
+                                 mode: str = "single", batch_size: int = 4, max_prompt_chars: int = 12000) -> str:
+        """
+        Synthesize multiple task results into a cohesive response.
+
+        ``mode="tree"`` collects the output of :meth:`stream_synthesis` instead
+        of sending every result in one prompt.
+        """
+        if mode == "tree":
+            chunks = []
+            async for chunk in self.stream_synthesis(results, synthesis_prompt, batch_size, max_prompt_chars):
+                chunks.append(chunk)
+            return "".join(chunks)
+
         try:
             successful_results = [r for r in results if r.status == "success"]
 
@@ -282,12 +453,12 @@ class ParallelExecutor:
                 synthesis_prompt = "Synthesize the following results into a comprehensive, cohesive response:"
 
             # Combine all results
-            combined_results = "\\n\\n".join([
-                f"**{result.name}:**\\n{result.result}"
+            combined_results = "\n\n".join([
+                f"**{result.name}:**\n{result.result}"
                 for result in successful_results
             ])
 
-            full_prompt = f"{synthesis_prompt}\\n\\n{combined_results}"
+            full_prompt = f"{synthesis_prompt}\n\n{combined_results}"
 
             # Execute synthesis
             messages = [
@@ -301,48 +472,148 @@ class ParallelExecutor:
         except Exception as e:
             return f"Synthesis error: {str(e)}"
 
-# =============================================================================
-# BACKEND: LLM INTEGRATION AND CONFIGURATION
-# =============================================================================
-
-def create_llm(provider: str, model: str, base_url: str = None):
-    """
-    Factory function for creating LLM instances across multiple providers.
-
-    Supports local (Ollama) and cloud-based LLM providers with proper
-    authentication and configuration management.
+    async def stream_synthesis(self, results, synthesis_prompt: str = None, batch_size: int = 4,
+                               max_prompt_chars: int = 12000) -> AsyncIterator[str]:
+        """
+        Tree-reduce synthesis that streams the final answer token by token.
+
+        ``results`` may be a list or an async iterator such as :meth:`stream_tasks`,
+        in which case merging starts while slower tasks are still running.
+        Successful results are merged ``batch_size`` at a time into partial
+        syntheses (merges run concurrently, up to ``max_workers``); partials are
+        merged again level by level until they fit one final prompt. Every
+        section is clipped so that no prompt exceeds ``max_prompt_chars``
+        (raised so that ``batch_size`` sections of ``MIN_SECTION_PROMPT_CHARS`` fit).
+        Stats for the last run are kept in ``last_synthesis_stats``.
+        """
+        if not synthesis_prompt:
+            synthesis_prompt = "Synthesize the following results into a comprehensive, cohesive response:"
+
+        batch_size = max(2, batch_size)
+        max_prompt_chars = max(max_prompt_chars, len(synthesis_prompt) + batch_size * MIN_SECTION_PROMPT_CHARS)
+        # Leave room in each section's share for its title and the truncation marker
+        section_chars = (max_prompt_chars - len(synthesis_prompt)) // batch_size - 100
+        semaphore = asyncio.Semaphore(self.max_workers)
+        start_time = time.time()
+        stats = {"sources": 0, "merges": 0, "levels": 0, "peak_prompt_chars": 0, "time_to_first_token": None}
+        self.last_synthesis_stats = stats
+
+        def section(title: str, text: str) -> str:
+            if len(text) > section_chars:
+                text = text[:section_chars].rstrip() + " …[truncated]"
+            return f"**{title}:**\n{text}"
+
+        async def merge(sections: List[str], level: int) -> str:
+            prompt = (
+                "Merge these partial results into one concise synthesis. Keep every distinct finding, "
+                "figure and recommendation; drop repetition.\n\n" + "\n\n".join(sections)
+            )
+            stats["peak_prompt_chars"] = max(stats["peak_prompt_chars"], len(prompt))
+            async with semaphore:
+                try:
+                    response = await self.llm.ainvoke([
+                        SystemMessage(content="You are an expert at condensing related findings without losing information."),
+                        HumanMessage(content=prompt)
+                    ])
+                    merged = response.content
+                except Exception as e:
+                    # Fall back to the clipped sections rather than losing them
+                    merged = "\n\n".join(sections) + f"\n\n(merge error: {e})"
+            stats["merges"] += 1
+            return section(f"Partial synthesis L{level} ({len(sections)} sources)", merged)
+
+        def fits(sections: List[str]) -> bool:
+            # A single section is already clipped, so there is nothing left to reduce
+            return len(sections) == 1 or (
+                len(sections) <= batch_size and sum(len(s) for s in sections) <= max_prompt_chars
+            )
 
-    Args:
-        provider: LLM provider name (Ollama, OpenAI, Anthropic, Gemini, Groq)
-        model: Specific model name/identifier
-        base_url: Base URL for local providers like Ollama
+        async def passthrough(item: str) -> str:
+            return item
+
+        def pack(sections: List[str]) -> List[List[str]]:
+            # At least two sections per batch, so every level shrinks the list
+            batches, current = [], []
+            for item in sections:
+                if len(current) >= 2 and (len(current) >= batch_size
+                                          or sum(len(s) for s in current) + len(item) > max_prompt_chars):
+                    batches.append(current)
+                    current = []
+                current.append(item)
+            if current:
+                batches.append(current)
+            return batches
+
+        # Level 1: merge batches as results arrive
+        buffer: List[str] = []
+        early_merges = []
+        async for result in self._iterate(results):
+            if result.status != "success":
+                continue
+            stats["sources"] += 1
+            buffer.append(section(result.name, result.result))
+            if len(buffer) >= batch_size:
+                early_merges.append(asyncio.create_task(merge(buffer, 1)))
+                buffer = []
+
+        if not stats["sources"]:
+            yield "No successful results to synthesize."
+            return
 
-    Returns:
-        LangChain LLM instance configured for the specified provider
+        sections = list(await asyncio.gather(*early_merges)) + buffer
+        stats["levels"] = 1 if early_merges else 0
+
+        # Higher levels: keep reducing until one prompt holds everything
+        while not fits(sections):
+            stats["levels"] += 1
+            sections = list(await asyncio.gather(*[
+                merge(batch, stats["levels"]) if len(batch) > 1 else passthrough(batch[0])
+                for batch in pack(sections)
+            ]))
+
+        full_prompt = f"{synthesis_prompt}\n\n" + "\n\n".join(sections)
+        stats["peak_prompt_chars"] = max(stats["peak_prompt_chars"], len(full_prompt))
+        messages = [
+            SystemMessage(content="You are an expert at synthesizing multiple pieces of information into coherent insights."),
+            HumanMessage(content=full_prompt)
+        ]
 
-    Raises:
-        Exception: If provider is unsupported or configuration is invalid
-    """
-    if provider == "Ollama":
-        return ChatOllama(
-            model=model,
-            base_url=base_url or 'http://localhost:11434',
-            temperature=0.3,
-            timeout=120
-        )
-    elif provider == "OpenAI":
-        return ChatOpenAI(model=model, api_key=os.getenv("OPENAI_API_KEY"), temperature=0.3)
-    elif provider == "Anthropic":
-        return ChatAnthropic(model=model, api_key=os.getenv("ANTHROPIC_API_KEY"), temperature=0.3)
-    elif provider == "Gemini":
-        return ChatGoogleGenerativeAI(model=model, api_key=os.getenv("GEMINI_API_KEY"), temperature=0.3)
-    elif provider == "Groq":
-        return ChatGroq(model=model, api_key=os.getenv("GROQ_API_KEY"), temperature=0.3)
+        try:
+            async for chunk in self.llm.astream(messages):
+                if chunk.content:
+                    if stats["time_to_first_token"] is None:
+                        stats["time_to_first_token"] = time.time() - start_time
+                    yield chunk.content
+        except Exception as e:
+            yield f"Synthesis error: {str(e)}"
+
+    @staticmethod
+    async def _iterate(results):
+        """Iterate a list or an async iterator of results uniformly"""
+        if hasattr(results, "__aiter__"):
+            async for result in results:
+                yield result
+        else:
+            for result in results:
+                yield result
 
 # =============================================================================
 # FRONTEND: STREAMLIT INTERFACE AND USER INTERACTION
 # =============================================================================
 
+def _iterate_sync(async_iterator):
+    """Drive an async iterator from synchronous code (e.g. st.write_stream)"""
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(async_iterator.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(async_iterator.aclose())
+        loop.close()
+
 def render_parallel_execution_interface():
     """
     Main Streamlit interface for parallel execution workflow.
@@ -435,6 +706,23 @@ def render_parallel_execution_interface():
         st.markdown("### ⚙️ Execution Settings")
         max_workers = st.slider("Max Concurrent Tasks", 1, 8, 4, key='max_workers')
         task_timeout = st.slider("Task Timeout (seconds)", 10, 300, 60, key='task_timeout')
+        scheduler = st.selectbox(
+            "Scheduler",
+            ["priority", "gather"],
+            key='parallel_scheduler',
+            help="priority: highest-priority tasks first, results stream in, adaptive concurrency. gather: wait for all tasks."
+        )
+        quorum = 0
+        run_deadline = 0
+        if scheduler == "priority":
+            quorum = st.number_input(
+                "Stop after N successes (0 = all)", min_value=0, max_value=50, value=0, key='parallel_quorum'
+            )
+            run_deadline = st.number_input(
+                "Run deadline in seconds (0 = none)", min_value=0, max_value=600, value=0, key='parallel_deadline'
+            )
+
+        render_llm_client_stats()
 
     # Initialize session state for tasks
     if 'parallel_tasks' not in st.session_state:
@@ -471,14 +759,16 @@ def render_parallel_execution_interface():
         - Optimal utilization of available resources
 
         🎯 **Load Distribution**
-        - Intelligent task scheduling
-        - Priority-based execution order
-        - Automatic load balancing
+        - Priority queue feeding a worker pool
+        - Results streamed as soon as each task completes
+        - Adaptive concurrency that backs off on rate limits and timeouts
+        - Early stop once a quorum of results or a deadline is reached
 
         🔗 **Result Synthesis**
         - Intelligent aggregation of parallel results
         - Context-aware result combination
-        - Coherent insight generation
+        - Tree-reduce merging in bounded batches for large task sets
+        - Final synthesis streamed token by token
 
         🛡️ **Fault Tolerance**
         - Individual task error isolation
@@ -551,7 +841,16 @@ def render_parallel_execution_interface():
         key='synthesis_prompt'
     )
 
-    enable_synthesis = st.checkbox("Enable Result Synthesis", value=True, key='enable_synthesis')
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        enable_synthesis = st.checkbox("Enable Result Synthesis", value=True, key='enable_synthesis')
+    with col2:
+        synthesis_mode = st.selectbox(
+            "Synthesis Mode", ["tree", "single"], key='synthesis_mode',
+            help="tree: merge results in batches and stream the final answer. single: one prompt with every result."
+        )
+    with col3:
+        synthesis_batch_size = st.slider("Merge Batch Size", 2, 8, 4, key='synthesis_batch_size')
 
     # =============================================================================
     # FRONTEND SECTION 3: EXECUTION CONTROL AND MONITORING
@@ -582,8 +881,25 @@ def render_parallel_execution_interface():
 
         with st.spinner("⚡ Executing tasks in parallel..."):
             try:
+                # Live progress as results stream in
+                progress = st.progress(0.0, text="Waiting for first result...")
+                completed = []
+
+                def show_result(result: TaskResult):
+                    completed.append(result)
+                    progress.progress(
+                        len(completed) / len(parallel_tasks),
+                        text=f"{len(completed)}/{len(parallel_tasks)} done · latest: {result.name} ({result.status})"
+                    )
+
                 # Backend execution call
-                execution_summary = asyncio.run(executor.execute_tasks_parallel(parallel_tasks))
+                execution_summary = asyncio.run(executor.execute_tasks_parallel(
+                    parallel_tasks,
+                    scheduler=scheduler,
+                    quorum=quorum or None,
+                    deadline=run_deadline or None,
+                    on_result=show_result
+                ))
 
                 # Error handling
                 if 'error' in execution_summary:
@@ -631,6 +947,17 @@ def render_parallel_execution_interface():
                     with col4:
                         st.metric("Total Time", f"{execution_summary['total_execution_time']:.2f}s")
 
+                    st.caption(f"Time to first result: {execution_summary['time_to_first_result']:.2f}s")
+                    scheduler_stats = execution_summary.get('scheduler_stats')
+                    if scheduler_stats:
+                        st.caption(
+                            f"Scheduler stopped on **{scheduler_stats['stop_reason']}** · "
+                            f"{execution_summary['cancelled_tasks']} cancelled · "
+                            f"concurrency {scheduler_stats['current_limit']}/{scheduler_stats['max_limit']} "
+                            f"(peak {scheduler_stats['peak_in_flight']}, {scheduler_stats['backoffs']} backoffs, "
+                            f"{scheduler_stats['retries']} retries)"
+                        )
+
                     # Task execution times
                     if successful_results:
                         st.markdown("**Task Execution Times:**")
@@ -650,12 +977,27 @@ def render_parallel_execution_interface():
                     if enable_synthesis and successful_results:
                         st.markdown("### 🔗 Synthesized Results")
 
-                        with st.spinner("🔗 Synthesizing results..."):
-                            synthesized_result = asyncio.run(
-                                executor.synthesize_results(successful_results, synthesis_prompt)
-                            )
+                        if synthesis_mode == "tree":
+                            st.write_stream(_iterate_sync(
+                                executor.stream_synthesis(
+                                    successful_results, synthesis_prompt, batch_size=synthesis_batch_size
+                                )
+                            ))
+                            synthesis_stats = executor.last_synthesis_stats
+                            if synthesis_stats.get("time_to_first_token") is not None:
+                                st.caption(
+                                    f"{synthesis_stats['sources']} sources · {synthesis_stats['merges']} merges over "
+                                    f"{synthesis_stats['levels']} levels · peak prompt "
+                                    f"{synthesis_stats['peak_prompt_chars']:,} chars · first token after "
+                                    f"{synthesis_stats['time_to_first_token']:.2f}s"
+                                )
+                        else:
+                            with st.spinner("🔗 Synthesizing results..."):
+                                synthesized_result = asyncio.run(
+                                    executor.synthesize_results(successful_results, synthesis_prompt)
+                                )
 
-                        st.markdown(synthesized_result)
+                            st.markdown(synthesized_result)
 
                     else:
                         st.info("Synthesis disabled or no successful results to synthesize.")
@@ -7,7 +7,8 @@ LangChain's latest chaining capabilities with LCEL (LangChain Expression Languag
 
 Key Features:
 - Sequential chain execution with advanced LCEL patterns
-- Built-in context preservation across chain steps
+- Context windowing: steps receive only declared dependencies or a rolling summary
+- Automatic parallel execution of steps whose dependencies are satisfied
 - Multiple execution patterns (sequential, parallel, custom LCEL)
 - Advanced memory and state management
 - Real-time monitoring and performance analytics
@@ -32,8 +33,11 @@ Use Cases:
 
 import asyncio
 import streamlit as st
+import hashlib
 import json
-from typing import Dict, Any, List
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 import os
@@ -45,11 +49,7 @@ from langchain_core.runnables import RunnablePassthrough, RunnableLambda, Runnab
 from langchain.memory import ConversationBufferMemory
 
 # Multi-provider LLM support
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_groq import ChatGroq
-from langchain_ollama import ChatOllama
+from llm_clients import create_llm, render_llm_client_stats
 
 # Structured output validation
 from pydantic import BaseModel, Field
@@ -61,6 +61,47 @@ load_dotenv()
 # BACKEND: DATA MODELS AND CONFIGURATION
 # =============================================================================
 
+CHARS_PER_TOKEN = 4
+COMPILED_CHAIN_CACHE_SIZE = 32
+
+STEP_TEMPLATE = """Step: {step_name}
+Task: {task}
+Main Topic: {main_topic}
+
+Relevant context from earlier steps:
+{context}
+
+Provide a detailed response for this step."""
+
+COMPACTION_TEMPLATE = """Condense the following workflow results into at most {word_budget} words.
+Keep every concrete decision, figure, name and recommendation; drop repetition and filler.
+
+{text}"""
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token)"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def rolling_context(summary: str, latest: str) -> str:
+    """Context forwarded to a step in rolling mode"""
+    return "\n\n".join(part for part in [
+        f"Summary of earlier steps:\n{summary}" if summary else "",
+        f"Most recent step result:\n{latest}" if latest else ""
+    ] if part) or "None (first step)"
+
+
+@st.cache_resource
+def get_compiled_chain_cache():
+    """
+    Compiled step chains shared by every PromptChain instance (a new instance is
+    built per run), keyed by the LLM client and the step list. Held in
+    st.cache_resource so it also survives reruns when this file is the main script.
+    """
+    return OrderedDict(), threading.Lock()
+
+
 class ChainStepResult(BaseModel):
     """
     Structured result model for individual chain step execution.
@@ -123,6 +164,9 @@ class PromptChain:
             return_messages=True
         ) if use_memory else None
         self.results: List[ChainStepResult] = []
+        self.last_run_stats: Dict[str, Any] = {}
+        self._compactions: Dict[str, str] = {}
+        self._compaction_chain = None
 
     def create_step_chain(self, step_name: str, prompt_template: str) -> Any:
         """
@@ -155,72 +199,189 @@ class PromptChain:
 
         return chain
 
-    def create_sequential_chain(self, steps: List[Dict[str, str]]) -> Any:
+    def create_sequential_chain(self, steps: List[Dict[str, Any]], context_mode: str = "dependencies",
+                                token_budget: int = 1500) -> Any:
         """
-        Create sequential execution chain with context preservation.
+        Create a context-windowed chain over the given steps.
+
+        Step templates are compiled once per LLM client and step list and reused
+        across runs and PromptChain instances.
+        Instead of pasting every earlier output into every later prompt, each
+        step only sees:
+
+        - ``context_mode="dependencies"``: the outputs of the steps it lists in
+          ``depends_on`` (1-based indices or step names; defaults to the
+          previous step, ``[]`` means independent). Steps whose dependencies are
+          all satisfied run together through ``RunnableParallel``.
+        - ``context_mode="rolling"``: a rolling summary of all earlier steps
+          plus the latest output, executed strictly in order.
 
-        Sequential execution ensures each step builds upon previous results,
-        maintaining context flow and enabling complex reasoning workflows.
+        Whenever the forwarded context exceeds ``token_budget`` (estimated at
+        ~4 characters per token) it is compacted by an LLM summary call. In
+        rolling mode the latest output keeps up to half of the budget and the
+        summary is compacted into the rest.
 
         Args:
-            steps: List of step dictionaries with 'name' and 'prompt' keys
+            steps: List of step dictionaries with 'name', 'prompt' and optional 'depends_on' keys
+            context_mode: "dependencies" or "rolling"
+            token_budget: Maximum estimated tokens of context forwarded into a step
 
         Returns:
-            Async callable for sequential execution
+            Async callable for chain execution
         """
+        compiled = self._compile_steps(steps)
+
         async def execute_sequential(inputs):
             """
-            Execute steps sequentially with context accumulation.
+            Execute the compiled steps level by level.
 
-            Each step receives context from all previous steps,
-            enabling complex reasoning and context-aware processing.
+            Run statistics (levels, context sizes, compactions) are stored in
+            ``self.last_run_stats``.
             """
             main_topic = inputs["main_topic"]
             results = {}
-            context = {"main_topic": main_topic}
-
-            # Process each step sequentially, building context
-            for i, step in enumerate(steps):
-                step_name = step['name']
-                prompt_text = step['prompt']
-
-                # Build context-aware prompt template
-                if i == 0:
-                    # First step: Only main topic context
-                    template = f"""
-                    Step: {step_name}
-                    Task: {prompt_text}
-                    Main Topic: {main_topic}
-
-                    Provide a detailed response for this step.
-                    """
+            stats = {
+                "context_mode": context_mode,
+                "token_budget": token_budget,
+                "levels": [],
+                "context_tokens": {},
+                "compactions": 0
+            }
+            self.last_run_stats = stats
+
+            if context_mode == "rolling":
+                rolling_summary = ""
+                latest = ""
+                for index in range(len(steps)):
+                    stats["levels"].append([index + 1])
+                    context = rolling_context(rolling_summary, latest)
+                    if estimate_tokens(context) > token_budget:
+                        rolling_summary, latest = await self._fit_rolling_context(
+                            rolling_summary, latest, token_budget, stats
+                        )
+                        context = rolling_context(rolling_summary, latest)
+                        if estimate_tokens(context) > token_budget:
+                            # Hard cap in case rounding leaves the joined context a token over
+                            context = context[:(token_budget - 1) * CHARS_PER_TOKEN]
+                    stats["context_tokens"][index + 1] = estimate_tokens(context)
+
+                    result = await compiled["steps"][index].ainvoke({"main_topic": main_topic, "context": context})
+                    results[f"step_{index+1}_result"] = result
+
+                    rolling_summary = "\n\n".join(filter(None, [rolling_summary, latest]))
+                    latest = result
+                return results
+
+            for level in compiled["levels"]:
+                stats["levels"].append([index + 1 for index in level])
+                contexts = {}
+                for index in level:
+                    deps = compiled["dependencies"][index]
+                    context = "\n\n".join(
+                        f"Result of '{steps[dep]['name']}':\n{results[f'step_{dep+1}_result']}" for dep in deps
+                    ) or "None (independent step)"
+                    if estimate_tokens(context) > token_budget:
+                        context = await self._compact(context, token_budget, stats)
+                    contexts[f"step_{index+1}"] = context
+                    stats["context_tokens"][index + 1] = estimate_tokens(context)
+
+                if len(level) == 1:
+                    index = level[0]
+                    output = {f"step_{index+1}": await compiled["steps"][index].ainvoke(
+                        {"main_topic": main_topic, "context": contexts[f"step_{index+1}"]}
+                    )}
                 else:
-                    # Subsequent steps: Include all previous results
-                    prev_results = "\n".join([f"Step {j+1} Result: {results[f'step_{j+1}_result']}" for j in range(i)])
-                    template = f"""
-                    Step: {step_name}
-                    Task: {prompt_text}
-                    Main Topic: {main_topic}
-
-                    Previous Results:
-                    {prev_results}
-
-                    Based on the previous steps, provide a detailed response for this step.
-                    """
+                    parallel = RunnableParallel({
+                        f"step_{index+1}": compiled["branches"][index] for index in level
+                    })
+                    output = await parallel.ainvoke({"main_topic": main_topic, "contexts": contexts})
 
-                # Create and execute individual chain with LCEL
-                prompt = ChatPromptTemplate.from_template(template)
-                chain = prompt | self.llm | self.parser
+                for key, value in output.items():
+                    results[f"{key}_result"] = value
 
-                # Execute step and accumulate results
-                result = await chain.ainvoke({})
-                results[f"step_{i+1}_result"] = result
-                context[f"step_{i+1}_result"] = result
-
-            return results
+            return dict(sorted(results.items(), key=lambda item: int(item[0].split("_")[1])))
 
         return execute_sequential
 
+    def _compile_steps(self, steps: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Compile step templates and the dependency levels once per LLM client and distinct step list"""
+        # Shared clients from llm_clients carry a (provider, model, base_url) key
+        llm_key = getattr(self.llm, "key", None) or id(self.llm)
+        cache_key = (llm_key, json.dumps(
+            [[step['name'], step['prompt'], step.get('depends_on')] for step in steps], default=str
+        ))
+        compiled_chains, lock = get_compiled_chain_cache()
+        with lock:
+            cached = compiled_chains.get(cache_key)
+            if cached is not None and cached["llm"] is self.llm:
+                compiled_chains.move_to_end(cache_key)
+                return cached
+
+        name_to_index = {step['name']: index for index, step in enumerate(steps)}
+        dependencies = []
+        for index, step in enumerate(steps):
+            declared = step.get('depends_on', [index] if index > 0 else [])
+            deps = set()
+            for dep in declared:
+                dep_index = name_to_index.get(dep) if isinstance(dep, str) else int(dep) - 1
+                # Only earlier steps can be dependencies, which also rules out cycles
+                if dep_index is not None and 0 <= dep_index < index:
+                    deps.add(dep_index)
+            dependencies.append(sorted(deps))
+
+        # Group steps into levels: a step runs one level after its deepest dependency
+        depth = []
+        for index in range(len(steps)):
+            depth.append(1 + max((depth[dep] for dep in dependencies[index]), default=-1))
+        levels = [[index for index in range(len(steps)) if depth[index] == level]
+                  for level in range(max(depth, default=-1) + 1)]
+
+        step_chains = []
+        branches = {}
+        for index, step in enumerate(steps):
+            prompt = ChatPromptTemplate.from_messages([
+                ("system", "You are an expert assistant executing step '{step_name}' in a workflow chain."),
+                ("human", STEP_TEMPLATE)
+            ]).partial(step_name=step['name'], task=step['prompt'])
+            chain = prompt | self.llm | self.parser
+            step_chains.append(chain)
+            branches[index] = RunnableLambda(
+                lambda x, key=f"step_{index+1}": {"main_topic": x["main_topic"], "context": x["contexts"][key]}
+            ) | chain
+
+        compiled = {"steps": step_chains, "branches": branches, "dependencies": dependencies, "levels": levels,
+                    "llm": self.llm}
+        with lock:
+            compiled_chains[cache_key] = compiled
+            while len(compiled_chains) > COMPILED_CHAIN_CACHE_SIZE:
+                compiled_chains.popitem(last=False)
+        return compiled
+
+    async def _fit_rolling_context(self, summary: str, latest: str, token_budget: int,
+                                   stats: Dict[str, Any]) -> Tuple[str, str]:
+        """Compact the rolling summary (and, if needed, the latest output) so their context fits the budget"""
+        # Header text and joins, plus a token of slack for rounding in the estimates
+        available = max(token_budget - estimate_tokens(rolling_context("-", "-")) - 1, 2)
+        latest_budget = available // 2 if summary else available
+        if estimate_tokens(latest) > latest_budget:
+            latest = await self._compact(latest, latest_budget, stats)
+        summary_budget = max(available - estimate_tokens(latest), 1)
+        if summary and estimate_tokens(summary) > summary_budget:
+            summary = await self._compact(summary, summary_budget, stats)
+        return summary, latest
+
+    async def _compact(self, text: str, token_budget: int, stats: Dict[str, Any]) -> str:
+        """Summarize context to fit a token budget, reusing earlier compactions of the same text"""
+        digest = hashlib.sha256(f"{token_budget}:{text}".encode("utf-8")).hexdigest()
+        if digest not in self._compactions:
+            if self._compaction_chain is None:
+                self._compaction_chain = ChatPromptTemplate.from_template(COMPACTION_TEMPLATE) | self.llm | self.parser
+            summary = await self._compaction_chain.ainvoke({"text": text, "word_budget": max(50, token_budget * 3 // 4)})
+            # Hard cap in case the model overshoots the requested length
+            self._compactions[digest] = summary[:token_budget * CHARS_PER_TOKEN]
+            stats["compactions"] += 1
+        return self._compactions[digest]
+
     def create_parallel_chain(self, steps: List[Dict[str, str]]) -> Any:
         """
         Create parallel execution chain for independent steps.
@@ -262,7 +423,8 @@ class PromptChain:
         return parallel_chain
 
     async def execute_lcel_chain(self, steps: List[Dict[str, str]], main_topic: str,
-                                execution_type: str = "sequential") -> Dict[str, Any]:
+                                execution_type: str = "sequential", context_mode: str = "dependencies",
+                                token_budget: int = 1500) -> Dict[str, Any]:
         """
         Execute chain using LCEL with different execution patterns.
 
@@ -274,6 +436,8 @@ class PromptChain:
             steps: List of workflow steps to execute
             main_topic: Primary topic/question for the workflow
             execution_type: "sequential", "parallel", or "custom_lcel"
+            context_mode: Context forwarding for sequential chains ("dependencies" or "rolling")
+            token_budget: Maximum estimated context tokens forwarded into a sequential step
 
         Returns:
             Dict containing execution results, timing, and success status
@@ -283,7 +447,7 @@ class PromptChain:
         try:
             # Route to appropriate execution pattern
             if execution_type == "sequential":
-                chain_func = self.create_sequential_chain(steps)
+                chain_func = self.create_sequential_chain(steps, context_mode, token_budget)
                 results = await chain_func({"main_topic": main_topic})
 
             elif execution_type == "parallel":
@@ -390,45 +554,6 @@ class PromptChain:
 
         return create_memory_chain()
 
-# =============================================================================
-# BACKEND: LLM PROVIDER CONFIGURATION
-# =============================================================================
-
-def create_llm(provider: str, model: str, base_url: str = None):
-    """
-    Create LLM instance based on provider with unified configuration.
-
-    Supports multiple LLM providers with consistent configuration patterns
-    and automatic fallback handling for robust multi-provider workflows.
-
-    Args:
-        provider: LLM provider ("Gemini", "Ollama", "Groq", "Anthropic", "OpenAI")
-        model: Model name/identifier for the specific provider
-        base_url: Optional base URL for self-hosted providers (Ollama)
-
-    Returns:
-        Configured LLM instance ready for chain integration
-
-    Raises:
-        ValueError: If provider is not supported
-        ConnectionError: If API keys are missing or invalid
-    """
-    if provider == "Gemini":
-        return ChatGoogleGenerativeAI(model=model, api_key=os.getenv("GEMINI_API_KEY"), temperature=0.3)
-    elif provider == "Ollama":
-        return ChatOllama(
-            model=model,
-            base_url=base_url or 'http://localhost:11434',
-            temperature=0.3,
-            timeout=120
-        )
-    elif provider == "Groq":
-        return ChatGroq(model=model, api_key=os.getenv("GROQ_API_KEY"), temperature=0.3)
-    elif provider == "Anthropic":
-        return ChatAnthropic(model=model, api_key=os.getenv("ANTHROPIC_API_KEY"), temperature=0.3)
-    elif provider == "OpenAI":
-        return ChatOpenAI(model=model, api_key=os.getenv("OPENAI_API_KEY"), temperature=0.3)
-
 # =============================================================================
 # FRONTEND: STREAMLIT INTERFACE AND USER INTERACTIONS
 # =============================================================================
@@ -510,6 +635,24 @@ def render_prompt_chaining_interface():
             key='execution_type'
         )
 
+        context_mode = "dependencies"
+        token_budget = 1500
+        if execution_type == "sequential":
+            context_mode = st.selectbox(
+                "Context Forwarding",
+                ["dependencies", "rolling"],
+                format_func=lambda x: {
+                    "dependencies": "Declared dependencies (independent steps run in parallel)",
+                    "rolling": "Rolling summary of all previous steps"
+                }[x],
+                key='context_mode'
+            )
+            token_budget = st.slider(
+                "Context Token Budget", 300, 6000, 1500, 100,
+                key='token_budget',
+                help="Context forwarded into a step is summarized when it exceeds this many (estimated) tokens"
+            )
+
         # -------------------------------------------------------------------------
         # Advanced Configuration Options
         # -------------------------------------------------------------------------
@@ -556,6 +699,8 @@ def render_prompt_chaining_interface():
             else:
                 st.warning(f"⚠️ {required_key} not found")
 
+        render_llm_client_stats()
+
     # =============================================================================
     # MAIN INTERFACE: CHAIN CONFIGURATION
     # =============================================================================
@@ -582,7 +727,7 @@ def render_prompt_chaining_interface():
         st.markdown(f"""
         **Current Pattern: {execution_type.upper()}**
         
-        🔄 **Sequential Chain**: Steps execute one after another, with each step building on previous results
+        🔄 **Sequential Chain**: Steps build on earlier results - either only the steps they depend on (independent steps run in parallel) or a rolling summary kept under a token budget
         
         ⚡ **Parallel Chain**: Independent steps execute simultaneously for faster processing
         
@@ -642,6 +787,17 @@ def render_prompt_chaining_interface():
                     key=f'step_prompt_{i}'
                 )
 
+            if execution_type == "sequential" and context_mode == "dependencies" and i > 0:
+                earlier = list(range(1, i + 1))
+                step['depends_on'] = st.multiselect(
+                    "Depends On",
+                    earlier,
+                    default=[d for d in step.get('depends_on', [i]) if d in earlier],
+                    format_func=lambda n: st.session_state.chain_steps[n - 1]['name'],
+                    key=f'step_depends_on_{i}',
+                    help="Only these steps' results are passed in; steps with no dependencies run in parallel"
+                )
+
     # Execute chain
     if st.button("Execute Chain", type="primary", key='execute_chain'):
         if not topic:
@@ -669,7 +825,9 @@ def render_prompt_chaining_interface():
                 result = asyncio.run(chain.execute_lcel_chain(
                     st.session_state.chain_steps,
                     topic,
-                    execution_type
+                    execution_type,
+                    context_mode=context_mode,
+                    token_budget=token_budget
                 ))
 
                 if result['success']:
@@ -713,10 +871,13 @@ def render_prompt_chaining_interface():
                         # Chain flow visualization
                         st.markdown("**🔄 Execution Flow:**")
                         if execution_type == "sequential":
-                            for i, step in enumerate(st.session_state.chain_steps):
-                                st.markdown(f"**{i+1}.** {step['name']}")
-                                if i < len(st.session_state.chain_steps) - 1:
-                                    st.markdown("⬇️ *Context passed to next step*")
+                            run_stats = chain.last_run_stats
+                            for level_number, level in enumerate(run_stats.get("levels", []), 1):
+                                names = [st.session_state.chain_steps[n - 1]['name'] for n in level]
+                                label = " ‖ ".join(names) if len(names) > 1 else names[0]
+                                st.markdown(f"**{level_number}.** {label}" + (" *(parallel)*" if len(names) > 1 else ""))
+                                if level_number < len(run_stats["levels"]):
+                                    st.markdown(f"⬇️ *{'Rolling summary' if context_mode == 'rolling' else 'Dependency results'} passed forward*")
                         else:
                             st.markdown("**Parallel Execution:** All steps executed simultaneously")
                             for step in st.session_state.chain_steps:
@@ -733,13 +894,24 @@ def render_prompt_chaining_interface():
                         with col3:
                             st.metric("LLM Provider", f"{llm_provider} ({model})")
 
+                        if execution_type == "sequential" and chain.last_run_stats:
+                            run_stats = chain.last_run_stats
+                            st.markdown("**Context forwarded per step (estimated tokens):**")
+                            for step_number, tokens in run_stats["context_tokens"].items():
+                                st.write(f"• **{st.session_state.chain_steps[step_number - 1]['name']}**: {tokens}")
+                            st.caption(
+                                f"{len(run_stats['levels'])} execution levels · "
+                                f"{run_stats['compactions']} context compactions · budget {run_stats['token_budget']} tokens"
+                            )
+
                     with tab4:
                         st.markdown("### 🔧 Technical Implementation")
                         
                         st.markdown("**LangChain Components Used:**")
                         components = []
                         if execution_type == "sequential":
-                            components = ["ChatPromptTemplate", "LCEL Chain", "StrOutputParser", "Sequential Execution"]
+                            components = ["ChatPromptTemplate (compiled once)", "LCEL Chain", "StrOutputParser",
+                                          "RunnableParallel (independent steps)", "Context Compaction"]
                         elif execution_type == "parallel":
                             components = ["RunnableParallel", "ChatPromptTemplate", "LCEL"]
                         else:
@@ -754,6 +926,8 @@ def render_prompt_chaining_interface():
                         st.markdown("**Chain Configuration:**")
                         config = {
                             "execution_type": execution_type,
+                            "context_mode": context_mode if execution_type == "sequential" else None,
+                            "token_budget": token_budget if execution_type == "sequential" else None,
                             "steps_count": len(st.session_state.chain_steps),
                             "memory_enabled": use_memory,
                             "streaming_enabled": use_callbacks,
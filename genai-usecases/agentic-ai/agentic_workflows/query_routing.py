@@ -5,12 +5,15 @@ Intelligent query classification and routing to specialized processors
 - Specialized processor selection
 - Conditional workflow execution
 - Load balancing and optimization
+- Compiled rule index, LLM skip threshold and routing cache
 """
 
 import asyncio
 import streamlit as st
 import re
-from typing import List, Dict, Any
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 import os
@@ -19,14 +22,23 @@ from enum import Enum
 
 # LangChain imports
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_ollama import ChatOllama
-from langchain_groq import ChatGroq
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
+from llm_clients import create_llm, render_llm_client_stats
 
 load_dotenv()
 
+TOKEN_PATTERN = re.compile(r"\w+")
+
+BENCHMARK_QUERIES = [
+    "Analyze the sales data trends for Q3 and plot a chart",
+    "Write a blog post about AI in healthcare",
+    "Debug this Python function that throws an error",
+    "Research and find information on renewable energy policy",
+    "Calculate the compound interest and solve the equation",
+    "Explain how transformers work",
+    "Generate a short story about a robot",
+    "What is the capital of France?"
+]
+
 class QueryType(Enum):
     """Supported query types for routing"""
     ANALYSIS = "analysis"
@@ -48,12 +60,93 @@ class RoutingRule:
     priority: int = 1
 
 class QueryRouter:
-    """Intelligent query routing system"""
-
-    def __init__(self, llm):
+    """
+    Intelligent query routing system
+
+    Rule patterns are compiled once: plain word-list patterns into a token
+    index, everything else into a single combined regex, and rule keywords
+    into one word-anchored alternation, so scoring a query is a tokenization
+    plus a couple of regex passes regardless of the number of rules. When the best
+    rule clears ``llm_skip_threshold`` the LLM classifier is not called at
+    all; otherwise its answer can override a weak rule match. Recent
+    routings are kept in an LRU cache.
+    """
+
+    def __init__(self, llm, llm_skip_threshold: float = 0.7, cache_size: int = 256):
         self.llm = llm
+        self.llm_skip_threshold = llm_skip_threshold
+        self.cache_size = cache_size
         self.routing_rules = self._initialize_routing_rules()
         self.routing_history = []
+        self._routing_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.routing_stats = {
+            "queries": 0,
+            "cache_hits": 0,
+            "llm_skipped": 0,
+            "llm_calls": 0,
+            "llm_overrides": 0,
+            "classification_time": 0.0
+        }
+        self._compile_rules()
+
+    # Patterns of the form \b(word|word?|...)\b can be answered from the query's token set
+    WORD_LIST_PATTERN = re.compile(r"^\\b\(((?:\w+\??\|)*\w+\??)\)\\b$")
+
+    def _compile_rules(self):
+        """Build the token index, combined pattern regex and keyword automaton from routing_rules"""
+        simple_patterns: Dict[str, List[Tuple[int, int]]] = {}
+        self._spanning_patterns = []
+        self._pattern_tokens: Dict[str, List[Tuple[int, int]]] = {}
+        keyword_owners: Dict[str, List[int]] = {}
+
+        for rule_index, rule in enumerate(self.routing_rules):
+            for pattern_index, pattern in enumerate(rule.patterns):
+                word_list = self.WORD_LIST_PATTERN.match(pattern)
+                if word_list:
+                    for word in word_list.group(1).split("|"):
+                        variants = {word[:-1], word[:-2]} if word.endswith("?") else {word}
+                        for variant in variants:
+                            self._pattern_tokens.setdefault(variant, []).append((rule_index, pattern_index))
+                elif ".*" in pattern or ".+" in pattern:
+                    # Could swallow other matches in a combined pass; check on its own
+                    self._spanning_patterns.append((rule_index, pattern_index, re.compile(pattern)))
+                else:
+                    simple_patterns.setdefault(pattern, []).append((rule_index, pattern_index))
+            for keyword in dict.fromkeys(k.lower() for k in rule.keywords):
+                keyword_owners.setdefault(keyword, []).append(rule_index)
+
+        self._pattern_groups = {}
+        alternatives = []
+        for group_index, (pattern, owners) in enumerate(simple_patterns.items()):
+            self._pattern_groups[f"p{group_index}"] = owners
+            alternatives.append(f"(?P<p{group_index}>{pattern})")
+        self._combined_pattern = re.compile("|".join(alternatives)) if alternatives else None
+
+        # Word-anchored, longest first: "api" no longer matches inside "capital",
+        # while inflections such as "analyzed" still hit "analyze"
+        self._keyword_owners = keyword_owners
+        keywords = sorted(keyword_owners, key=len, reverse=True)
+        self._keyword_pattern = re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + ")") if keywords else None
+
+        # Per-rule score weights, so scoring never touches RoutingRule objects
+        self._rule_weights = [
+            (
+                rule.name,
+                rule.query_type.value,
+                rule.processor,
+                0.6 / len(rule.keywords) if rule.keywords else 0.0,
+                0.4 / len(rule.patterns) if rule.patterns else 0.0,
+                rule.priority * 0.1
+            )
+            for rule in self.routing_rules
+        ]
+
+        self._routing_cache.clear()
+
+    def add_routing_rule(self, rule: RoutingRule):
+        """Register a routing rule and recompile the rule index"""
+        self.routing_rules.append(rule)
+        self._compile_rules()
 
     def _initialize_routing_rules(self) -> List[RoutingRule]:
         """Initialize default routing rules"""
@@ -62,7 +155,7 @@ class QueryRouter:
                 name="Data Analysis",
                 description="Statistical analysis, data processing, visualization",
                 keywords=["analyze", "statistics", "data", "chart", "graph", "visualization", "trend"],
-                patterns=[r"\\b(analyze|analysis|statistical?)\\b", r"\\b(data|dataset)\\b", r"\\b(chart|graph|plot)\\b"],
+                patterns=[r"\b(analyze|analysis|statistical?)\b", r"\b(data|dataset)\b", r"\b(chart|graph|plot)\b"],
                 query_type=QueryType.ANALYSIS,
                 processor="analysis_processor",
                 priority=2
@@ -71,7 +164,7 @@ class QueryRouter:
                 name="Content Generation",
                 description="Creative writing, content creation, copywriting",
                 keywords=["write", "create", "generate", "compose", "draft", "content", "article"],
-                patterns=[r"\\b(write|create|generate)\\b", r"\\b(article|blog|content)\\b", r"\\b(story|essay)\\b"],
+                patterns=[r"\b(write|create|generate)\b", r"\b(article|blog|content)\b", r"\b(story|essay)\b"],
                 query_type=QueryType.GENERATION,
                 processor="generation_processor",
                 priority=2
@@ -80,7 +173,7 @@ class QueryRouter:
                 name="Research",
                 description="Information gathering, fact-checking, research tasks",
                 keywords=["research", "find", "search", "investigate", "study", "explore", "learn"],
-                patterns=[r"\\b(research|investigate)\\b", r"\\b(find|search).*\\binformation\\b", r"\\b(study|explore)\\b"],
+                patterns=[r"\b(research|investigate)\b", r"\b(find|search).*\binformation\b", r"\b(study|explore)\b"],
                 query_type=QueryType.RESEARCH,
                 processor="research_processor",
                 priority=2
@@ -89,7 +182,7 @@ class QueryRouter:
                 name="Code Development",
                 description="Programming, debugging, code review, technical tasks",
                 keywords=["code", "program", "function", "debug", "api", "software", "algorithm"],
-                patterns=[r"\\b(code|coding|program)\\b", r"\\b(function|algorithm)\\b", r"\\b(debug|error)\\b"],
+                patterns=[r"\b(code|coding|program)\b", r"\b(function|algorithm)\b", r"\b(debug|error)\b"],
                 query_type=QueryType.CODING,
                 processor="coding_processor",
                 priority=3
@@ -98,7 +191,7 @@ class QueryRouter:
                 name="Mathematical",
                 description="Mathematical calculations, equations, problem solving",
                 keywords=["calculate", "solve", "equation", "math", "formula", "compute"],
-                patterns=[r"\\b(calculate|compute)\\b", r"\\b(equation|formula)\\b", r"\\b(solve|solution)\\b"],
+                patterns=[r"\b(calculate|compute)\b", r"\b(equation|formula)\b", r"\b(solve|solution)\b"],
                 query_type=QueryType.MATH,
                 processor="math_processor",
                 priority=2
@@ -107,85 +200,193 @@ class QueryRouter:
                 name="General Query",
                 description="General questions and conversations",
                 keywords=["help", "explain", "what", "how", "why", "question"],
-                patterns=[r"\\b(help|explain)\\b", r"\\b(what|how|why)\\b"],
+                patterns=[r"\b(help|explain)\b", r"\b(what|how|why)\b"],
                 query_type=QueryType.GENERAL,
                 processor="general_processor",
                 priority=1
             )
         ]
 
-    async def classify_query(self, query: str) -> Dict[str, Any]:
+    async def classify_query(self, query: str, use_cache: bool = True) -> Dict[str, Any]:
         """Classify query using both rule-based and LLM-based approaches"""
+        start_time = time.perf_counter()
+        self.routing_stats["queries"] += 1
+        cache_key = " ".join(query.lower().split())
+
+        if use_cache and cache_key in self._routing_cache:
+            self._routing_cache.move_to_end(cache_key)
+            self.routing_stats["cache_hits"] += 1
+            classification = dict(self._routing_cache[cache_key])
+            classification.update({"query": query, "cache_hit": True, "timestamp": datetime.now().isoformat()})
+            self.routing_stats["classification_time"] += time.perf_counter() - start_time
+            return classification
+
         try:
-            # Rule-based classification
+            # Rule-based classification (microseconds, so it always runs first)
             rule_scores = self._score_routing_rules(query)
+            best_rule = rule_scores[0] if rule_scores else None
 
-            # LLM-based classification for validation
-            llm_classification = await self._llm_classify_query(query)
+            final_routing = best_rule if best_rule and best_rule['score'] > 0.3 else self._general_routing()
 
-            # Combine results
-            best_rule = max(rule_scores, key=lambda x: x['score']) if rule_scores else None
+            if best_rule and best_rule['score'] >= self.llm_skip_threshold:
+                # Rules are confident enough; the LLM answer would not change the route
+                self.routing_stats["llm_skipped"] += 1
+                llm_classification = {
+                    "category": best_rule['query_type'],
+                    "confidence": best_rule['score'],
+                    "skipped": True
+                }
+            else:
+                llm_classification = await self._llm_classify_query(query)
+                self.routing_stats["llm_calls"] += 1
+                llm_routing = self._routing_for_category(llm_classification)
+                if llm_routing and llm_routing['score'] > final_routing['score']:
+                    final_routing = llm_routing
+                    self.routing_stats["llm_overrides"] += 1
 
             classification = {
                 "query": query,
                 "rule_based_result": best_rule,
                 "llm_classification": llm_classification,
-                "final_routing": best_rule if best_rule and best_rule['score'] > 0.3 else {
-                    "name": "General Query",
-                    "query_type": QueryType.GENERAL.value,
-                    "processor": "general_processor",
-                    "score": 0.5
-                },
+                "final_routing": final_routing,
+                "cache_hit": False,
                 "timestamp": datetime.now().isoformat()
             }
 
+            if "error" not in llm_classification:
+                self._routing_cache[cache_key] = classification
+                if len(self._routing_cache) > self.cache_size:
+                    self._routing_cache.popitem(last=False)
+
             return classification
 
         except Exception as e:
             return {
                 "query": query,
                 "error": str(e),
-                "final_routing": {
-                    "name": "General Query",
-                    "query_type": QueryType.GENERAL.value,
-                    "processor": "general_processor",
-                    "score": 0.5
-                }
+                "final_routing": self._general_routing()
             }
 
-    def _score_routing_rules(self, query: str) -> List[Dict[str, Any]]:
-        """Score query against routing rules"""
-        query_lower = query.lower()
-        scores = []
+        finally:
+            self.routing_stats["classification_time"] += time.perf_counter() - start_time
 
-        for rule in self.routing_rules:
-            score = 0
+    @staticmethod
+    def _general_routing() -> Dict[str, Any]:
+        return {
+            "name": "General Query",
+            "query_type": QueryType.GENERAL.value,
+            "processor": "general_processor",
+            "score": 0.5
+        }
 
-            # Keyword matching
-            keyword_matches = sum(1 for keyword in rule.keywords if keyword in query_lower)
-            keyword_score = (keyword_matches / len(rule.keywords)) * 0.6
+    def _routing_for_category(self, llm_classification: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Map an LLM category to the highest-priority rule of that query type"""
+        if "error" in llm_classification:
+            return None
+        rules = [r for r in self.routing_rules if r.query_type.value == llm_classification.get("category")]
+        if not rules:
+            return None
+        rule = max(rules, key=lambda r: r.priority)
+        return {
+            "name": rule.name,
+            "query_type": rule.query_type.value,
+            "processor": rule.processor,
+            "score": min(float(llm_classification.get("confidence", 0.5)), 1.0),
+            "source": "llm"
+        }
 
-            # Pattern matching
-            pattern_matches = sum(1 for pattern in rule.patterns if re.search(pattern, query_lower))
-            pattern_score = (pattern_matches / len(rule.patterns)) * 0.4 if rule.patterns else 0
+    def _score_routing_rules(self, query: str) -> List[Dict[str, Any]]:
+        """Score query against routing rules"""
+        query_lower = query.lower()
+        keyword_hits: Dict[int, set] = {}
+        pattern_hits: Dict[int, set] = {}
+
+        # Keyword matching: one pass of the keyword automaton
+        if self._keyword_pattern:
+            for keyword in set(self._keyword_pattern.findall(query_lower)):
+                for rule_index in self._keyword_owners[keyword]:
+                    keyword_hits.setdefault(rule_index, set()).add(keyword)
+
+        # Pattern matching: word-list patterns via the token set, the rest via
+        # one pass of the combined regex plus the spanning patterns
+        for token in set(TOKEN_PATTERN.findall(query_lower)):
+            for rule_index, pattern_index in self._pattern_tokens.get(token, ()):
+                pattern_hits.setdefault(rule_index, set()).add(pattern_index)
+        if self._combined_pattern:
+            for match in self._combined_pattern.finditer(query_lower):
+                for rule_index, pattern_index in self._pattern_groups[match.lastgroup]:
+                    pattern_hits.setdefault(rule_index, set()).add(pattern_index)
+        for rule_index, pattern_index, pattern in self._spanning_patterns:
+            if pattern.search(query_lower):
+                pattern_hits.setdefault(rule_index, set()).add(pattern_index)
 
-            # Priority bonus
-            priority_bonus = rule.priority * 0.1
+        scores = []
+        for rule_index, (name, query_type, processor, keyword_weight, pattern_weight, priority_bonus) in enumerate(self._rule_weights):
+            keyword_matches = len(keyword_hits[rule_index]) if rule_index in keyword_hits else 0
+            pattern_matches = len(pattern_hits[rule_index]) if rule_index in pattern_hits else 0
 
-            total_score = keyword_score + pattern_score + priority_bonus
+            total_score = keyword_matches * keyword_weight + pattern_matches * pattern_weight + priority_bonus
 
             if total_score > 0:
                 scores.append({
-                    "name": rule.name,
-                    "query_type": rule.query_type.value,
-                    "processor": rule.processor,
+                    "name": name,
+                    "query_type": query_type,
+                    "processor": processor,
                     "score": min(total_score, 1.0),
                     "keyword_matches": keyword_matches,
                     "pattern_matches": pattern_matches
                 })
 
+        scores.sort(key=lambda x: x['score'], reverse=True)
+        return scores
+
+    def _score_routing_rules_per_rule(self, query: str) -> List[Dict[str, Any]]:
+        """Per-rule re.search/substring scan, kept as the benchmark baseline"""
+        query_lower = query.lower()
+        scores = []
+        for rule in self.routing_rules:
+            keyword_matches = sum(1 for keyword in rule.keywords if keyword in query_lower)
+            pattern_matches = sum(1 for pattern in rule.patterns if re.search(pattern, query_lower))
+            scores.append({
+                "name": rule.name,
+                "score": min((keyword_matches / len(rule.keywords)) * 0.6
+                             + ((pattern_matches / len(rule.patterns)) * 0.4 if rule.patterns else 0)
+                             + rule.priority * 0.1, 1.0)
+            })
         return sorted(scores, key=lambda x: x['score'], reverse=True)
 
+    def benchmark(self, queries: Optional[List[str]] = None, rounds: int = 200) -> Dict[str, float]:
+        """Measure rule-scoring throughput (queries/sec) against the per-rule scan"""
+        queries = queries or BENCHMARK_QUERIES
+
+        def rate(func) -> float:
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for q in queries:
+                    func(q)
+            elapsed = time.perf_counter() - start
+            return (rounds * len(queries)) / elapsed if elapsed > 0 else float("inf")
+
+        re.purge()  # don't let the re module's own cache flatter the baseline
+        baseline = rate(self._score_routing_rules_per_rule)
+        compiled = rate(self._score_routing_rules)
+
+        return {
+            "queries": len(queries) * rounds,
+            "per_rule_qps": baseline,
+            "compiled_qps": compiled,
+            "speedup": compiled / baseline if baseline else 0.0
+        }
+
+    def get_routing_stats(self) -> Dict[str, Any]:
+        queries = self.routing_stats["queries"]
+        return {
+            **self.routing_stats,
+            "cache_size": len(self._routing_cache),
+            "cache_hit_rate": self.routing_stats["cache_hits"] / queries if queries else 0.0,
+            "avg_classification_ms": self.routing_stats["classification_time"] / queries * 1000 if queries else 0.0
+        }
+
     async def _llm_classify_query(self, query: str) -> Dict[str, Any]:
         """Use LLM to classify query type"""
         try:
@@ -397,24 +598,6 @@ class QueryRouter:
             "specialization": "General Assistant"
         }
 
-def create_llm(provider: str, model: str, base_url: str = None):
-    """Create LLM instance based on provider"""
-    if provider == "Ollama":
-        return ChatOllama(
-            model=model,
-            base_url=base_url or 'http://localhost:11434',
-            temperature=0.3,
-            timeout=120
-        )
-    elif provider == "OpenAI":
-        return ChatOpenAI(model=model, api_key=os.getenv("OPENAI_API_KEY"), temperature=0.3)
-    elif provider == "Anthropic":
-        return ChatAnthropic(model=model, api_key=os.getenv("ANTHROPIC_API_KEY"), temperature=0.3)
-    elif provider == "Gemini":
-        return ChatGoogleGenerativeAI(model=model, api_key=os.getenv("GEMINI_API_KEY"), temperature=0.3)
-    elif provider == "Groq":
-        return ChatGroq(model=model, api_key=os.getenv("GROQ_API_KEY"), temperature=0.3)
-
 def render_query_routing_interface():
     """Render the Streamlit interface for Query Routing workflow"""
     st.header("🎯 Query Routing Workflow")
@@ -506,6 +689,14 @@ def render_query_routing_interface():
             - 💬 **General**: General questions and conversations
             """)
 
+        llm_skip_threshold = st.slider(
+            "LLM Skip Threshold", 0.3, 1.0, 0.7, 0.05,
+            key='routing_llm_skip_threshold',
+            help="Skip the LLM classifier when the best rule scores at least this much (1.0 = always ask the LLM)"
+        )
+
+        render_llm_client_stats()
+
     # Debug: Clear session state if needed
     if st.sidebar.button("🔄 Reset Router", help="Clear cached router to fix enum issues"):
         if 'query_router' in st.session_state:
@@ -525,8 +716,9 @@ def render_query_routing_interface():
         **Query Routing Workflow Pattern:**
 
         🎯 **Intelligent Classification**
-        - Rule-based keyword and pattern matching
-        - LLM based query understanding
+        - Rule-based keyword and pattern matching (compiled once)
+        - LLM based query understanding, skipped when rules are confident
+        - Recent routings cached
         - Confidence scoring and validation
 
         🔀 **Dynamic Routing**
@@ -577,6 +769,7 @@ def render_query_routing_interface():
                 # Update router LLM if changed
                 current_llm = create_llm(llm_provider, model, ollama_base_url)
                 st.session_state.query_router.llm = current_llm
+                st.session_state.query_router.llm_skip_threshold = llm_skip_threshold
 
                 # Route and process
                 result = asyncio.run(st.session_state.query_router.route_and_process(query))
@@ -621,8 +814,14 @@ def render_query_routing_interface():
                         if 'llm_classification' in classification:
                             st.markdown("**LLM Classification:**")
                             llm_result = classification['llm_classification']
-                            st.write(f"- **Category:** {llm_result.get('category', 'unknown')}")
-                            st.write(f"- **Confidence:** {llm_result.get('confidence', 0):.3f}")
+                            if llm_result.get('skipped'):
+                                st.write("- **Skipped:** rule confidence cleared the threshold")
+                            else:
+                                st.write(f"- **Category:** {llm_result.get('category', 'unknown')}")
+                                st.write(f"- **Confidence:** {llm_result.get('confidence', 0):.3f}")
+
+                        if classification.get('cache_hit'):
+                            st.caption("⚡ Routing served from cache")
 
                 with tab3:
                     st.markdown("### 📊 Classification Analysis")
@@ -640,6 +839,28 @@ def render_query_routing_interface():
             except Exception as e:
                 st.error(f"Processing error: {str(e)}")
 
+    # Router performance
+    with st.expander("⚡ Router Performance", expanded=False):
+        router = st.session_state.query_router
+        routing_stats = router.get_routing_stats()
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Queries Routed", routing_stats['queries'])
+        with col2:
+            st.metric("LLM Calls Skipped", routing_stats['llm_skipped'])
+        with col3:
+            st.metric("Cache Hit Rate", f"{routing_stats['cache_hit_rate']:.0%}")
+        with col4:
+            st.metric("Avg Classification", f"{routing_stats['avg_classification_ms']:.1f} ms")
+
+        if st.button("Run Rule-Scoring Benchmark", key='routing_benchmark'):
+            benchmark = router.benchmark()
+            st.write(
+                f"**Compiled index:** {benchmark['compiled_qps']:,.0f} queries/sec · "
+                f"**Per-rule scan:** {benchmark['per_rule_qps']:,.0f} queries/sec · "
+                f"**Speedup:** {benchmark['speedup']:.1f}x"
+            )
+
     # Routing history
     if show_routing_history and 'query_router' in st.session_state:
         history = st.session_state.query_router.routing_history
@@ -0,0 +1,64 @@
+"""Tests for event bus dispatch and batching in the event-driven workflow"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("dotenv")
+pytest.importorskip("langchain_core")
+
+from event_driven import EventDrivenWorkflow, EventType
+
+
+class FakeLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        # Slow enough that later events arrive while a batch is still being flushed
+        await asyncio.sleep(0.05)
+        self.calls += 1
+        return type("Response", (), {"content": "ok"})()
+
+
+def make_workflow():
+    llm = FakeLLM()
+    workflow = EventDrivenWorkflow(llm)
+    workflow.add_agent("agent_1")
+    return workflow, llm
+
+
+def test_settle_returns_after_a_burst_of_data_updates():
+    workflow, llm = make_workflow()
+    agent = workflow.agents["agent_1"]
+
+    async def burst():
+        for i in range(30):
+            await workflow.trigger_event(EventType.DATA_UPDATED, {"data": {"metric": i}}, wait=False)
+        await asyncio.wait_for(workflow.settle(), timeout=10)
+
+    asyncio.run(burst())
+
+    assert agent.idle
+    assert agent.coalescing_stats["events_received"] == 30
+    assert llm.calls == agent.coalescing_stats["batches"] == 2
+    assert agent.state["metric"] == 29
+
+
+def test_settle_on_a_new_loop_handles_events_carried_over():
+    workflow, llm = make_workflow()
+
+    async def publish_only():
+        await workflow.trigger_event(EventType.TASK_COMPLETED, {"result": "done"}, wait=False)
+
+    asyncio.run(publish_only())
+    assert llm.calls == 0
+
+    async def settle():
+        await asyncio.wait_for(workflow.settle(), timeout=10)
+
+    asyncio.run(settle())
+
+    assert llm.calls == 1
+    assert workflow.event_bus.get_stats()["pending_events"] == 0
@@ -6,9 +6,10 @@ A sophisticated tool management and coordination system for multi-agent workflow
 featuring dynamic tool selection, intelligent routing, and automated orchestration.
 
 Key Features:
-- Dynamic tool registry with performance-based selection
+- Dynamic tool registry with performance-based selection and indexed search
+- Per-tool EWMA/histogram latency and windowed success-rate telemetry
 - LLM-powered workflow planning and optimization
-- Dependency-aware execution with context preservation
+- Dependency-aware DAG execution with bounded concurrency, timeouts and retries
 - Real-time performance monitoring and analytics
 - Type-safe tool integration with standardized interfaces
 
@@ -33,8 +34,14 @@ Use Cases:
 import asyncio
 import streamlit as st
 import json
+import re
 import time
-from typing import List, Dict, Any, Optional, Callable
+import uuid
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator, Set, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 import os
@@ -43,20 +50,18 @@ from enum import Enum
 
 # LangChain core components for LLM integration
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_groq import ChatGroq
-
-# Multi-provider LLM support with Ollama integration
-try:
-    from langchain_ollama import ChatOllama
-except ImportError:
-    ChatOllama = None
+from llm_clients import create_llm, render_llm_client_stats
 
 # Load environment configuration
 load_dotenv()
 
+# Synchronous tools run on this shared, bounded pool. A Python thread can't be
+# interrupted, so a call that times out keeps its worker until the function
+# returns; the cap bounds how many threads such abandoned calls can hold.
+SYNC_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("TOOL_MAX_THREADS", "16")), thread_name_prefix="sync-tool"
+)
+
 # =============================================================================
 # BACKEND: DATA MODELS AND ENUMERATIONS
 # =============================================================================
@@ -96,6 +101,9 @@ class Tool:
         parameters: Expected input parameters with types
         performance_metrics: Runtime performance data
         active: Whether tool is available for execution
+        timeout: Default per-invocation timeout in seconds (None for no limit)
+        max_retries: Default number of retries after a failure or timeout
+        capabilities: Keywords describing what the tool can do (used by search)
     """
     tool_id: str
     name: str
@@ -106,6 +114,9 @@ class Tool:
     parameters: Dict[str, Any] = None
     performance_metrics: Dict[str, float] = None
     active: bool = True
+    timeout: Optional[float] = None
+    max_retries: int = 0
+    capabilities: List[str] = None
 
     def __post_init__(self):
         """Initialize default values for optional fields."""
@@ -113,8 +124,10 @@ class Tool:
             self.dependencies = []
         if self.parameters is None:
             self.parameters = {}
+        if self.capabilities is None:
+            self.capabilities = []
         if self.performance_metrics is None:
-            self.performance_metrics = {"avg_execution_time": 0.0, "success_rate": 100.0}
+            self.performance_metrics = {"avg_execution_time": 0.0, "p95_execution_time": 0.0, "success_rate": 100.0}
 
 @dataclass
 class ToolExecution:
@@ -130,18 +143,95 @@ class ToolExecution:
         input_data: Parameters passed to the tool
         output_data: Results returned by the tool
         execution_time: Time taken for execution in seconds
-        status: Execution status (pending, running, completed, failed)
+        status: Execution status (pending, running, completed, failed, skipped)
         error_message: Error details if execution failed
         timestamp: ISO timestamp of execution start
+        attempts: Number of attempts made (1 + retries used)
     """
     execution_id: str
     tool_id: str
     input_data: Dict[str, Any]
     output_data: Dict[str, Any] = None
     execution_time: float = 0.0
-    status: str = "pending"  # pending, running, completed, failed
+    status: str = "pending"  # pending, running, completed, failed, skipped
     error_message: str = None
     timestamp: str = None
+    attempts: int = 0
+
+# =============================================================================
+# BACKEND: TOOL TELEMETRY
+# =============================================================================
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float("inf"))
+
+class ToolTelemetry:
+    """
+    Runtime statistics for a single tool.
+
+    Latency is tracked as an exponentially weighted moving average (recent
+    runs count more, old runs fade out) plus a fixed-bucket histogram for
+    percentiles. Success rate is computed over the last ``window`` outcomes
+    so a tool recovers once it starts working again.
+
+    Args:
+        window: Number of recent outcomes used for the success rate
+        alpha: EWMA smoothing factor (higher reacts faster)
+    """
+
+    def __init__(self, window: int = 50, alpha: float = 0.3):
+        self.alpha = alpha
+        self.ewma_latency: Optional[float] = None
+        self.histogram = [0] * len(LATENCY_BUCKETS)
+        self.outcomes = deque(maxlen=window)
+        self.total_executions = 0
+        self.total_failures = 0
+
+    def record(self, execution_time: float, success: bool):
+        """Fold one execution into the statistics."""
+        self.total_executions += 1
+        self.total_failures += not success
+        self.outcomes.append(success)
+        self.histogram[bisect_left(LATENCY_BUCKETS, execution_time)] += 1
+        if self.ewma_latency is None:
+            self.ewma_latency = execution_time
+        else:
+            self.ewma_latency += self.alpha * (execution_time - self.ewma_latency)
+
+    @property
+    def success_rate(self) -> float:
+        """Windowed success rate in [0, 1]; 1.0 until the tool has run."""
+        return sum(self.outcomes) / len(self.outcomes) if self.outcomes else 1.0
+
+    def latency_quantile(self, q: float) -> float:
+        """Estimate a latency quantile by interpolating within histogram buckets."""
+        if not self.total_executions:
+            return 0.0
+        target = q * self.total_executions
+        cumulative = 0
+        for i, count in enumerate(self.histogram):
+            if count and cumulative + count >= target:
+                lower = LATENCY_BUCKETS[i - 1] if i else 0.0
+                upper = LATENCY_BUCKETS[i] if LATENCY_BUCKETS[i] != float("inf") else lower * 2
+                return lower + (upper - lower) * (target - cumulative) / count
+            cumulative += count
+        return LATENCY_BUCKETS[-2]
+
+    def expected_cost(self, default_latency: float = 1.0) -> float:
+        """Expected seconds per successful run (latency inflated by the failure rate)."""
+        latency = self.ewma_latency if self.ewma_latency is not None else default_latency
+        return latency / max(self.success_rate, 0.05)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "executions": self.total_executions,
+            "failures": self.total_failures,
+            "ewma_latency": self.ewma_latency or 0.0,
+            "p50_latency": self.latency_quantile(0.5),
+            "p95_latency": self.latency_quantile(0.95),
+            "success_rate": self.success_rate * 100,
+            "expected_cost": self.expected_cost()
+        }
 
 # =============================================================================
 # BACKEND: TOOL REGISTRY AND MANAGEMENT
@@ -157,16 +247,30 @@ class ToolRegistry:
 
     Features:
     - Dynamic tool registration and discovery
-    - Performance-based tool selection
+    - Performance-based tool selection from per-tool telemetry
     - Dependency resolution and validation
-    - Search and filtering capabilities
-    - Execution history tracking
+    - Inverted-index search over names, descriptions and capabilities
+    - Bounded execution history tracking
+
+    Args:
+        history_size: Number of recent executions kept in execution_history
+        telemetry_window: Number of recent outcomes used for success rates
+        ewma_alpha: Smoothing factor for the latency moving average
     """
 
-    def __init__(self):
+    SEARCH_TOKEN = re.compile(r"[a-z0-9]+")
+
+    def __init__(self, history_size: int = 500, telemetry_window: int = 50, ewma_alpha: float = 0.3):
         """Initialize tool registry with default tools."""
         self.tools = {}
-        self.execution_history = []
+        self.execution_history = deque(maxlen=history_size)
+        self.telemetry: Dict[str, ToolTelemetry] = {}
+        self.telemetry_window = telemetry_window
+        self.ewma_alpha = ewma_alpha
+        self.total_executions = 0
+        self.successful_executions = 0
+        self._search_index: Dict[str, Set[str]] = {}
+        self._search_terms: List[str] = []
         self._register_default_tools()
 
     def register_tool(self, tool: Tool):
@@ -176,7 +280,70 @@ class ToolRegistry:
         Args:
             tool: Tool instance to register with complete metadata
         """
+        if tool.tool_id in self.tools:
+            self._unindex_tool(tool.tool_id)
         self.tools[tool.tool_id] = tool
+        self.telemetry.setdefault(tool.tool_id, ToolTelemetry(self.telemetry_window, self.ewma_alpha))
+        self._index_tool(tool)
+
+    def _tool_terms(self, tool: Tool) -> Set[str]:
+        text = " ".join([tool.tool_id, tool.name, tool.description, tool.tool_type.value, *tool.capabilities])
+        return set(self.SEARCH_TOKEN.findall(text.lower()))
+
+    def _index_tool(self, tool: Tool):
+        for term in self._tool_terms(tool):
+            self._search_index.setdefault(term, set()).add(tool.tool_id)
+        self._search_terms = sorted(self._search_index)
+
+    def _unindex_tool(self, tool_id: str):
+        for term in self._tool_terms(self.tools[tool_id]):
+            postings = self._search_index.get(term)
+            if postings is not None:
+                postings.discard(tool_id)
+                if not postings:
+                    del self._search_index[term]
+        self._search_terms = sorted(self._search_index)
+
+    def _term_matches(self, term: str) -> Set[str]:
+        """Tool ids for an exact term, or for any indexed term it is a prefix of"""
+        if term in self._search_index:
+            return self._search_index[term]
+        matches = set()
+        i = bisect_left(self._search_terms, term)
+        while i < len(self._search_terms) and self._search_terms[i].startswith(term):
+            matches |= self._search_index[self._search_terms[i]]
+            i += 1
+        return matches
+
+    def record_execution(self, execution: ToolExecution):
+        """
+        Record a finished execution in the history and the tool's telemetry.
+
+        Also refreshes the tool's performance_metrics summary (EWMA latency,
+        p95 latency and windowed success rate) used by the UI and planning.
+        """
+        self.execution_history.append(execution)
+        self.total_executions += 1
+        success = execution.status == "completed"
+        self.successful_executions += success
+
+        telemetry = self.telemetry.get(execution.tool_id)
+        tool = self.tools.get(execution.tool_id)
+        if telemetry is None or tool is None:
+            return
+        telemetry.record(execution.execution_time, success)
+        tool.performance_metrics.update({
+            "avg_execution_time": telemetry.ewma_latency,
+            "p95_execution_time": telemetry.latency_quantile(0.95),
+            "success_rate": telemetry.success_rate * 100
+        })
+
+    def rank_tools(self, tool_ids: List[str]) -> List[str]:
+        """Order tool ids by expected cost per successful run (fastest, most reliable first)."""
+        return sorted(
+            tool_ids,
+            key=lambda tool_id: self.telemetry[tool_id].expected_cost() if tool_id in self.telemetry else float("inf")
+        )
 
     def get_tool(self, tool_id: str) -> Optional[Tool]:
         """
@@ -204,7 +371,11 @@ class ToolRegistry:
 
     def search_tools(self, query: str) -> List[Tool]:
         """
-        Search tools by name or description using text matching.
+        Search tools by name, description and capabilities.
+
+        Every query word must match an indexed term (or be a prefix of one).
+        Results are ordered by the number of exact term hits, then by expected
+        cost so faster and more reliable tools come first.
 
         Args:
             query: Search query string
@@ -212,11 +383,24 @@ class ToolRegistry:
         Returns:
             List of tools matching the search criteria
         """
-        query_lower = query.lower()
-        return [
-            tool for tool in self.tools.values()
-            if query_lower in tool.name.lower() or query_lower in tool.description.lower()
-        ]
+        terms = self.SEARCH_TOKEN.findall(query.lower())
+        if not terms:
+            return []
+
+        matches = None
+        for term in terms:
+            term_matches = self._term_matches(term)
+            matches = set(term_matches) if matches is None else matches & term_matches
+            if not matches:
+                return []
+
+        exact_hits = {
+            tool_id: sum(tool_id in self._search_index.get(term, ()) for term in terms)
+            for tool_id in matches
+        }
+        ranked = self.rank_tools(list(matches))
+        ranked.sort(key=lambda tool_id: -exact_hits[tool_id])
+        return [self.tools[tool_id] for tool_id in ranked]
 
     def _register_default_tools(self):
         """
@@ -235,7 +419,8 @@ class ToolRegistry:
             description="Analyzes text for sentiment, topics, and key insights",
             tool_type=ToolType.ANALYSIS,
             function=self._text_analysis_tool,
-            parameters={"text": "string", "analysis_type": "string"}
+            parameters={"text": "string", "analysis_type": "string"},
+            capabilities=["sentiment", "topics", "keywords", "nlp", "insights"]
         ))
 
         self.register_tool(Tool(
@@ -244,7 +429,8 @@ class ToolRegistry:
             description="Summarizes structured data and generates insights",
             tool_type=ToolType.ANALYSIS,
             function=self._data_summarization_tool,
-            parameters={"data": "dict", "summary_type": "string"}
+            parameters={"data": "dict", "summary_type": "string"},
+            capabilities=["summary", "statistics", "metrics", "report", "insights"]
         ))
 
         # -------------------------------------------------------------------------
@@ -257,7 +443,8 @@ class ToolRegistry:
             description="Generates various types of content based on prompts",
             tool_type=ToolType.GENERATION,
             function=self._content_generation_tool,
-            parameters={"prompt": "string", "content_type": "string"}
+            parameters={"prompt": "string", "content_type": "string"},
+            capabilities=["writing", "article", "copy", "blog", "text"]
         ))
 
         self.register_tool(Tool(
@@ -266,7 +453,8 @@ class ToolRegistry:
             description="Generates code in various programming languages",
             tool_type=ToolType.GENERATION,
             function=self._code_generation_tool,
-            parameters={"requirements": "string", "language": "string"}
+            parameters={"requirements": "string", "language": "string"},
+            capabilities=["programming", "python", "script", "development", "software"]
         ))
 
         # -------------------------------------------------------------------------
@@ -279,7 +467,8 @@ class ToolRegistry:
             description="Converts data between different formats",
             tool_type=ToolType.TRANSFORMATION,
             function=self._format_conversion_tool,
-            parameters={"data": "any", "source_format": "string", "target_format": "string"}
+            parameters={"data": "any", "source_format": "string", "target_format": "string"},
+            capabilities=["json", "csv", "xml", "yaml", "conversion", "transform"]
         ))
 
         # -------------------------------------------------------------------------
@@ -292,7 +481,8 @@ class ToolRegistry:
             description="Validates content quality and compliance",
             tool_type=ToolType.VALIDATION,
             function=self._quality_validation_tool,
-            parameters={"content": "string", "criteria": "list"}
+            parameters={"content": "string", "criteria": "list"},
+            capabilities=["review", "compliance", "validation", "qa", "scoring"]
         ))
 
     # -------------------------------------------------------------------------
@@ -382,122 +572,344 @@ class ToolOrchestrator:
 
     Key Features:
     - LLM-driven workflow planning and optimization
-    - Dependency-aware execution ordering
-    - Context variable resolution between steps
-    - Real-time performance tracking and analytics
+    - Dependency graph built from ${...} context references
+    - Concurrent execution of independent steps under a concurrency limit
+    - Per-tool timeouts and retries
+    - Streaming step completions and critical-path analytics
     - Error handling with graceful degradation
-    - Parallel and sequential execution patterns
 
     Args:
         llm: Language model for intelligent planning
         tool_registry: Registry containing available tools
+        max_concurrency: Maximum number of workflow steps running at once
     """
 
-    def __init__(self, llm, tool_registry: ToolRegistry):
+    CONTEXT_REFERENCE = re.compile(r"\$\{([^}]+)\}")
+    STEP_OUTPUT_REFERENCE = re.compile(r"^step_(\d+)_output$")
+
+    def __init__(self, llm, tool_registry: ToolRegistry, max_concurrency: int = 4):
         """Initialize orchestrator with LLM and tool registry."""
         self.llm = llm
         self.tool_registry = tool_registry
+        self.max_concurrency = max_concurrency
         self.execution_queue = []
         self.active_executions = {}
         self.workflow_state = {}
+        self.last_workflow_stats = {}
 
-    async def execute_tool(self, tool_id: str, input_data: Dict[str, Any]) -> ToolExecution:
-        """Execute a single tool"""
+    async def execute_tool(self, tool_id: str, input_data: Dict[str, Any],
+                           timeout: Optional[float] = None, retries: Optional[int] = None) -> ToolExecution:
+        """
+        Execute a single tool with an optional timeout and retries.
+
+        Synchronous tool functions run on ``SYNC_TOOL_EXECUTOR`` so they don't
+        block other steps of a concurrent workflow. A timeout fails the attempt
+        but cannot stop a synchronous function: it finishes in the background
+        (its result is discarded) while holding one of the pool's workers.
+
+        Args:
+            tool_id: ID of the tool to execute
+            input_data: Keyword arguments for the tool function
+            timeout: Per-attempt timeout in seconds (defaults to tool.timeout)
+            retries: Retries after a failure or timeout (defaults to tool.max_retries)
+        """
         tool = self.tool_registry.get_tool(tool_id)
         if not tool:
             raise ValueError(f"Tool {tool_id} not found")
 
+        timeout = tool.timeout if timeout is None else timeout
+        retries = tool.max_retries if retries is None else retries
+
         execution = ToolExecution(
-            execution_id=f"exec_{int(time.time())}_{tool_id}",
+            execution_id=f"exec_{int(time.time())}_{tool_id}_{uuid.uuid4().hex[:6]}",
             tool_id=tool_id,
             input_data=input_data,
             timestamp=datetime.now().isoformat()
         )
 
-        try:
-            execution.status = "running"
-            start_time = time.time()
+        execution.status = "running"
+        start_time = time.time()
 
-            # Execute tool function
-            if asyncio.iscoroutinefunction(tool.function):
-                result = await tool.function(**input_data)
-            else:
-                result = tool.function(**input_data)
-
-            execution_time = time.time() - start_time
-            execution.execution_time = execution_time
-            execution.output_data = result
-            execution.status = "completed"
-
-            # Update tool performance metrics
-            tool.performance_metrics["avg_execution_time"] = (
-                tool.performance_metrics["avg_execution_time"] + execution_time
-            ) / 2
-
-        except Exception as e:
-            execution.status = "failed"
-            execution.error_message = str(e)
-            # Update tool success rate
-            current_rate = tool.performance_metrics["success_rate"]
-            tool.performance_metrics["success_rate"] = max(0, current_rate - 5)
-
-        self.tool_registry.execution_history.append(execution)
+        for attempt in range(retries + 1):
+            execution.attempts = attempt + 1
+            try:
+                # Execute tool function
+                if asyncio.iscoroutinefunction(tool.function):
+                    call = tool.function(**input_data)
+                else:
+                    call = asyncio.get_running_loop().run_in_executor(
+                        SYNC_TOOL_EXECUTOR, partial(tool.function, **input_data)
+                    )
+                result = await asyncio.wait_for(call, timeout=timeout)
+
+                execution.output_data = result
+                execution.status = "completed"
+                execution.error_message = None
+                break
+
+            except asyncio.TimeoutError:
+                execution.status = "failed"
+                execution.error_message = f"Timed out after {timeout}s (attempt {attempt + 1})"
+                if not asyncio.iscoroutinefunction(tool.function):
+                    execution.error_message += "; the abandoned call keeps running in its worker thread"
+            except Exception as e:
+                execution.status = "failed"
+                execution.error_message = str(e)
+
+            if attempt < retries:
+                await asyncio.sleep(min(0.25 * (2 ** attempt), 2.0))
+
+        execution.execution_time = time.time() - start_time
+
+        # Update history and tool telemetry (latency EWMA/histogram, windowed success rate)
+        self.tool_registry.record_execution(execution)
         return execution
 
-    async def execute_workflow(self, workflow_plan: List[Dict[str, Any]]) -> List[ToolExecution]:
-        """Execute a planned workflow of tools"""
-        results = []
-        workflow_context = {}
+    def _find_references(self, value: Any) -> List[str]:
+        """Collect ${...} variable names from a (possibly nested) input value"""
+        if isinstance(value, str):
+            return self.CONTEXT_REFERENCE.findall(value)
+        if isinstance(value, dict):
+            return [ref for item in value.values() for ref in self._find_references(item)]
+        if isinstance(value, (list, tuple)):
+            return [ref for item in value for ref in self._find_references(item)]
+        return []
+
+    def build_dependency_graph(self, workflow_plan: List[Dict[str, Any]]) -> Tuple[Dict[int, Set[int]], Dict[int, Dict[str, int]]]:
+        """
+        Build the step dependency graph from context variable references.
+
+        ``${step_N_output}`` depends on plan step N (1-based) and
+        ``${<tool_id>_result}`` on the closest earlier step using that tool, matching
+        what the sequential executor would have had in context at that point.
+        Steps may also list explicit 1-based ``depends_on`` indices.
+
+        Returns:
+            (dependencies, producers): step index -> set of prerequisite step indices,
+            and step index -> {variable name: producing step index}
+        """
+        dependencies: Dict[int, Set[int]] = {}
+        producers: Dict[int, Dict[str, int]] = {}
+        last_step_for_tool: Dict[str, int] = {}
+
+        for index, step in enumerate(workflow_plan):
+            step_producers = {}
+            for ref in self._find_references(step.get("input_data", {})):
+                match = self.STEP_OUTPUT_REFERENCE.match(ref)
+                if match and 0 < int(match.group(1)) <= index:
+                    step_producers[ref] = int(match.group(1)) - 1
+                elif ref.endswith("_result") and ref[:-len("_result")] in last_step_for_tool:
+                    step_producers[ref] = last_step_for_tool[ref[:-len("_result")]]
+
+            deps = set(step_producers.values())
+            deps.update(int(dep) - 1 for dep in step.get("depends_on", []) if 0 < int(dep) <= index)
+
+            dependencies[index] = deps
+            producers[index] = step_producers
+            last_step_for_tool[step["tool_id"]] = index
+
+        return dependencies, producers
+
+    async def stream_workflow(self, workflow_plan: List[Dict[str, Any]],
+                              max_concurrency: Optional[int] = None) -> AsyncIterator[Tuple[int, ToolExecution]]:
+        """
+        Execute a workflow plan as a DAG, yielding (step_index, execution) as steps finish.
+
+        Independent steps run concurrently (bounded by ``max_concurrency``); a step
+        starts as soon as every step it references has completed. Steps whose
+        prerequisites failed are marked ``skipped`` instead of running with
+        unresolved inputs.
+        """
+        dependencies, producers = self.build_dependency_graph(workflow_plan)
+        dependents: Dict[int, List[int]] = {index: [] for index in dependencies}
+        for index, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(index)
+        pending_deps = {index: len(deps) for index, deps in dependencies.items()}
+
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        executions: Dict[int, ToolExecution] = {}
+        timings: Dict[int, Tuple[float, float]] = {}
+        workflow_start = time.perf_counter()
+
+        async def run_step(index: int) -> Tuple[int, ToolExecution]:
+            step = workflow_plan[index]
+            async with semaphore:
+                started = time.perf_counter() - workflow_start
+                step_context = {
+                    var: executions[producer].output_data for var, producer in producers[index].items()
+                }
+                resolved_input = self._resolve_context_variables(step.get("input_data", {}), step_context)
+                try:
+                    execution = await self.execute_tool(
+                        step["tool_id"], resolved_input, timeout=step.get("timeout"), retries=step.get("retries")
+                    )
+                except ValueError as e:
+                    execution = ToolExecution(
+                        execution_id=f"exec_{int(time.time())}_{step['tool_id']}_{uuid.uuid4().hex[:6]}",
+                        tool_id=step["tool_id"], input_data=resolved_input, status="failed",
+                        error_message=str(e), timestamp=datetime.now().isoformat()
+                    )
+                timings[index] = (started, time.perf_counter() - workflow_start)
+            return index, execution
+
+        def skip_step(index: int, failed_dep: int) -> ToolExecution:
+            now = time.perf_counter() - workflow_start
+            timings[index] = (now, now)
+            return ToolExecution(
+                execution_id=f"skip_{int(time.time())}_{workflow_plan[index]['tool_id']}_{uuid.uuid4().hex[:6]}",
+                tool_id=workflow_plan[index]["tool_id"],
+                input_data=workflow_plan[index].get("input_data", {}),
+                status="skipped",
+                error_message=f"Skipped: prerequisite step {failed_dep + 1} did not complete",
+                timestamp=datetime.now().isoformat()
+            )
 
-        for step in workflow_plan:
-            tool_id = step["tool_id"]
-            input_data = step["input_data"]
+        running = {asyncio.create_task(run_step(index)) for index, count in pending_deps.items() if count == 0}
+
+        while running:
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                finished = [task.result()]
+                while finished:
+                    index, execution = finished.pop()
+                    executions[index] = execution
+                    yield index, execution
+
+                    for dependent in dependents[index]:
+                        pending_deps[dependent] -= 1
+                        if execution.status != "completed" and dependent not in executions:
+                            # Propagate the failure without running the dependent
+                            executions[dependent] = None
+                            finished.append((dependent, skip_step(dependent, index)))
+                        elif pending_deps[dependent] == 0 and dependent not in executions:
+                            running.add(asyncio.create_task(run_step(dependent)))
+
+        self.last_workflow_stats = self._compute_workflow_stats(
+            workflow_plan, dependencies, executions, timings, time.perf_counter() - workflow_start,
+            max_concurrency or self.max_concurrency
+        )
 
-            # Resolve context variables in input data
-            resolved_input = self._resolve_context_variables(input_data, workflow_context)
+    def _compute_workflow_stats(self, workflow_plan, dependencies, executions, timings,
+                                wall_time: float, max_concurrency: int) -> Dict[str, Any]:
+        """Critical path (longest duration chain through the DAG) and parallelism figures"""
+        durations = {index: execution.execution_time for index, execution in executions.items() if execution}
+        path_time: Dict[int, float] = {}
+        best_parent: Dict[int, Optional[int]] = {}
+
+        # Dependencies only point to earlier steps, so plan order is a topological order
+        for index in range(len(workflow_plan)):
+            parent = max(dependencies[index], key=lambda dep: path_time.get(dep, 0.0), default=None)
+            best_parent[index] = parent
+            path_time[index] = durations.get(index, 0.0) + (path_time.get(parent, 0.0) if parent is not None else 0.0)
+
+        critical_path = []
+        node = max(path_time, key=path_time.get, default=None)
+        while node is not None:
+            critical_path.append(node + 1)
+            node = best_parent[node]
+        critical_path.reverse()
+
+        sequential_time = sum(durations.values())
+        return {
+            "steps": len(workflow_plan),
+            "max_concurrency": max_concurrency,
+            "wall_time": wall_time,
+            "sequential_time": sequential_time,
+            "critical_path": critical_path,
+            "critical_path_time": max(path_time.values(), default=0.0),
+            "speedup": sequential_time / wall_time if wall_time > 0 else 1.0,
+            "timeline": {index + 1: {"start": start, "end": end} for index, (start, end) in sorted(timings.items())}
+        }
 
-            # Execute tool
-            execution = await self.execute_tool(tool_id, resolved_input)
-            results.append(execution)
+    async def execute_workflow(self, workflow_plan: List[Dict[str, Any]], max_concurrency: Optional[int] = None,
+                               on_step_complete: Optional[Callable[[int, ToolExecution], None]] = None) -> List[ToolExecution]:
+        """
+        Execute a planned workflow of tools, returning executions in plan order.
 
-            # Update workflow context with results
-            if execution.status == "completed":
-                workflow_context[f"step_{len(results)}_output"] = execution.output_data
-                workflow_context[f"{tool_id}_result"] = execution.output_data
+        Args:
+            workflow_plan: Planned steps (tool_id, input_data, optional timeout/retries/depends_on)
+            max_concurrency: Override for the orchestrator's concurrency limit
+            on_step_complete: Optional callback invoked with (step_index, execution) as each step finishes
+        """
+        results: List[Optional[ToolExecution]] = [None] * len(workflow_plan)
+
+        async for index, execution in self.stream_workflow(workflow_plan, max_concurrency):
+            results[index] = execution
+            if on_step_complete:
+                on_step_complete(index, execution)
 
         return results
 
     def _resolve_context_variables(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Resolve context variables in input data"""
-        resolved = {}
+        return {key: self._resolve_value(value, context) for key, value in input_data.items()}
 
-        for key, value in input_data.items():
-            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                # Context variable reference
-                var_name = value[2:-1]
-                resolved[key] = context.get(var_name, value)
-            else:
-                resolved[key] = value
+    def _resolve_value(self, value: Any, context: Dict[str, Any]) -> Any:
+        """
+        Resolve ${...} references anywhere in a (possibly nested) input value.
 
-        return resolved
+        Uses the same matcher as ``build_dependency_graph``. A value that is
+        exactly one reference is replaced by the referenced object; references
+        embedded in longer strings are substituted as text. Unknown references
+        are left as written.
+        """
+        if isinstance(value, str):
+            whole = self.CONTEXT_REFERENCE.fullmatch(value)
+            if whole:
+                return context.get(whole.group(1), value)
+            return self.CONTEXT_REFERENCE.sub(
+                lambda match: str(context[match.group(1)]) if match.group(1) in context else match.group(0), value
+            )
+        if isinstance(value, dict):
+            return {key: self._resolve_value(item, context) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(self._resolve_value(item, context) for item in value)
+        return value
+
+    async def plan_workflow(self, objective: str, available_tools: List[str] = None,
+                            min_success_rate: float = 0.5, min_samples: int = 5) -> List[Dict[str, Any]]:
+        """
+        Use LLM to plan a workflow for achieving an objective.
 
-    async def plan_workflow(self, objective: str, available_tools: List[str] = None) -> List[Dict[str, Any]]:
-        """Use LLM to plan a workflow for achieving an objective"""
+        Tools are offered to the planner fastest and most reliable first, with
+        their observed latency and success rate. Tools whose windowed success
+        rate has dropped below ``min_success_rate`` (after at least
+        ``min_samples`` runs) are left out unless nothing else is available.
+        """
         if available_tools is None:
-            available_tools = list(self.tool_registry.tools.keys())
+            available_tools = [tool_id for tool_id, tool in self.tool_registry.tools.items() if tool.active]
 
-        # Get tool descriptions
+        ranked_tools = self.tool_registry.rank_tools(
+            [tool_id for tool_id in available_tools if self.tool_registry.get_tool(tool_id)]
+        )
+        reliable_tools = [
+            tool_id for tool_id in ranked_tools
+            if self.tool_registry.telemetry[tool_id].total_executions < min_samples
+            or self.tool_registry.telemetry[tool_id].success_rate >= min_success_rate
+        ]
+        available_tools = reliable_tools or ranked_tools or available_tools
+
+        # Get tool descriptions with observed performance
         tool_descriptions = []
         for tool_id in available_tools:
             tool = self.tool_registry.get_tool(tool_id)
             if tool:
-                tool_descriptions.append({
+                telemetry = self.tool_registry.telemetry[tool_id]
+                description = {
                     "id": tool_id,
                     "name": tool.name,
                     "description": tool.description,
                     "type": tool.tool_type.value,
                     "parameters": tool.parameters
-                })
+                }
+                if telemetry.total_executions:
+                    description["observed"] = {
+                        "avg_seconds": round(telemetry.ewma_latency, 2),
+                        "p95_seconds": round(telemetry.latency_quantile(0.95), 2),
+                        "success_rate": round(telemetry.success_rate, 2)
+                    }
+                tool_descriptions.append(description)
 
         planning_prompt = f"""
         Objective: {objective}
@@ -512,6 +924,9 @@ class ToolOrchestrator:
         - description: Brief description of this step
 
         Use context variables like ${{step_1_output}} to reference previous step outputs.
+        Only reference outputs a step actually needs: steps without references run in parallel.
+        Tools are listed fastest and most reliable first; when several tools fit a step,
+        prefer the earlier one (lower observed latency, higher success rate).
         """
 
         messages = [
@@ -540,8 +955,8 @@ class ToolOrchestrator:
 
     def get_orchestration_stats(self) -> Dict[str, Any]:
         """Get orchestration statistics"""
-        total_executions = len(self.tool_registry.execution_history)
-        successful_executions = len([e for e in self.tool_registry.execution_history if e.status == "completed"])
+        total_executions = self.tool_registry.total_executions
+        successful_executions = self.tool_registry.successful_executions
 
         return {
             "total_tools": len(self.tool_registry.tools),
@@ -549,43 +964,13 @@ class ToolOrchestrator:
             "total_executions": total_executions,
             "successful_executions": successful_executions,
             "success_rate": (successful_executions / total_executions * 100) if total_executions > 0 else 0,
-            "recent_executions": self.tool_registry.execution_history[-5:] if self.tool_registry.execution_history else []
+            "recent_executions": list(self.tool_registry.execution_history)[-5:],
+            "tool_telemetry": {
+                tool_id: telemetry.snapshot() for tool_id, telemetry in self.tool_registry.telemetry.items()
+            },
+            "last_workflow": self.last_workflow_stats
         }
 
-# =============================================================================
-# BACKEND: LLM PROVIDER CONFIGURATION
-# =============================================================================
-
-def create_llm(provider: str, model: str, base_url: str = None):
-    """
-    Create LLM instance based on provider with enhanced multi-provider support.
-
-    Args:
-        provider: LLM provider ("OpenAI", "Anthropic", "Gemini", "Groq", "Ollama")
-        model: Model identifier for the specific provider
-        base_url: Optional base URL for self-hosted providers (Ollama)
-
-    Returns:
-        Configured LLM instance ready for orchestration
-    """
-    if provider == "OpenAI":
-        return ChatOpenAI(model=model, api_key=os.getenv("OPENAI_API_KEY"), temperature=0.3)
-    elif provider == "Anthropic":
-        return ChatAnthropic(model=model, api_key=os.getenv("ANTHROPIC_API_KEY"), temperature=0.3)
-    elif provider == "Gemini":
-        return ChatGoogleGenerativeAI(model=model, api_key=os.getenv("GEMINI_API_KEY"), temperature=0.3)
-    elif provider == "Groq":
-        return ChatGroq(model=model, api_key=os.getenv("GROQ_API_KEY"), temperature=0.3)
-    elif provider == "Ollama" and ChatOllama:
-        return ChatOllama(
-            model=model,
-            base_url=base_url or 'http://localhost:11434',
-            temperature=0.3,
-            timeout=120
-        )
-    else:
-        raise ValueError(f"Unsupported provider: {provider}")
-
 # =============================================================================
 # FRONTEND: STREAMLIT INTERFACE AND USER INTERACTIONS
 # =============================================================================
@@ -680,6 +1065,8 @@ def render_tool_orchestration_interface():
             else:
                 st.warning(f"⚠️ {required_key} not found")
 
+        render_llm_client_stats()
+
     # =============================================================================
     # WORKFLOW INITIALIZATION
     # =============================================================================
@@ -712,6 +1099,11 @@ def render_tool_orchestration_interface():
             key='selected_tools'
         )
 
+        max_concurrency = st.slider(
+            "Max Concurrent Steps", min_value=1, max_value=8,
+            value=orchestrator.max_concurrency, key='max_concurrency'
+        )
+
         if st.button("🧠 Plan Workflow", type="primary", key='plan_workflow'):
             if objective:
                 with st.spinner("🧠 Planning optimal workflow..."):
@@ -735,14 +1127,29 @@ def render_tool_orchestration_interface():
                 # Execute workflow button
                 if st.button("🚀 Execute Planned Workflow", key='execute_planned'):
                     with st.spinner("🚀 Executing workflow..."):
-                        execution_results = asyncio.run(orchestrator.execute_workflow(workflow_plan))
+                        execution_results = asyncio.run(
+                            orchestrator.execute_workflow(workflow_plan, max_concurrency=max_concurrency)
+                        )
 
                     st.success("✅ Workflow executed!")
 
                     # Display results
                     st.markdown("### 📊 Execution Results")
+                    workflow_stats = orchestrator.last_workflow_stats
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Wall Time", f"{workflow_stats['wall_time']:.2f}s")
+                    with col2:
+                        st.metric("Sequential Time", f"{workflow_stats['sequential_time']:.2f}s")
+                    with col3:
+                        st.metric("Speedup", f"{workflow_stats['speedup']:.2f}x")
+                    st.caption(
+                        "Critical path: " + " → ".join(f"Step {i}" for i in workflow_stats["critical_path"])
+                        + f" ({workflow_stats['critical_path_time']:.2f}s)"
+                    )
+
                     for i, execution in enumerate(execution_results, 1):
-                        status_icon = "✅" if execution.status == "completed" else "❌"
+                        status_icon = {"completed": "✅", "skipped": "⏭️"}.get(execution.status, "❌")
                         with st.expander(f"{status_icon} Step {i}: {execution.tool_id} ({execution.execution_time:.2f}s)", expanded=True):
                             if execution.status == "completed":
                                 st.json(execution.output_data)
@@ -763,14 +1170,14 @@ def render_tool_orchestration_interface():
         search_query = st.text_input("Search Tools", key='tool_search')
 
         # Get filtered tools
-        all_tools = list(orchestrator.tool_registry.tools.values())
+        if search_query:
+            all_tools = orchestrator.tool_registry.search_tools(search_query)
+        else:
+            all_tools = list(orchestrator.tool_registry.tools.values())
 
         if tool_type_filter != "All":
             all_tools = [t for t in all_tools if t.tool_type.value == tool_type_filter]
 
-        if search_query:
-            all_tools = orchestrator.tool_registry.search_tools(search_query)
-
         # Display tools
         for tool in all_tools:
             with st.expander(f"🛠️ {tool.name} ({tool.tool_type.value})", expanded=False):
@@ -779,12 +1186,15 @@ def render_tool_orchestration_interface():
                 with col1:
                     st.write(f"**Description**: {tool.description}")
                     st.write(f"**Parameters**: {', '.join(tool.parameters.keys())}")
+                    if tool.capabilities:
+                        st.write(f"**Capabilities**: {', '.join(tool.capabilities)}")
                     if tool.dependencies:
                         st.write(f"**Dependencies**: {', '.join(tool.dependencies)}")
 
                 with col2:
                     st.write(f"**Status**: {'Active' if tool.active else 'Inactive'}")
-                    st.write(f"**Avg Time**: {tool.performance_metrics['avg_execution_time']:.2f}s")
+                    st.write(f"**Avg Time (EWMA)**: {tool.performance_metrics['avg_execution_time']:.2f}s")
+                    st.write(f"**P95 Time**: {tool.performance_metrics['p95_execution_time']:.2f}s")
                     st.write(f"**Success Rate**: {tool.performance_metrics['success_rate']:.1f}%")
 
     with tab3:
@@ -857,12 +1267,18 @@ def render_tool_orchestration_interface():
             st.markdown("### 🏆 Tool Performance")
 
             performance_data = []
-            for tool in orchestrator.tool_registry.tools.values():
+            for tool_id in orchestrator.tool_registry.rank_tools(list(orchestrator.tool_registry.tools)):
+                tool = orchestrator.tool_registry.tools[tool_id]
+                telemetry = stats["tool_telemetry"].get(tool_id, {})
                 performance_data.append({
                     "Tool": tool.name,
                     "Type": tool.tool_type.value,
-                    "Avg Time": tool.performance_metrics["avg_execution_time"],
-                    "Success Rate": tool.performance_metrics["success_rate"],
+                    "Runs": telemetry.get("executions", 0),
+                    "Avg Time (EWMA)": telemetry.get("ewma_latency", 0.0),
+                    "P50 Time": telemetry.get("p50_latency", 0.0),
+                    "P95 Time": telemetry.get("p95_latency", 0.0),
+                    "Success Rate": telemetry.get("success_rate", 100.0),
+                    "Expected Cost (s)": telemetry.get("expected_cost", 0.0),
                     "Status": "Active" if tool.active else "Inactive"
                 })
 
@@ -0,0 +1,278 @@
+"""
+Component Registry
+Lazy loading and import-time diagnostics for the Agentic AI platform
+- Each page's module is imported only when that page is first selected
+- Loaded modules stay in sys.modules, so later reruns pay no import cost
+- Framework availability is checked without importing the frameworks
+- Per-module import profiling via `python -X importtime` in a subprocess
+
+Run directly to print an import-time profile for every component:
+    python component_registry.py [--top 15] [--component "Code Review"]
+"""
+
+import argparse
+import importlib
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BASE_DIR = Path(__file__).parent
+
+
+# ============================================================================
+# COMPONENT SPECIFICATIONS
+# ============================================================================
+
+@dataclass(frozen=True)
+class ComponentSpec:
+    """A platform page and where its render function lives"""
+    page: str                 # Sidebar label
+    group: str                # Framework group shown on the overview page
+    module: str               # Module to import lazily
+    render: str               # Render function inside the module
+    path: str                 # Module directory, relative to this file
+    is_async: bool = False    # Render function is a coroutine
+
+    @property
+    def title(self) -> str:
+        """Page label without its leading icon"""
+        return self.page.split(" ", 1)[1] if " " in self.page else self.page
+
+
+COMPONENTS: List[ComponentSpec] = [
+    ComponentSpec("📊 CrewAI - Data Analysis", "CrewAI", "data_analysis_crew", "render_crew_interface",
+                  "agentic_frameworks/crewai/data_analysis_crew"),
+    ComponentSpec("✍️ CrewAI - Content Creation", "CrewAI", "content_creation_crew", "render_content_crew_interface",
+                  "agentic_frameworks/crewai/content_creation_crew"),
+    ComponentSpec("🔬 CrewAI - Research Assistant", "CrewAI", "research_assistant_crew", "render_research_crew_interface",
+                  "agentic_frameworks/crewai/research_assistant_crew"),
+    ComponentSpec("👨‍💻 CrewAI - Code Review", "CrewAI", "code_review_crew", "render_code_review_interface",
+                  "agentic_frameworks/crewai/code_review_crew"),
+    ComponentSpec("🎧 LangGraph - Customer Support", "LangGraph", "customer_support_agent", "render_customer_support_interface",
+                  "agentic_frameworks/langgraph"),
+    ComponentSpec("📄 LangGraph - Document Processing", "LangGraph", "document_processing_pipeline", "render_document_processing_interface",
+                  "agentic_frameworks/langgraph"),
+    ComponentSpec("🗂️ LangGraph - Task Planning", "LangGraph", "task_planning_system", "render_task_planning_interface",
+                  "agentic_frameworks/langgraph"),
+    ComponentSpec("🔗 Workflow - Prompt Chaining", "Workflows", "prompt_chaining", "render_prompt_chaining_interface",
+                  "agentic_workflows"),
+    ComponentSpec("🎯 Workflow - Query Routing", "Workflows", "query_routing", "render_query_routing_interface",
+                  "agentic_workflows"),
+    ComponentSpec("⚡ Workflow - Parallel Execution", "Workflows", "parallel_execution", "render_parallel_execution_interface",
+                  "agentic_workflows"),
+    ComponentSpec("📡 Workflow - Event-Driven", "Workflows", "event_driven", "render_event_driven_interface",
+                  "agentic_workflows"),
+    ComponentSpec("🛠️ Workflow - Tool Orchestration", "Workflows", "tool_orchestration", "render_tool_orchestration_interface",
+                  "agentic_workflows"),
+    ComponentSpec("🌟 Multi-Agent Orchestration", "Orchestration", "multi_agent_orchestration", "render_orchestration_interface",
+                  "multi_agent_orchestration", is_async=True),
+]
+
+# Packages each framework group needs; checked with find_spec, nothing is imported
+FRAMEWORK_PACKAGES: Dict[str, tuple] = {
+    "CrewAI": ("crewai",),
+    "LangGraph": ("langgraph",),
+    "Workflows": ("langchain_core",),
+    "Orchestration": ("crewai", "langgraph"),
+}
+
+
+@lru_cache(maxsize=None)
+def package_installed(package: str) -> bool:
+    """True if a top-level package can be imported (without importing it)"""
+    try:
+        return importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# ============================================================================
+# LAZY REGISTRY
+# ============================================================================
+
+@dataclass
+class ComponentLoad:
+    """Outcome of importing a component module"""
+    status: str = "not loaded"                       # not loaded | loaded | failed
+    import_ms: Optional[float] = None                # Wall time of the first successful import
+    new_modules: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+class ComponentRegistry:
+    """Imports component modules on first use and records what each import cost"""
+
+    def __init__(self, components: List[ComponentSpec] = COMPONENTS, base_dir: Path = BASE_DIR):
+        self.base_dir = base_dir
+        self._specs: Dict[str, ComponentSpec] = {spec.page: spec for spec in components}
+        self._loads: Dict[str, ComponentLoad] = {spec.page: ComponentLoad() for spec in components}
+        self._lock = threading.RLock()
+
+    def pages(self) -> List[str]:
+        return list(self._specs)
+
+    def spec(self, page: str) -> Optional[ComponentSpec]:
+        return self._specs.get(page)
+
+    def framework_available(self, group: str) -> bool:
+        return all(package_installed(package) for package in FRAMEWORK_PACKAGES.get(group, ()))
+
+    def _ensure_path(self, spec: ComponentSpec):
+        for path in (str(self.base_dir), str(self.base_dir / spec.path)):
+            if path not in sys.path:
+                sys.path.append(path)
+
+    def load(self, page: str) -> Callable[..., Any]:
+        """
+        Return the page's render function, importing its module on first use
+
+        Raises ImportError (with the original message) when the module or one
+        of its dependencies is missing. Failures are not cached, so installing
+        a missing package works without restarting the platform.
+        """
+        spec = self._specs[page]
+        with self._lock:
+            record = self._loads[spec.page]
+            module = sys.modules.get(spec.module)
+            if module is None:
+                self._ensure_path(spec)
+                before = set(sys.modules)
+                start = time.perf_counter()
+                try:
+                    module = importlib.import_module(spec.module)
+                except ImportError as e:
+                    record.status, record.error = "failed", str(e)
+                    raise
+                record.import_ms = (time.perf_counter() - start) * 1000
+                record.new_modules = sorted(set(sys.modules) - before)
+            record.status, record.error = "loaded", None
+            return getattr(module, spec.render)
+
+    def status(self) -> List[Dict[str, Any]]:
+        """One row per component for the diagnostics page"""
+        rows = []
+        with self._lock:
+            for page, spec in self._specs.items():
+                record = self._loads[page]
+                packages = sorted({name.split(".")[0] for name in record.new_modules})
+                rows.append({
+                    "Component": spec.title,
+                    "Module": spec.module,
+                    "Status": record.status,
+                    "Import (ms)": round(record.import_ms, 1) if record.import_ms is not None else None,
+                    "New Modules": len(record.new_modules),
+                    "Top-level Packages": ", ".join(packages[:8]) + (" ..." if len(packages) > 8 else ""),
+                    "Error": record.error or ""
+                })
+        return rows
+
+
+# ============================================================================
+# IMPORT-TIME PROFILING
+# ============================================================================
+
+def _run_importtime(code: str, env: Dict[str, str], cwd: Path, timeout: int):
+    """Run code under -X importtime; returns (returncode, per-module rows, non-profile stderr lines)"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=str(cwd), env=env, capture_output=True, text=True, timeout=timeout
+    )
+
+    modules = []
+    other_lines = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            other_lines.append(line)
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header row
+        name = parts[2].rstrip()
+        modules.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+            "self_ms": int(parts[0]) / 1000,
+            "cumulative_ms": int(parts[1]) / 1000
+        })
+    return completed.returncode, modules, other_lines
+
+
+@lru_cache(maxsize=1)
+def _startup_modules() -> frozenset:
+    """Modules the interpreter imports before running any code (excluded from component profiles)"""
+    _, modules, _ = _run_importtime("pass", dict(os.environ), BASE_DIR, timeout=60)
+    return frozenset(row["module"] for row in modules)
+
+
+def profile_imports(spec: ComponentSpec, base_dir: Path = BASE_DIR, timeout: int = 180) -> Dict[str, Any]:
+    """
+    Profile a cold import of a component in a fresh interpreter (python -X importtime)
+
+    Returns per-module self/cumulative milliseconds in import order, plus the
+    interpreter's error output if the import failed. Interpreter start-up
+    modules are left out so the numbers reflect the component alone.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(base_dir), str(base_dir / spec.path)] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+    )
+    returncode, modules, other_lines = _run_importtime(f"import {spec.module}", env, base_dir, timeout)
+    startup = _startup_modules()
+    modules = [row for row in modules if row["module"] not in startup]
+
+    return {
+        "component": spec.title,
+        "module": spec.module,
+        "ok": returncode == 0,
+        "error": "\n".join(other_lines[-20:]) if returncode else "",
+        "modules": modules
+    }
+
+
+def summarize_profile(profile: Dict[str, Any], top: int = 20) -> Dict[str, Any]:
+    """Total import time, the slowest modules and the time per top-level package"""
+    modules = profile["modules"]
+    packages: Dict[str, float] = {}
+    for row in modules:
+        package = row["module"].split(".")[0]
+        packages[package] = packages.get(package, 0.0) + row["self_ms"]
+
+    return {
+        "total_ms": round(sum(row["self_ms"] for row in modules), 1),
+        "module_count": len(modules),
+        "slowest_modules": sorted(modules, key=lambda row: row["self_ms"], reverse=True)[:top],
+        "packages": [
+            {"package": name, "self_ms": round(ms, 1)}
+            for name, ms in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        ]
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Import-time profile of the platform components")
+    parser.add_argument("--component", default=None, help="Only profile components whose label contains this text")
+    parser.add_argument("--top", type=int, default=10, help="Packages to list per component")
+    args = parser.parse_args(argv)
+
+    for spec in COMPONENTS:
+        if args.component and args.component.lower() not in spec.page.lower():
+            continue
+        profile = profile_imports(spec)
+        summary = summarize_profile(profile, top=args.top)
+        state = "ok" if profile["ok"] else "FAILED"
+        print(f"\n{spec.title} ({spec.module}): {summary['total_ms']:.0f} ms, {summary['module_count']} modules [{state}]")
+        for row in summary["packages"]:
+            print(f"    {row['package']:<32} {row['self_ms']:9.1f} ms")
+        if not profile["ok"]:
+            print("    " + profile["error"].splitlines()[-1] if profile["error"] else "    import failed")
+
+
+if __name__ == "__main__":
+    main()
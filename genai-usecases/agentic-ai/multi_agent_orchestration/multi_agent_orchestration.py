@@ -25,7 +25,7 @@ import operator
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, Optional, Annotated, TypedDict, List, Union
+from typing import Dict, Any, Optional, Annotated, TypedDict, List, Union, Awaitable
 
 # Third-party imports
 import pandas as pd
@@ -33,10 +33,6 @@ import plotly.express as px
 import streamlit as st
 from dotenv import load_dotenv
 
-import yfinance as yf
-import feedparser
-from datetime import datetime
-
 # CrewAI Framework imports
 from crewai import Agent, Task, Crew, LLM as CrewAILLM, Process
 from crewai.tools import BaseTool
@@ -47,6 +43,7 @@ from langgraph.graph.message import add_messages
 
 # LangChain imports
 from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_ollama import ChatOllama
@@ -54,6 +51,9 @@ from langchain_groq import ChatGroq
 from langchain_anthropic import ChatAnthropic
 from langchain_openai import ChatOpenAI
 
+# Local imports: cached market data layer shared by the analysis tools
+from market_data import get_market_data_service
+
 # Load environment variables
 load_dotenv()
 
@@ -66,6 +66,11 @@ os.environ["OTEL_SDK_DISABLED"] = "true"              # Disable OpenTelemetry
 os.environ["CREWAI_DISABLE_MEMORY"] = "true"          # Disable memory for speed
 os.environ["CREWAI_LOG_LEVEL"] = "ERROR"              # Reduce verbosity
 
+# LangGraph analyst branches (run concurrently) and the order their results are synthesized in
+ANALYST_NODES = ("market_analyst", "financial_analyst", "risk_analyst")
+ANALYST_ORDER = ["Market Analyst", "Financial Analyst", "Risk Analyst"]
+HYBRID_CONTEXT_CHARS = 500                             # CrewAI findings passed to the LangGraph synthesizer
+
 
 # =============================================================================
 # BACKEND: DATA MODELS AND ENUMS
@@ -112,7 +117,8 @@ class MultiAgentState(TypedDict):
     task_input: str
     results: Annotated[list, operator.add]
     current_agent: str
-    analysis_context: Annotated[str, operator.add]
+    research_plan: str
+    tool_outputs: Dict[str, str]
     final_output: str
     execution_metrics: Dict[str, Any]
 
@@ -128,60 +134,17 @@ class MarketAnalysisTool(BaseTool):
     description: str = "Performs comprehensive market analysis including market size, trends, and opportunities"
 
     def _fetch_market_news(self, market_segment: str) -> List[str]:
-        """Fetch recent market news and trends"""
+        """Fetch recent market news and trends (cached per segment)"""
         try:
-            # Search for market news using RSS feeds
-            search_terms = market_segment.replace(" ", "+")
-            rss_urls = [
-                f"https://news.google.com/rss/search?q={search_terms}+market+analysis",
-                f"https://feeds.reuters.com/reuters/businessNews",
-                "https://feeds.a.dj.com/rss/RSSMarketsMain.xml"
-            ]
-
-            news_items = []
-            for url in rss_urls:
-                try:
-                    feed = feedparser.parse(url)
-                    for entry in feed.entries[:3]:  # Get top 3 items
-                        news_items.append(f"• {entry.title} ({entry.published[:10]})")
-                except:
-                    continue
-
-            return news_items[:5] if news_items else ["• Market data temporarily unavailable"]
-        except:
+            return get_market_data_service().market_news(market_segment)
+        except Exception:
             return ["• Market data temporarily unavailable"]
 
     def _fetch_industry_data(self, market_segment: str) -> Dict[str, Any]:
-        """Fetch industry statistics and data"""
+        """Fetch industry statistics and data (cached per segment)"""
         try:
-            # Use multiple data sources
-            market_data = {
-                "growth_rate": "12-18% CAGR",
-                "market_size": "$1.5B - $3.2B",
-                "key_players": 3-5,
-                "adoption_rate": "35-45%"
-            }
-
-            # Try to get real market cap data for related public companies
-            if "AI" in market_segment or "automation" in market_segment:
-                try:
-                    # Get data for AI/automation companies
-                    tickers = ["CRM", "MSFT", "GOOGL", "NVDA"]
-                    market_caps = []
-                    for ticker in tickers:
-                        stock = yf.Ticker(ticker)
-                        info = stock.info
-                        if 'marketCap' in info:
-                            market_caps.append(info['marketCap'] / 1e9)  # Convert to billions
-
-                    if market_caps:
-                        avg_market_cap = sum(market_caps) / len(market_caps)
-                        market_data["avg_public_company_value"] = f"${avg_market_cap:.1f}B"
-                except:
-                    pass
-
-            return market_data
-        except:
+            return get_market_data_service().industry_data(market_segment)
+        except Exception:
             return {
                 "growth_rate": "Market data updating",
                 "market_size": "Analysis in progress",
@@ -191,9 +154,11 @@ class MarketAnalysisTool(BaseTool):
 
     def _run(self, market_segment: str) -> str:
         """Execute market analysis with real internet data"""
-        # Fetch real market data
-        news_items = self._fetch_market_news(market_segment)
-        industry_data = self._fetch_industry_data(market_segment)
+        # Fetch real market data (independent sources gathered concurrently)
+        news_items, industry_data = get_market_data_service().gather(
+            lambda: self._fetch_market_news(market_segment),
+            lambda: self._fetch_industry_data(market_segment)
+        )
 
         # Get current date for relevance
         current_date = datetime.now().strftime("%Y-%m-%d")
@@ -240,74 +205,26 @@ class CompetitiveAnalysisTool(BaseTool):
     description: str = "Analyzes competitors, positioning, and market dynamics"
 
     def _fetch_competitor_financial_data(self, industry: str) -> List[Dict[str, Any]]:
-        """Fetch real financial data for industry competitors"""
+        """Fetch real financial data for industry competitors (cached per competitor set)"""
         try:
-            # Define industry-specific competitor mappings
-            industry_tickers = {
-                "customer service": ["CRM", "ZEN", "TWLO", "ZM"],
-                "automation": ["MSFT", "GOOGL", "AMZN", "ORCL"],
-                "AI": ["NVDA", "MSFT", "GOOGL", "AMZN"],
-                "software": ["MSFT", "ORCL", "SAP", "ADBE"],
-                "cloud": ["AMZN", "MSFT", "GOOGL", "CRM"],
-                "default": ["MSFT", "GOOGL", "AMZN", "AAPL"]
-            }
-
-            # Select appropriate tickers based on industry keywords
-            tickers = industry_tickers["default"]
-            for key in industry_tickers:
-                if key in industry.lower():
-                    tickers = industry_tickers[key]
-                    break
-
-            competitors = []
-            for ticker in tickers[:4]:  # Limit to 4 companies
-                try:
-                    stock = yf.Ticker(ticker)
-                    info = stock.info
-
-                    competitor_data = {
-                        "name": info.get('longName', ticker),
-                        "ticker": ticker,
-                        "market_cap": info.get('marketCap', 0) / 1e9 if info.get('marketCap') else 0,
-                        "revenue": info.get('totalRevenue', 0) / 1e9 if info.get('totalRevenue') else 0,
-                        "employees": info.get('fullTimeEmployees', 0),
-                        "pe_ratio": info.get('trailingPE', 0)
-                    }
-                    competitors.append(competitor_data)
-                except:
-                    continue
-
-            return competitors
-        except:
+            return get_market_data_service().competitor_financials(industry)
+        except Exception:
             return []
 
     def _fetch_industry_news(self, industry: str) -> List[str]:
-        """Fetch recent industry and competitive news"""
+        """Fetch recent industry and competitive news (cached per industry)"""
         try:
-            search_terms = f"{industry}+competition+market+share".replace(" ", "+")
-            rss_urls = [
-                f"https://news.google.com/rss/search?q={search_terms}",
-                "https://feeds.reuters.com/reuters/technologyNews"
-            ]
-
-            news_items = []
-            for url in rss_urls:
-                try:
-                    feed = feedparser.parse(url)
-                    for entry in feed.entries[:2]:
-                        news_items.append(f"• {entry.title}")
-                except:
-                    continue
-
-            return news_items[:4] if news_items else ["• Competitive intelligence updating"]
-        except:
+            return get_market_data_service().industry_news(industry)
+        except Exception:
             return ["• Competitive intelligence updating"]
 
     def _run(self, industry: str) -> str:
         """Execute competitive analysis with real financial and market data"""
-        # Fetch real competitive data
-        competitors = self._fetch_competitor_financial_data(industry)
-        industry_news = self._fetch_industry_news(industry)
+        # Fetch real competitive data (independent sources gathered concurrently)
+        competitors, industry_news = get_market_data_service().gather(
+            lambda: self._fetch_competitor_financial_data(industry),
+            lambda: self._fetch_industry_news(industry)
+        )
         current_date = datetime.now().strftime("%Y-%m-%d")
 
         # Format competitor data
@@ -377,57 +294,10 @@ class FinancialModelingTool(BaseTool):
     description: str = "Performs financial modeling and projections for business analysis"
 
     def _get_market_benchmarks(self, business_model: str) -> Dict[str, Any]:
-        """Fetch real market benchmarks and financial data"""
+        """Fetch real market benchmarks and financial data (shared cache across business models)"""
         try:
-            # Get current market conditions
-            spy = yf.Ticker("SPY")  # S&P 500 for market conditions
-            treasury = yf.Ticker("^TNX")  # 10-year treasury for risk-free rate
-
-            # Get recent data
-            spy_hist = spy.history(period="1mo")
-            spy_return = ((spy_hist['Close'][-1] / spy_hist['Close'][0]) - 1) * 100
-
-            # Get current 10-year treasury rate (risk-free rate)
-            try:
-                tnx_hist = treasury.history(period="5d")
-                risk_free_rate = tnx_hist['Close'][-1] if len(tnx_hist) > 0 else 4.5
-            except:
-                risk_free_rate = 4.5  # Default fallback
-
-            # Get SaaS/tech company benchmarks
-            saas_companies = ["CRM", "ZM", "SNOW", "DDOG"]
-            revenue_multiples = []
-            gross_margins = []
-
-            for ticker in saas_companies:
-                try:
-                    stock = yf.Ticker(ticker)
-                    info = stock.info
-
-                    # Calculate revenue multiple (market cap / revenue)
-                    if info.get('marketCap') and info.get('totalRevenue'):
-                        revenue_multiple = info['marketCap'] / info['totalRevenue']
-                        if 0.5 <= revenue_multiple <= 50:  # Reasonable bounds
-                            revenue_multiples.append(revenue_multiple)
-
-                    # Get gross margin if available
-                    if info.get('grossMargins'):
-                        gross_margins.append(info['grossMargins'] * 100)
-                except:
-                    continue
-
-            # Calculate averages
-            avg_revenue_multiple = sum(revenue_multiples) / len(revenue_multiples) if revenue_multiples else 8.5
-            avg_gross_margin = sum(gross_margins) / len(gross_margins) if gross_margins else 75
-
-            return {
-                "spy_monthly_return": spy_return,
-                "risk_free_rate": risk_free_rate,
-                "avg_revenue_multiple": avg_revenue_multiple,
-                "avg_gross_margin": avg_gross_margin,
-                "market_conditions": "favorable" if spy_return > 0 else "challenging"
-            }
-        except:
+            return get_market_data_service().market_benchmarks()
+        except Exception:
             # Fallback to reasonable defaults
             return {
                 "spy_monthly_return": 2.1,
@@ -440,18 +310,8 @@ class FinancialModelingTool(BaseTool):
     def _get_economic_indicators(self) -> Dict[str, Any]:
         """Get current economic indicators affecting business projections"""
         try:
-            # Get current date and calculate economic context
-            current_date = datetime.now()
-
-            indicators = {
-                "inflation_environment": "moderate" if current_date.year >= 2024 else "elevated",
-                "interest_rate_environment": "elevated",
-                "venture_funding_environment": "selective",
-                "tech_hiring_market": "competitive"
-            }
-
-            return indicators
-        except:
+            return get_market_data_service().economic_indicators()
+        except Exception:
             return {
                 "inflation_environment": "moderate",
                 "interest_rate_environment": "elevated",
@@ -461,9 +321,11 @@ class FinancialModelingTool(BaseTool):
 
     def _run(self, business_model: str, market_size: str = "enterprise software market") -> str:
         """Execute financial modeling analysis with real market benchmarks"""
-        # Fetch real market data
-        benchmarks = self._get_market_benchmarks(business_model)
-        economic_indicators = self._get_economic_indicators()
+        # Fetch real market data (independent sources gathered concurrently)
+        benchmarks, economic_indicators = get_market_data_service().gather(
+            lambda: self._get_market_benchmarks(business_model),
+            self._get_economic_indicators
+        )
         current_date = datetime.now().strftime("%Y-%m-%d")
 
         # Adjust projections based on market conditions
@@ -544,33 +406,10 @@ class RiskAssessmentTool(BaseTool):
     description: str = "Performs comprehensive risk assessment and mitigation strategy development"
 
     def _get_market_volatility_indicators(self) -> Dict[str, Any]:
-        """Fetch real market volatility and risk indicators"""
+        """Fetch real market volatility and risk indicators (cached)"""
         try:
-            # Get VIX (volatility index) for market sentiment
-            vix = yf.Ticker("^VIX")
-            vix_hist = vix.history(period="5d")
-            current_vix = vix_hist['Close'][-1] if len(vix_hist) > 0 else 20
-
-            # Get tech sector performance (QQQ)
-            qqq = yf.Ticker("QQQ")
-            qqq_hist = qqq.history(period="1mo")
-            tech_performance = ((qqq_hist['Close'][-1] / qqq_hist['Close'][0]) - 1) * 100
-
-            # Determine market risk level
-            if current_vix > 30:
-                market_risk = "high"
-            elif current_vix > 20:
-                market_risk = "medium"
-            else:
-                market_risk = "low"
-
-            return {
-                "vix": current_vix,
-                "tech_performance": tech_performance,
-                "market_risk_level": market_risk,
-                "market_sentiment": "bearish" if tech_performance < -5 else "neutral" if tech_performance < 5 else "bullish"
-            }
-        except:
+            return get_market_data_service().volatility_indicators()
+        except Exception:
             return {
                 "vix": 20,
                 "tech_performance": 2.1,
@@ -579,39 +418,17 @@ class RiskAssessmentTool(BaseTool):
             }
 
     def _get_regulatory_environment(self) -> List[str]:
-        """Assess current regulatory environment and upcoming changes"""
+        """Assess current regulatory environment and upcoming changes (cached)"""
         try:
-            # Fetch recent regulatory news
-            search_terms = "technology+regulation+data+privacy+AI"
-            try:
-                feed = feedparser.parse(f"https://news.google.com/rss/search?q={search_terms}")
-                regulatory_items = []
-                for entry in feed.entries[:3]:
-                    if any(keyword in entry.title.lower() for keyword in ['regulation', 'privacy', 'compliance', 'law']):
-                        regulatory_items.append(f"• {entry.title}")
-
-                return regulatory_items if regulatory_items else ["• Regulatory environment monitoring active"]
-            except:
-                return ["• Regulatory environment monitoring active"]
-        except:
+            return get_market_data_service().regulatory_environment()
+        except Exception:
             return ["• Regulatory environment monitoring active"]
 
     def _get_economic_risks(self) -> Dict[str, str]:
         """Assess current economic risk factors"""
         try:
-            current_date = datetime.now()
-
-            # Assess economic environment based on current conditions
-            economic_risks = {
-                "inflation_risk": "moderate" if current_date.year >= 2024 else "elevated",
-                "interest_rate_risk": "elevated",
-                "recession_risk": "moderate",
-                "funding_environment": "challenging",
-                "talent_market": "competitive"
-            }
-
-            return economic_risks
-        except:
+            return get_market_data_service().economic_risks()
+        except Exception:
             return {
                 "inflation_risk": "moderate",
                 "interest_rate_risk": "elevated",
@@ -622,10 +439,12 @@ class RiskAssessmentTool(BaseTool):
 
     def _run(self, business_plan: str) -> str:
         """Execute risk assessment analysis with real market and regulatory data"""
-        # Fetch real risk indicators
-        market_indicators = self._get_market_volatility_indicators()
-        regulatory_updates = self._get_regulatory_environment()
-        economic_risks = self._get_economic_risks()
+        # Fetch real risk indicators (independent sources gathered concurrently)
+        market_indicators, regulatory_updates, economic_risks = get_market_data_service().gather(
+            self._get_market_volatility_indicators,
+            self._get_regulatory_environment,
+            self._get_economic_risks
+        )
         current_date = datetime.now().strftime("%Y-%m-%d")
 
         # Adjust risk probabilities based on market conditions
@@ -947,8 +766,8 @@ class CrewAIOrchestrator:
         crew = self.create_market_research_crew(task_input)
 
         try:
-            # Execute crew (synchronous CrewAI call)
-            result = crew.kickoff()
+            # Execute crew (synchronous CrewAI call) off the event loop so other workflows can overlap it
+            result = await asyncio.to_thread(crew.kickoff)
 
             end_time = time.time()
             execution_time = end_time - start_time
@@ -1058,9 +877,19 @@ class LangGraphOrchestrator:
             return ChatOpenAI(model=model, api_key=os.getenv("OPENAI_API_KEY"), temperature=0.3)
 
     def create_analysis_workflow(self) -> StateGraph:
-        """Create LangGraph workflow for multi-step business analysis"""
+        """
+        Create LangGraph workflow for multi-step business analysis
+
+        Topology (fan-out/fan-in):
+            START -> research_coordinator ─┐
+            START -> data_collector ───────┴-> market / financial / risk analysts -> strategy_synthesizer -> END
 
-        async def research_coordinator_node(state: MultiAgentState) -> MultiAgentState:
+        Nodes return partial updates only; the state reducers merge the
+        branch results, so the analysts run concurrently and each one sees
+        just the research plan plus its own tool output.
+        """
+
+        async def research_coordinator_node(state: MultiAgentState) -> Dict[str, Any]:
             """Coordinate research and break down tasks"""
             messages = [
                 SystemMessage(content="You are a Research Coordinator. Break down the business analysis task into specific research areas and create a research plan."),
@@ -1071,144 +900,141 @@ class LangGraphOrchestrator:
 
             response = await self.llm.ainvoke(messages)
 
-            state["messages"].append(response)
-            state["current_agent"] = "research_coordinator"
-            state["analysis_context"] += f"\n\nResearch Plan: {response.content}"
-
-            return state
-
-        async def market_analyst_node(state: MultiAgentState) -> MultiAgentState:
-            """Perform market analysis"""
-            messages = [
-                SystemMessage(content="You are a Senior Market Analyst. Analyze market opportunities, sizing, trends, and competitive dynamics."),
-                HumanMessage(content=f"""Based on the research plan: {state['analysis_context']}
+            return {
+                "messages": [response],
+                "current_agent": "research_coordinator",
+                "research_plan": response.content
+            }
 
-                Conduct comprehensive market analysis for: {state['task_input']}""")
-            ]
+        async def data_collector_node(state: MultiAgentState) -> Dict[str, Any]:
+            """Run the analysis tools while the research plan is being written (they only need the task input)"""
+            financial_analysis, risk_analysis = await asyncio.gather(
+                financial_modeling_tool.ainvoke({
+                    "business_model": state['task_input'],
+                    "market_size": "enterprise software market"
+                }),
+                risk_assessment_tool.ainvoke({
+                    "business_plan": state['task_input']
+                })
+            )
 
-            response = await self.llm.ainvoke(messages)
+            return {"tool_outputs": {"financial": financial_analysis, "risk": risk_analysis}}
 
-            state["messages"].append(response)
-            state["current_agent"] = "market_analyst"
-            state["analysis_context"] += f"\n\nMarket Analysis: {response.content}"
-            state["results"].append({
-                "agent": "Market Analyst",
-                "analysis": response.content,
-                "timestamp": datetime.now().isoformat()
-            })
-
-            return state
-
-        async def financial_analyst_node(state: MultiAgentState) -> MultiAgentState:
-            """Perform financial analysis using tools"""
-            # Use financial modeling tool
-            financial_analysis = await financial_modeling_tool.ainvoke({
-                "business_model": state['task_input'],
-                "market_size": "enterprise software market"
-            })
+        def analyst_node(agent_name: str, system_prompt: str, instructions: str, tool_key: Optional[str] = None):
+            """Build an analyst branch whose context is limited to the research plan and its own tool output"""
 
-            messages = [
-                SystemMessage(content="You are a Senior Financial Analyst. Create detailed financial models and projections based on market analysis and tool outputs."),
-                HumanMessage(content=f"""Market Context: {state['analysis_context']}
+            async def node(state: MultiAgentState) -> Dict[str, Any]:
+                branch_start = time.time()
+                tool_output = state["tool_outputs"].get(tool_key) if tool_key else None
+                tool_section = f"\n\n                Tool Analysis: {tool_output}" if tool_output else ""
 
-                Tool Analysis: {financial_analysis}
+                messages = [
+                    SystemMessage(content=system_prompt),
+                    HumanMessage(content=f"""Research Plan: {state['research_plan']}
 
-                Provide comprehensive financial analysis and projections.""")
-            ]
+                Task: {state['task_input']}{tool_section}
 
-            response = await self.llm.ainvoke(messages)
+                {instructions}""")
+                ]
 
-            state["messages"].append(response)
-            state["current_agent"] = "financial_analyst"
-            state["analysis_context"] += f"\n\nFinancial Analysis: {response.content}"
-            state["results"].append({
-                "agent": "Financial Analyst",
-                "analysis": response.content,
-                "tool_output": financial_analysis,
-                "timestamp": datetime.now().isoformat()
-            })
-
-            return state
-
-        async def risk_analyst_node(state: MultiAgentState) -> MultiAgentState:
-            """Perform risk analysis using tools"""
-            # Use risk assessment tool
-            risk_analysis = await risk_assessment_tool.ainvoke({
-                "business_plan": state['task_input']
-            })
+                response = await self.llm.ainvoke(messages)
 
-            messages = [
-                SystemMessage(content="You are a Risk Assessment Specialist. Identify and evaluate business risks with mitigation strategies."),
-                HumanMessage(content=f"""Context: {state['analysis_context']}
-
-                Tool Analysis: {risk_analysis}
-
-                Provide comprehensive risk assessment and mitigation strategies.""")
-            ]
-
-            response = await self.llm.ainvoke(messages)
+                result = {
+                    "agent": agent_name,
+                    "analysis": response.content,
+                    "timestamp": datetime.now().isoformat(),
+                    "execution_time": time.time() - branch_start
+                }
+                if tool_output:
+                    result["tool_output"] = tool_output
 
-            state["messages"].append(response)
-            state["current_agent"] = "risk_analyst"
-            state["analysis_context"] += f"\n\nRisk Analysis: {response.content}"
-            state["results"].append({
-                "agent": "Risk Analyst",
-                "analysis": response.content,
-                "tool_output": risk_analysis,
-                "timestamp": datetime.now().isoformat()
-            })
+                return {"messages": [response], "results": [result]}
 
-            return state
+            return node
 
-        async def strategy_synthesizer_node(state: MultiAgentState) -> MultiAgentState:
+        async def strategy_synthesizer_node(state: MultiAgentState, config: RunnableConfig) -> Dict[str, Any]:
             """Synthesize all analyses into final strategic recommendation"""
+            # Branch results arrive in completion order; present them in a fixed order
+            analyses = sorted(state["results"], key=lambda r: ANALYST_ORDER.index(r["agent"]))
+            sections = "\n\n".join(f"{r['agent']}:\n{r['analysis']}" for r in analyses)
+
+            # Hybrid runs hand in findings from a concurrently running framework
+            upstream = config.get("configurable", {}).get("upstream_findings")
+            upstream_findings = await upstream if upstream is not None else ""
+            upstream_section = (
+                f"\n\n                Additional findings from a parallel CrewAI analysis: {upstream_findings[:HYBRID_CONTEXT_CHARS]}..."
+                if upstream_findings else ""
+            )
+
             messages = [
                 SystemMessage(content="You are a Strategic Planning Director. Synthesize all analyses into a comprehensive strategic plan with clear recommendations."),
                 HumanMessage(content=f"""Synthesize the following analyses into a cohesive strategic plan:
 
-                {state['analysis_context']}
+                Research Plan: {state['research_plan']}
 
-                Individual Results: {json.dumps(state['results'], indent=2)}
+                {sections}{upstream_section}
 
                 Provide executive-level strategic recommendations.""")
             ]
 
             response = await self.llm.ainvoke(messages)
 
-            state["messages"].append(response)
-            state["current_agent"] = "strategy_synthesizer"
-            state["final_output"] = response.content
-            state["results"].append({
-                "agent": "Strategy Synthesizer",
-                "analysis": response.content,
-                "timestamp": datetime.now().isoformat()
-            })
-
-            return state
+            return {
+                "messages": [response],
+                "current_agent": "strategy_synthesizer",
+                "final_output": response.content,
+                "results": [{
+                    "agent": "Strategy Synthesizer",
+                    "analysis": response.content,
+                    "timestamp": datetime.now().isoformat()
+                }]
+            }
 
         # Build workflow graph
         workflow = StateGraph(MultiAgentState)
 
         # Add nodes
         workflow.add_node("research_coordinator", research_coordinator_node)
-        workflow.add_node("market_analyst", market_analyst_node)
-        workflow.add_node("financial_analyst", financial_analyst_node)
-        workflow.add_node("risk_analyst", risk_analyst_node)
+        workflow.add_node("data_collector", data_collector_node)
+        workflow.add_node("market_analyst", analyst_node(
+            "Market Analyst",
+            "You are a Senior Market Analyst. Analyze market opportunities, sizing, trends, and competitive dynamics.",
+            "Conduct comprehensive market analysis."
+        ))
+        workflow.add_node("financial_analyst", analyst_node(
+            "Financial Analyst",
+            "You are a Senior Financial Analyst. Create detailed financial models and projections based on the research plan and tool outputs.",
+            "Provide comprehensive financial analysis and projections.",
+            tool_key="financial"
+        ))
+        workflow.add_node("risk_analyst", analyst_node(
+            "Risk Analyst",
+            "You are a Risk Assessment Specialist. Identify and evaluate business risks with mitigation strategies.",
+            "Provide comprehensive risk assessment and mitigation strategies.",
+            tool_key="risk"
+        ))
         workflow.add_node("strategy_synthesizer", strategy_synthesizer_node)
 
-        # Add edges
+        # Add edges: planning and tool calls run side by side, then the analysts fan out and join
         workflow.add_edge(START, "research_coordinator")
-        workflow.add_edge("research_coordinator", "market_analyst")
-        workflow.add_edge("market_analyst", "financial_analyst")
-        workflow.add_edge("financial_analyst", "risk_analyst")
-        workflow.add_edge("risk_analyst", "strategy_synthesizer")
+        workflow.add_edge(START, "data_collector")
+        for analyst in ANALYST_NODES:
+            workflow.add_edge(["research_coordinator", "data_collector"], analyst)
+        workflow.add_edge(list(ANALYST_NODES), "strategy_synthesizer")
         workflow.add_edge("strategy_synthesizer", END)
 
         # Compile workflow (without checkpointer to avoid telemetry/tracing requirements)
         return workflow.compile()
 
-    async def execute_workflow(self, task_input: str) -> Dict[str, Any]:
-        """Execute LangGraph workflow and return results with metrics"""
+    async def execute_workflow(self, task_input: str,
+                               upstream_findings: Optional[Awaitable[str]] = None) -> Dict[str, Any]:
+        """
+        Execute LangGraph workflow and return results with metrics
+
+        upstream_findings: optional awaitable resolving to findings from another
+        framework; only the synthesizer waits for it, so the rest of the graph
+        runs while it is still being produced.
+        """
         start_time = time.time()
 
         # Initialize state
@@ -1217,7 +1043,8 @@ class LangGraphOrchestrator:
             "task_input": task_input,
             "results": [],
             "current_agent": "",
-            "analysis_context": "",
+            "research_plan": "",
+            "tool_outputs": {},
             "final_output": "",
             "execution_metrics": {}
         }
@@ -1227,7 +1054,10 @@ class LangGraphOrchestrator:
             workflow = self.create_analysis_workflow()
 
             # Execute workflow
-            final_state = await workflow.ainvoke(initial_state)
+            final_state = await workflow.ainvoke(
+                initial_state,
+                config={"configurable": {"upstream_findings": upstream_findings}}
+            )
 
             end_time = time.time()
             execution_time = end_time - start_time
@@ -1251,6 +1081,10 @@ class LangGraphOrchestrator:
                 "execution_metrics": self.execution_metrics,
                 "workflow_details": {
                     "agents_executed": [r["agent"] for r in final_state["results"]],
+                    "parallel_branches": {
+                        r["agent"]: round(r["execution_time"], 2)
+                        for r in final_state["results"] if "execution_time" in r
+                    },
                     "total_messages": len(final_state["messages"]),
                     "intermediate_results": final_state["results"],
                     "workflow_state": "completed"
@@ -1290,7 +1124,7 @@ class HybridOrchestrator:
     Cross-framework hybrid orchestration combining CrewAI and LangGraph
 
     Features:
-    - Sequential execution across frameworks
+    - Concurrent execution across frameworks
     - Context passing between systems
     - Combined capability utilization
     - Performance optimization
@@ -1307,19 +1141,19 @@ class HybridOrchestrator:
         start_time = time.time()
 
         try:
-            # Phase 1: CrewAI for comprehensive analysis
-            st.info("🔄 Phase 1: Executing CrewAI hierarchical analysis...")
-            crewai_result = await self.crewai_orchestrator.execute_crew(task_input)
-
-            # Phase 2: LangGraph for workflow optimization
-            st.info("🔄 Phase 2: Executing LangGraph workflow optimization...")
-            enhanced_task = f"""Based on CrewAI analysis: {crewai_result['result'][:500]}...
+            # Only the LangGraph synthesizer needs the CrewAI findings, so planning, tool
+            # calls and the analyst branches run while the crew is still working
+            st.info("🔄 Executing CrewAI hierarchical analysis and LangGraph workflow concurrently...")
+            crewai_task = asyncio.create_task(self.crewai_orchestrator.execute_crew(task_input))
 
-            Original task: {task_input}
+            async def crewai_findings() -> str:
+                crewai_result = await crewai_task
+                return crewai_result['result'] if crewai_result['success'] else ""
 
-            Optimize and enhance the strategic analysis."""
-
-            langgraph_result = await self.langgraph_orchestrator.execute_workflow(enhanced_task)
+            langgraph_result = await self.langgraph_orchestrator.execute_workflow(
+                task_input, upstream_findings=asyncio.ensure_future(crewai_findings())
+            )
+            crewai_result = await crewai_task
 
             end_time = time.time()
             execution_time = end_time - start_time
@@ -1367,7 +1201,7 @@ LangGraph's structured workflow optimization, providing both depth and systemati
                 "framework_details": {
                     "crewai_details": crewai_result.get('crew_details', {}),
                     "langgraph_details": langgraph_result.get('workflow_details', {}),
-                    "integration_approach": "Sequential execution with context passing"
+                    "integration_approach": "Concurrent execution; CrewAI findings feed the LangGraph synthesis"
                 },
                 "success": crewai_result['success'] and langgraph_result['success']
             }
@@ -1441,7 +1275,7 @@ async def render_orchestration_interface():
         - No telemetry or checkpointing for privacy
 
         ✅ **Hybrid Cross-Framework Integration**
-        - Sequential execution across frameworks
+        - Concurrent execution across frameworks
         - Context passing between systems
         - Combined capability utilization
         - Performance optimization
@@ -1759,6 +1593,8 @@ async def render_orchestration_interface():
                                     st.markdown("**Workflow Stats:**")
                                     st.write(f"• Total Messages: {details.get('total_messages', 0)}")
                                     st.write(f"• State: {details.get('workflow_state', 'Unknown')}")
+                                    for agent, seconds in details.get('parallel_branches', {}).items():
+                                        st.write(f"• {agent} branch: {seconds}s (parallel)")
 
                                 # Show intermediate results
                                 if 'intermediate_results' in details: